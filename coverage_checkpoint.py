@@ -0,0 +1,83 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import json
+import os
+from result_store import SIMULATION_VERSION
+
+def write_checkpoint(path,checkpoint):
+    '''
+    Writes a checkpoint of a run to a json file, without ever leaving a half
+    written file behind.
+
+    The checkpoint is written to path + '.tmp' first and flushed to the disk,
+    then renamed over path. Renaming is atomic, so if the process dies at any
+    point, path holds either the old checkpoint or the new one, never a mix.
+    On Windows, os.rename() cannot replace a file, so the old checkpoint is
+    removed first, and a crash right after that leaves only the new one in
+    path + '.tmp'. read_checkpoint() reads it from there when path is missing.
+
+    Parameter: path
+    Type: str
+
+    Parameter: checkpoint
+    Type: dict that can be written with the json module. The key 'version'
+            is set to SIMULATION_VERSION.
+    '''
+    checkpoint = dict(checkpoint,version = SIMULATION_VERSION)
+    temporary = path + '.tmp'
+    with open(temporary,'w') as f:
+        json.dump(checkpoint,f)
+        f.flush()
+        os.fsync(f.fileno())
+    if (os.name == 'nt') and os.path.exists(path):
+        #os.rename() does not replace an existing file on Windows.
+        os.remove(path)
+    os.rename(temporary,path)
+
+def checkpoint_file(path):
+    '''
+    Returns the file a checkpoint written to path can be read from: path
+    itself, or path + '.tmp' if path is missing and the .tmp file holds a
+    whole checkpoint (see write_checkpoint()). Returns None if there is no
+    checkpoint, including when the process died while writing the first one.
+    '''
+    if os.path.exists(path):
+        return path
+    temporary = path + '.tmp'
+    if os.path.exists(temporary):
+        try:
+            with open(temporary) as f:
+                json.load(f)
+        except ValueError:
+            return None
+        return temporary
+    return None
+
+def read_checkpoint(path):
+    '''
+    Reads back a checkpoint written by write_checkpoint(), from the file given
+    by checkpoint_file().
+
+    Parameter: path
+    Type: str
+
+    Return: dict, with the strings read back as str rather than unicode.
+
+    Assertions:
+        - There must be a checkpoint for path.
+        - The checkpoint must be from the current SIMULATION_VERSION, since
+            the iterations of other versions give different counts.
+    '''
+    found = checkpoint_file(path)
+    assert found is not None, 'Warning! There is no checkpoint at %s!' % path
+    with open(found) as f:
+        checkpoint = json.load(f,object_hook = _str_keys)
+    assert checkpoint.get('version') == SIMULATION_VERSION, 'Warning! The checkpoint is from a different version of the simulation!'
+    return checkpoint
+
+def _str_keys(dictionary):
+    '''
+    Turns the unicode keys and values json reads back into str, so they can
+    be passed on as keyword arguments and options again.
+    '''
+    return dict((str(key),str(value) if isinstance(value,unicode) else value) for key,value in dictionary.items())
@@ -0,0 +1,221 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import os
+from tower_coverage import iter_coverage
+from plotting_code_proj import color
+
+#Animation writers tried for each kind of movie file, in order.
+MOVIE_WRITERS = {'.gif': ('pillow','imagemagick'), '.mp4': ('ffmpeg','avconv')}
+
+class CoverageRecorder(object):
+    '''
+    Draws the events of a simulation (see tower_coverage.iter_coverage) to
+    image files without a display, as a numbered PNG sequence or as an
+    animated GIF or MP4.
+
+    Attributes:
+        - self.width, self.height = Bounds of the coverage area.
+        - self.path = File the frames are written to. For a PNG sequence it
+            holds a number format, e.g. 'frames/step_%05d.png'.
+        - self.kinds = Kinds of events a frame can be taken on.
+        - self.every = A frame is taken on every self.every-th of those events.
+        - self.max_frames = Largest number of frames taken during the run, or None.
+        - self.events = Number of events seen so far.
+        - self.frames = Number of frames written so far.
+        - self.paths = The PNG files written, in order. Empty for movies.
+
+    Methods:
+        - record(): Updates the picture with an event, taking a frame if it is due.
+        - finish(): Takes the last frame and closes the file.
+
+    The figure is a matplotlib Figure on the Agg canvas made directly, so no
+    window is opened and pyplot's backend does not matter. Every event
+    updates the picture, which is cheap, but a frame is only drawn on every
+    self.every-th event of self.kinds and at most self.max_frames times, so the
+    cost of drawing stays bounded however long the run is. finish() always
+    adds a frame of the final picture if the last event did not get one.
+
+    e.g.
+    >>> recorder = CoverageRecorder(40,40,'frames/step_%05d.png',every = 10)
+    >>> for event in iter_coverage(40,40,kinds = ('accepted','full'),sampler = 'free'):
+    ...     recorder.record(event)
+    >>> recorder.finish()
+    19
+    '''
+
+    def __init__(self,width,height,path,kinds = ('accepted',),every = 1,max_frames = None,fps = 10,dpi = 80):
+        '''
+        Sets up the figure and the file the frames go to.
+
+        Parameter: width
+        Type: int
+
+        Parameter: height
+        Type: int
+
+        Parameter: path
+        Type: str ending in '.png' with a number format such as '%05d' in
+                it, or ending in one of the extensions of MOVIE_WRITERS.
+
+        Parameter: kinds
+        Type: iterable of str, kinds of events (see tower_coverage.EVENT_KINDS).
+
+        Parameter: every
+        Type: int
+
+        Parameter: max_frames
+        Type: int or None
+
+        Parameter: fps
+        Type: int, frames per second of a movie.
+
+        Parameter: dpi
+        Type: int, dots per inch of the frames.
+
+        Assertions:
+            - width and height must be integers greater than zero.
+            - every must be a positive integer.
+            - max_frames must be a positive integer or None.
+            - path must be a PNG file name with a number format, a .gif or
+                an .mp4 file name.
+            - A movie needs one of its MOVIE_WRITERS to be installed.
+        '''
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        assert isinstance(width,int) and width > 0, 'Warning! Width must be an integer greater than zero!'
+        assert isinstance(height,int) and height > 0, 'Warning! Height must be an integer greater than zero!'
+        assert isinstance(every,int) and every > 0, 'Warning! every must be a positive integer!'
+        assert (max_frames is None) or (isinstance(max_frames,int) and max_frames > 0), 'Warning! max_frames must be a positive integer or None!'
+        extension = os.path.splitext(path)[1].lower()
+        assert (extension == '.png') or (extension in MOVIE_WRITERS), 'Warning! path must end in .png, .gif or .mp4!'
+
+        self.width = width
+        self.height = height
+        self.path = path
+        self.kinds = frozenset(kinds)
+        self.every = every
+        self.max_frames = max_frames
+        self.events = 0
+        self.frames = 0
+        self.paths = []
+
+        self.fig = Figure()
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_xlim(0,width)
+        self.ax.set_ylim(0,height)
+        self.ax.grid()
+        self._dpi = dpi
+        self._trying = None
+        self._drawn = True
+        self._candidates = 0
+
+        self._writer = None
+        if extension == '.png':
+            assert '%' in path, 'Warning! A PNG sequence needs a number format in path, e.g. step_%05d.png!'
+        else:
+            from matplotlib import animation
+            available = [name for name in MOVIE_WRITERS[extension] if animation.writers.is_available(name)]
+            assert len(available) > 0, 'Warning! Writing %s files needs one of %s installed!' % (extension,MOVIE_WRITERS[extension])
+            self._writer = animation.writers[available[0]](fps = fps)
+            self._writer.setup(self.fig,path,dpi)
+
+    def record(self,event):
+        '''
+        Updates the picture with a CoverageEvent, and writes a frame if one is
+        due. An accepted tower is drawn in a random color. The candidate of a
+        'drawn', 'rejected' or 'truncated' event is drawn as a hatched box
+        until the next event.
+
+        Parameter: event
+        Type: CoverageEvent
+        '''
+        import matplotlib.patches as patches
+
+        self.events += 1
+        if self._trying is not None:
+            self._trying.remove()
+            self._trying = None
+        if event.kind == 'accepted':
+            color_rect = '#%02X%02X%02X' % (color(),color(),color())
+            t = event.tower
+            self.ax.add_patch(patches.Rectangle(t.coord_ll,t.width,t.height,facecolor = color_rect))
+        elif event.kind in ('drawn','rejected','truncated'):
+            t = event.candidate
+            self._trying = patches.Rectangle(t.coord_ll,t.width,t.height,hatch = '/',fill = False)
+            self.ax.add_patch(self._trying)
+        self.ax.set_title('Towers: %d   Covered: %.1f%%' % (event.tower_count,100 * event.fraction))
+        self._drawn = False
+
+        if event.kind in self.kinds:
+            self._candidates += 1
+            if ((self._candidates - 1) % self.every == 0) and ((self.max_frames is None) or (self.frames < self.max_frames)):
+                self._write_frame()
+
+    def _write_frame(self):
+        '''
+        Draws the picture as it is into the next frame.
+        '''
+        if self._writer is None:
+            path = self.path % self.frames
+            self.fig.savefig(path,dpi = self._dpi)
+            self.paths.append(path)
+        else:
+            self._writer.grab_frame()
+        self.frames += 1
+        self._drawn = True
+
+    def finish(self):
+        '''
+        Writes a frame of the final picture unless the last event already got
+        one, and closes the movie file.
+
+        Return: int, the number of frames written.
+        '''
+        if self._trying is not None:
+            self._trying.remove()
+            self._trying = None
+            self._drawn = False
+        if not self._drawn:
+            self._write_frame()
+        if self._writer is not None:
+            self._writer.finish()
+            self._writer = None
+        return self.frames
+
+def record_coverage(width,height,path,n = None,kinds = ('accepted',),every = 1,max_frames = None,fps = 10,dpi = 80,**options):
+    '''
+    Runs a simulation and records it with a CoverageRecorder, without a display.
+
+    Parameter: width
+    Type: int
+
+    Parameter: height
+    Type: int
+
+    Parameter: path
+    Type: str, see CoverageRecorder.
+
+    Parameter: n
+    Type: int or None, the number of towers to place. If None, towers are placed
+            until the coverage area is full.
+
+    path, kinds, every, max_frames, fps and dpi are the same as for
+    CoverageRecorder. Any other keyword arguments (index, occupancy,
+    batch_size, rng, sampler, metrics, cache) are passed on to
+    tower_coverage.iter_coverage().
+
+    Return: the finished CoverageRecorder. Its frames and paths attributes
+            tell what was written.
+    e.g.
+    >>> recorder = record_coverage(100,100,'run.gif',every = 5,max_frames = 200)
+    >>> recorder.frames
+    201
+    '''
+    recorder = CoverageRecorder(width,height,path,kinds,every,max_frames,fps,dpi)
+    wanted = frozenset(kinds) | frozenset(('accepted','full'))
+    for event in iter_coverage(width,height,n,kinds = wanted,**options):
+        recorder.record(event)
+    recorder.finish()
+    return recorder
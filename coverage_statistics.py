@@ -0,0 +1,302 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import math
+
+def z_score(confidence):
+    '''
+    Returns z such that a normally distributed value lands within z standard
+    deviations of its mean with probability confidence.
+
+    Parameter: confidence
+    Type: float, between 0 and 1.
+
+    Return: float
+    e.g.
+    >>> round(z_score(0.95),3)
+    1.96
+
+    Assertions:
+        - confidence must be between 0 and 1.
+    '''
+    assert 0 < confidence < 1, 'Warning! confidence must be between 0 and 1!'
+    low = 0.0
+    high = 10.0
+    #Bisection on the normal cumulative distribution, which math.erf gives.
+    for i in range(60):
+        middle = (low + high) / 2
+        if math.erf(middle / math.sqrt(2)) < confidence:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+class CoverageStatistics(object):
+    '''
+    Keeps running statistics of tower counts, one count per iteration, without
+    keeping the counts themselves.
+
+    Attributes:
+        - self.count = Number of tower counts added.
+        - self.total = Sum of the tower counts.
+        - self.minimum, self.maximum = Smallest and largest tower count.
+        - self.max_bins = Largest number of histogram bins kept.
+        - self.bin_width = Width of the histogram bins, starting at 1.
+        - self.bins = Dictionary of how many counts fell in each bin, keyed by
+            the bin number (count // bin_width).
+
+    Methods:
+        - add(): Adds a tower count.
+        - mean, variance, std, standard_error: Properties of the counts so far.
+        - half_width(): Half the width of the confidence interval of the mean.
+        - converged(): Checks whether the mean is known precisely enough.
+        - percentile(): Returns a percentile of the counts.
+        - histogram(): Returns the histogram as (low,high,frequency) rows.
+        - summary(): Returns all of the above as a dictionary.
+        - state(), load(): Save and restore the statistics, e.g. in a checkpoint.
+
+    The variance is kept with Welford's method: a running mean and a running
+    sum of squared differences from it, updated with each count, which does
+    not lose precision the way summing the squares does. The mean is the
+    exact total over the count, so it is the same as averaging a list.
+
+    The histogram holds at most max_bins bins. When a new count needs one more,
+    neighbouring bins are merged in pairs and the bin width doubles, so memory
+    stays the same however many counts are added. Percentiles are exact while
+    the bin width is 1, which it stays as long as the counts span fewer than
+    max_bins values, and otherwise are taken from the middle of the bins.
+
+    e.g.
+    >>> stats = CoverageStatistics()
+    >>> for count in [28,30,31,29,27]:
+    ...     stats.add(count)
+    >>> stats.mean, stats.variance, stats.percentile(50)
+    (29.0, 2.5, 29.0)
+    '''
+
+    def __init__(self,max_bins = 1024):
+        '''
+        Parameter: max_bins
+        Type: int
+
+        Assertions:
+            - max_bins must be an integer of at least 2.
+        '''
+        assert isinstance(max_bins,int) and max_bins >= 2, 'Warning! max_bins must be an integer of at least 2!'
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.max_bins = max_bins
+        self.bin_width = 1
+        self.bins = {}
+        self._mean = 0.0
+        self._squares = 0.0
+
+    def add(self,count):
+        '''
+        Adds the tower count of one iteration.
+
+        Parameter: count
+        Type: int
+
+        Assertions:
+            - count must be a non-negative integer.
+        '''
+        assert isinstance(count,(int,long)) and count >= 0, 'Warning! count must be a non-negative integer!'
+        self.count += 1
+        self.total += count
+        delta = count - self._mean
+        self._mean += delta / self.count
+        self._squares += delta * (count - self._mean)
+        if self.count == 1:
+            self.minimum = count
+            self.maximum = count
+        else:
+            self.minimum = min(self.minimum,count)
+            self.maximum = max(self.maximum,count)
+
+        key = count // self.bin_width
+        self.bins[key] = self.bins.get(key,0) + 1
+        while len(self.bins) > self.max_bins:
+            merged = {}
+            for key,frequency in self.bins.items():
+                merged[key // 2] = merged.get(key // 2,0) + frequency
+            self.bins = merged
+            self.bin_width *= 2
+
+    @property
+    def mean(self):
+        if self.count == 0:
+            return None
+        return self.total / float(self.count)
+
+    @property
+    def variance(self):
+        '''
+        Sample variance of the counts, None with fewer than 2 counts.
+        '''
+        if self.count < 2:
+            return None
+        return self._squares / (self.count - 1)
+
+    @property
+    def std(self):
+        if self.count < 2:
+            return None
+        return math.sqrt(self.variance)
+
+    @property
+    def standard_error(self):
+        '''
+        Standard deviation of the mean, None with fewer than 2 counts.
+        '''
+        if self.count < 2:
+            return None
+        return math.sqrt(self.variance / self.count)
+
+    def half_width(self,confidence = 0.95):
+        '''
+        Returns half the width of the confidence interval of the mean, using
+        the normal approximation, or None with fewer than 2 counts. The mean
+        is within this much of the true average with probability confidence.
+        '''
+        if self.count < 2:
+            return None
+        return z_score(confidence) * self.standard_error
+
+    def converged(self,relative_error = None,half_width = None,confidence = 0.95,min_iterations = 30):
+        '''
+        Checks whether the mean is known precisely enough to stop.
+
+        Parameter: relative_error
+        Type: float or None, the largest half width of the confidence interval
+                as a fraction of the mean, e.g. 0.01 for 1%.
+
+        Parameter: half_width
+        Type: float or None, the largest half width of the confidence interval
+                in towers.
+
+        Parameter: confidence
+        Type: float, between 0 and 1.
+
+        Parameter: min_iterations
+        Type: int, the number of counts needed before stopping at all, since
+                the interval is unreliable for a handful of counts.
+
+        Return: True if there are at least min_iterations counts and every
+                target given is met. False if no target is given.
+        '''
+        if (relative_error is None) and (half_width is None):
+            return False
+        if (self.count < max(2,min_iterations)):
+            return False
+        width = self.half_width(confidence)
+        if (relative_error is not None) and (width > relative_error * abs(self.mean)):
+            return False
+        if (half_width is not None) and (width > half_width):
+            return False
+        return True
+
+    def _value(self,key):
+        '''
+        Returns the count a bin stands for: the count itself for bins of width
+        1, otherwise the middle of the bin clipped to the counts seen.
+        '''
+        if self.bin_width == 1:
+            return float(key)
+        middle = key * self.bin_width + (self.bin_width - 1) / 2.0
+        return min(max(middle,self.minimum),self.maximum)
+
+    def percentile(self,q):
+        '''
+        Returns the q-th percentile of the counts, interpolating between the
+        two counts around it the same way as np.percentile().
+
+        Parameter: q
+        Type: int or float, between 0 and 100.
+
+        Return: float, or None if no counts were added.
+
+        Assertions:
+            - q must be between 0 and 100.
+        '''
+        assert 0 <= q <= 100, 'Warning! q must be between 0 and 100!'
+        if self.count == 0:
+            return None
+        if q == 0:
+            return float(self.minimum)
+        if q == 100:
+            return float(self.maximum)
+        rank = q / 100.0 * (self.count - 1)
+        below = int(math.floor(rank))
+        above = int(math.ceil(rank))
+        low = None
+        high = None
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if (low is None) and (seen > below):
+                low = self._value(key)
+            if seen > above:
+                high = self._value(key)
+                break
+        return low + (high - low) * (rank - below)
+
+    def histogram(self):
+        '''
+        Returns the histogram as a list of (low,high,frequency) rows in order,
+        where a row counts the tower counts c with low <= c < high.
+        '''
+        width = self.bin_width
+        return [(key * width,(key + 1) * width,self.bins[key]) for key in sorted(self.bins)]
+
+    def state(self):
+        '''
+        Returns everything needed to carry on adding counts later as a
+        dictionary that can be written with the json module. Floats are
+        written by json with repr(), which reads back exactly, so statistics
+        restored with load() carry on exactly as if never saved.
+        '''
+        return {'count': self.count,
+                'total': self.total,
+                'minimum': self.minimum,
+                'maximum': self.maximum,
+                'max_bins': self.max_bins,
+                'bin_width': self.bin_width,
+                'bins': dict((str(key),frequency) for key,frequency in self.bins.items()),
+                'mean': self._mean,
+                'squares': self._squares}
+
+    def load(self,state):
+        '''
+        Restores statistics saved with state(), replacing any counts added so far.
+
+        Parameter: state
+        Type: dict, as returned by state(), possibly read back from json.
+        '''
+        self.count = state['count']
+        self.total = state['total']
+        self.minimum = state['minimum']
+        self.maximum = state['maximum']
+        self.max_bins = state['max_bins']
+        self.bin_width = state['bin_width']
+        self.bins = dict((int(key),frequency) for key,frequency in state['bins'].items())
+        self._mean = state['mean']
+        self._squares = state['squares']
+
+    def summary(self,confidence = 0.95,percentiles = (5,25,50,75,95)):
+        '''
+        Returns the statistics as a dictionary with the keys 'iterations',
+        'mean', 'variance', 'std', 'standard_error', 'half_width',
+        'confidence', 'min', 'max' and 'percentiles' (a dictionary keyed by q).
+        '''
+        return {'iterations': self.count,
+                'mean': self.mean,
+                'variance': self.variance,
+                'std': self.std,
+                'standard_error': self.standard_error,
+                'half_width': self.half_width(confidence),
+                'confidence': confidence,
+                'min': self.minimum,
+                'max': self.maximum,
+                'percentiles': dict((q,self.percentile(q)) for q in percentiles)}
@@ -0,0 +1,243 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import csv
+import itertools
+import multiprocessing
+import numpy as np
+from coverage_statistics import CoverageStatistics
+from result_store import ResultStore
+from simulation_metrics import clock
+from tower_coverage import iter_tower_counts
+
+#Columns of a row of a sweep, in the order they are printed and written.
+SWEEP_COLUMNS = ('width','height','iterations','average','std','half_width','minimum','maximum','seconds','transposed')
+
+def shape_grid(widths,heights):
+    '''
+    Returns every (width,height) pair of the widths and heights given.
+
+    e.g.
+    >>> shape_grid([10,20],[10,20])
+    [(10, 10), (10, 20), (20, 10), (20, 20)]
+    '''
+    return [(width,height) for width in widths for height in heights]
+
+def plan_sweep(shapes,iterations):
+    '''
+    Works out which shapes a sweep has to simulate, and in which order.
+
+    Filling a width x height coverage area takes the same number of towers as
+    filling a height x width one on average, since turning the area on its
+    side turns every tower with it. So (width,height) and (height,width) are
+    simulated once, as whichever of the two comes first in shapes, with the
+    larger of their two iteration budgets. The shapes are then sorted with the
+    largest area first, so the longest jobs are started first and the workers
+    do not sit idle at the end of the sweep waiting on one large shape.
+
+    Parameter: shapes
+    Type: list of (width,height) pairs of positive integers.
+
+    Parameter: iterations
+    Type: int, the iteration budget of every shape, or dict of budgets keyed
+            by the (width,height) pairs in shapes.
+
+    Return: list of (width,height,iterations,shapes) tuples, where shapes is
+            the list of requested shapes the simulated one stands for.
+
+    Assertions:
+        - shapes must be (width,height) pairs of positive integers.
+        - iterations must be a positive integer, or have one for every shape.
+    '''
+    budgets = {}
+    members = {}
+    order = []
+    for shape in shapes:
+        assert len(shape) == 2 and all(isinstance(side,int) and side > 0 for side in shape), 'Warning! shapes must be (width,height) pairs of positive integers!'
+        shape = tuple(shape)
+        if isinstance(iterations,dict):
+            assert shape in iterations, 'Warning! There is no iteration budget for %s!' % (shape,)
+            budget = iterations[shape]
+        else:
+            budget = iterations
+        assert isinstance(budget,int) and budget > 0, 'Warning! Number of iterations must be a positive integer!'
+        key = tuple(sorted(shape))
+        if key not in members:
+            members[key] = []
+            budgets[key] = 0
+            order.append(shape)
+        if shape not in members[key]:
+            members[key].append(shape)
+        budgets[key] = max(budgets[key],budget)
+
+    plan = [(width,height,budgets[tuple(sorted((width,height)))],members[tuple(sorted((width,height)))]) for width,height in order]
+    plan.sort(key = lambda job: (job[0] * job[1],job[2]),reverse = True)
+    return plan
+
+def _sweep_shape(job):
+    '''
+    Runs the iterations of one shape of a sweep in a worker process. job is the
+    tuple (width,height,iterations,seed,stored,index,occupancy,batch_size,
+    sampler,relative_error,confidence,min_iterations), where stored is the
+    list of counts already in the store. Returns (width,height,stats,new,seconds),
+    where new is the list of counts simulated here.
+    '''
+    width,height,iterations,seed,stored,index,occupancy,batch_size,sampler,relative_error,confidence,min_iterations = job
+    start = clock()
+    stats = CoverageStatistics()
+    new = []
+    counts = iter_tower_counts(iterations - len(stored),width,height,seed,1,len(stored),index,occupancy,None,batch_size,sampler)
+    try:
+        for count in itertools.chain(stored,counts):
+            stats.add(count)
+            if stats.count > len(stored):
+                new.append(count)
+            if stats.converged(relative_error,None,confidence,min_iterations):
+                break
+    finally:
+        counts.close()
+    return width, height, stats, new, clock() - start
+
+def iter_sweep(shapes,iterations,workers = 1,seed = None,index = 'grid',occupancy = False,batch_size = 1,sampler = 'uniform',relative_error = None,confidence = 0.95,min_iterations = 30,store = None):
+    '''
+    Yields the average number of towers needed to fill each coverage area of
+    a sweep, as a row for each shape as soon as that shape is done.
+
+    Parameter: shapes
+    Type: list of (width,height) pairs, e.g. from shape_grid().
+
+    Parameter: iterations
+    Type: int or dict, the iteration budget (see plan_sweep()).
+
+    Parameter: workers
+    Type: int, the number of processes the shapes are spread over. Every
+            shape runs in a single process, so with more shapes than
+            workers all of them are kept busy.
+
+    Parameter: seed
+    Type: int or None. Every shape runs the iterations of
+            tower_coverage.iteration_rng(seed,i), so the rows are the same
+            for any number of workers and the same as
+            average_towers_for_coverage() with that seed. If None, a seed
+            is drawn from np.random.
+
+    Parameter: relative_error
+    Type: float or None. If given, a shape stops early once the confidence
+            interval of its average is this narrow, as in
+            average_towers_for_coverage(), and its budget is the most
+            iterations run.
+
+    Parameter: store
+    Type: ResultStore or None. If given, the counts already stored for a
+            shape are used instead of simulated again, and the new ones
+            are added. A shape whose transpose has more counts stored is
+            simulated as the transpose. The store is only used in this process.
+
+    index, occupancy, batch_size, sampler, confidence and min_iterations are
+    the same as for average_towers_for_coverage().
+
+    Return: generator of dict with the keys in SWEEP_COLUMNS. A shape that was
+            simulated as its transpose has 'transposed' set to True. Rows
+            come in the order the shapes finish, which with more than 1
+            worker is not the order they were started in.
+
+    Assertions:
+        - workers must be a positive integer.
+        - store can only be given with an integer seed.
+    '''
+    assert isinstance(workers,int) and workers > 0, 'Warning! workers must be a positive integer!'
+    assert (store is None) or isinstance(store,ResultStore), 'Warning! store must be a ResultStore!'
+    assert (store is None) or isinstance(seed,(int,long)), 'Warning! A store can only be used with an integer seed!'
+    plan = plan_sweep(shapes,iterations)
+    if seed is None:
+        seed = int(np.random.randint(2**31 - 1))
+
+    members = {}
+    jobs = []
+    for width,height,budget,shapes_of_job in plan:
+        stored = []
+        if store is not None:
+            stored = store.counts(width,height,seed,sampler,batch_size)[:budget]
+            transposed = store.counts(height,width,seed,sampler,batch_size)[:budget]
+            if len(transposed) > len(stored):
+                #Carries on with the transpose, since more of it is stored.
+                width,height,stored = height,width,transposed
+        members[(width,height)] = shapes_of_job
+        jobs.append((width,height,budget,seed,stored,index,occupancy,batch_size,sampler,relative_error,confidence,min_iterations))
+
+    pool = None
+    if workers == 1:
+        results = itertools.imap(_sweep_shape,jobs)
+    else:
+        pool = multiprocessing.Pool(min(workers,len(jobs)))
+        #One shape at a time, so the largest shapes are handed out first.
+        results = pool.imap_unordered(_sweep_shape,jobs,1)
+    try:
+        for width,height,stats,new,seconds in results:
+            if (store is not None) and new:
+                store.append(width,height,seed,new,stats.count - len(new),sampler,batch_size)
+            for shape in members[(width,height)]:
+                yield {'width': shape[0], 'height': shape[1], 'iterations': stats.count,
+                       'average': stats.mean, 'std': stats.std, 'half_width': stats.half_width(confidence),
+                       'minimum': stats.minimum, 'maximum': stats.maximum, 'seconds': seconds,
+                       'transposed': shape != (width,height)}
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+def sweep_average_towers(shapes,iterations,workers = 1,csv_path = None,**options):
+    '''
+    Runs a sweep (see iter_sweep()) and prints a table of the average number
+    of towers needed to fill each coverage area, one line per shape as soon as
+    it is done.
+
+    Parameter: shapes
+    Type: list of (width,height) pairs, e.g. from shape_grid().
+
+    Parameter: iterations
+    Type: int or dict, the iteration budget (see plan_sweep()).
+
+    Parameter: workers
+    Type: int
+
+    Parameter: csv_path
+    Type: str or None. If given, the rows are also written to this CSV file,
+            with SWEEP_COLUMNS as the header, and flushed as they come in,
+            so a sweep that is stopped keeps the rows it finished.
+
+    Any other keyword arguments (seed, index, occupancy, batch_size, sampler,
+    relative_error, confidence, min_iterations, store) are passed on to
+    iter_sweep().
+
+    Return: list of rows (see iter_sweep()) sorted by width and height.
+    e.g.
+    >>> rows = sweep_average_towers(shape_grid([10,20,30],[10,20,30]),100,workers = 4,seed = 143)
+     width height iterations    average        std  half width    seconds
+        30     30        100    245.370     10.921       2.140     51.827
+    ...
+    '''
+    print '%6s %6s %10s %10s %10s %11s %10s' % ('width','height','iterations','average','std','half width','seconds')
+    rows = []
+    output = None
+    if csv_path is not None:
+        output = open(csv_path,'wb')
+        writer = csv.DictWriter(output,SWEEP_COLUMNS)
+        writer.writeheader()
+    try:
+        for row in iter_sweep(shapes,iterations,workers,**options):
+            std = half = 'n/a'
+            if row['std'] is not None:
+                std = '%.3f' % row['std']
+                half = '%.3f' % row['half_width']
+            print '%6d %6d %10d %10.3f %10s %11s %10.3f' % (row['width'],row['height'],row['iterations'],row['average'],std,half,row['seconds'])
+            rows.append(row)
+            if output is not None:
+                writer.writerow(row)
+                output.flush()
+    finally:
+        if output is not None:
+            output.close()
+    rows.sort(key = lambda row: (row['width'],row['height']))
+    return rows
@@ -0,0 +1,124 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+from bisect import bisect_left
+
+def largest_empty_rectangle(bounds,obstacles,metrics = None):
+    '''
+    Returns the largest rectangle inside bounds whose interior does not overlap
+    the interior of any of the obstacles.
+
+    Parameter: bounds
+    Type: tuple (x0,y0,x1,y1) of ints, the lower left and top right corners
+            of the region to search.
+
+    Parameter: obstacles
+    Type: iterable of (x0,y0,x1,y1) tuples of ints.
+
+    Parameter: metrics
+    Type: SimulationMetrics or None. If given, the number of empty rectangles
+            compared is added to its truncate_candidates.
+
+    Return: (x0,y0,x1,y1) tuple of the largest empty rectangle. If there is no
+            empty space inside bounds, returns None. If no obstacle overlaps
+            bounds, returns bounds.
+
+    e.g.
+    >>> largest_empty_rectangle((1,1,3,7),[(2,2,6,6)])
+    (1, 1, 2, 7)
+
+    Ties between rectangles of the same area are broken by taking the one with
+    the lowest bottom wall, then the lowest left wall, then the widest one.
+
+    The walls of a largest empty rectangle always lie on a wall of bounds or on
+    a wall of an obstacle, so the search only has to look at those coordinates.
+    The obstacles are clipped to bounds and their walls are used to split bounds
+    into a grid of at most (2k+1) x (2k+1) cells for k obstacles. A cell is
+    either entirely blocked or entirely free, which is worked out with a
+    difference array instead of marking every obstacle cell by cell.
+
+    The grid is then swept from the bottom row to the top row keeping, for
+    every column, the height of free space ending at the current row. This turns
+    each row into a histogram whose largest rectangles are found with a stack
+    (the staircase of increasing heights). Every maximal empty rectangle shows
+    up in the row of its top wall, so the best one is found in O(k^2) time no
+    matter how large bounds is.
+
+    Assertions:
+        - bounds must have a positive width and height.
+    '''
+    bx0,by0,bx1,by1 = bounds
+    assert (bx1 > bx0) and (by1 > by0), 'Warning! Bounds must have a positive width and height!'
+
+    #Clipping the obstacles to the bounds and dropping those that do not overlap.
+    clipped = []
+    for ox0,oy0,ox1,oy1 in obstacles:
+        ox0 = max(ox0,bx0)
+        oy0 = max(oy0,by0)
+        ox1 = min(ox1,bx1)
+        oy1 = min(oy1,by1)
+        if (ox1 > ox0) and (oy1 > oy0):
+            clipped.append((ox0,oy0,ox1,oy1))
+
+    if len(clipped) == 0:
+        return (bx0,by0,bx1,by1)
+
+    xs = sorted(set([bx0,bx1] + [o[0] for o in clipped] + [o[2] for o in clipped]))
+    ys = sorted(set([by0,by1] + [o[1] for o in clipped] + [o[3] for o in clipped]))
+    columns = len(xs) - 1
+    rows = len(ys) - 1
+
+    #Difference array of the obstacles, prefix summed into blocked counts per cell.
+    blocked = [[0] * (columns + 1) for j in range(rows + 1)]
+    for ox0,oy0,ox1,oy1 in clipped:
+        i0 = bisect_left(xs,ox0)
+        i1 = bisect_left(xs,ox1)
+        j0 = bisect_left(ys,oy0)
+        j1 = bisect_left(ys,oy1)
+        blocked[j0][i0] += 1
+        blocked[j0][i1] -= 1
+        blocked[j1][i0] -= 1
+        blocked[j1][i1] += 1
+    for j in range(rows + 1):
+        row = blocked[j]
+        for i in range(1,columns + 1):
+            row[i] += row[i-1]
+        if j > 0:
+            below = blocked[j-1]
+            for i in range(columns + 1):
+                row[i] += below[i]
+
+    best = None
+    best_key = None
+    examined = 0
+    heights = [0] * columns
+    for j in range(rows):
+        row_height = ys[j+1] - ys[j]
+        top = ys[j+1]
+        for i in range(columns):
+            if blocked[j][i] > 0:
+                heights[i] = 0
+            else:
+                heights[i] += row_height
+
+        #Largest rectangles under the histogram of heights ending at this row.
+        stack = [] #(first column, height) with increasing heights.
+        for i in range(columns + 1):
+            if i < columns:
+                height = heights[i]
+            else:
+                height = 0
+            start = i
+            while len(stack) != 0 and stack[-1][1] >= height:
+                start, bar = stack.pop()
+                if bar > 0:
+                    examined += 1
+                    width = xs[i] - xs[start]
+                    key = (-width * bar, top - bar, xs[start], -width)
+                    if (best_key is None) or (key < best_key):
+                        best_key = key
+                        best = (xs[start],top - bar,xs[i],top)
+            stack.append((start,height))
+
+    if metrics is not None:
+        metrics.truncate_candidates += examined
+    return best
@@ -0,0 +1,138 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import numpy as np
+from tower_class import tower
+
+class OccupancyGrid(object):
+    '''
+    Keeps track of which unit cells of a width x height region are covered by
+    placed towers.
+
+    Attributes:
+        - self.width = Width of the region.
+        - self.height = Height of the region.
+        - self.cells = Boolean NumPy array of shape (height,width). cells[y,x]
+            is True if the unit cell with lower left corner (x,y) is covered.
+        - self.table = Summed-area table of self.cells, an integer NumPy array
+            of shape (height+1,width+1). table[y,x] is the number of covered
+            cells with lower left corner below y and left of x.
+        - self.covered_area = Number of covered cells.
+
+    Methods:
+        - add(): Marks the cells under a tower as covered.
+        - covered_cells(): Number of covered cells under a tower.
+        - is_free(): Whether none of the cells under a tower are covered.
+        - is_covered(): Whether all of the cells under a tower are covered.
+        - state(): 'free', 'covered' or 'partial' for a tower.
+
+    The summed-area table lets the number of covered cells under any tower be
+    read off from four entries of the table, so every query is O(1) no matter
+    how large the tower is. When a tower is added only the part of the table
+    above and to the right of its lower left corner changes, and that part is
+    updated in place from the cells the tower newly covers.
+    '''
+
+    def __init__(self,width,height):
+        '''
+        Creates an empty grid over a width x height region.
+
+        Parameter: width
+        Type: int
+
+        Parameter: height
+        Type: int
+
+        Assertions:
+            - width and height must be positive integers.
+        '''
+        assert isinstance(width,int) and width > 0, 'Warning! Width must be a positive integer!'
+        assert isinstance(height,int) and height > 0, 'Warning! Height must be a positive integer!'
+        self.width = width
+        self.height = height
+        self.cells = np.zeros((height,width),dtype = bool)
+        self.table = np.zeros((height + 1,width + 1),dtype = np.int64)
+        self.covered_area = 0
+
+    def add(self,t):
+        '''
+        Marks every cell under tower t as covered.
+
+        Parameter: t
+        Type: tower object, must be inside the region.
+
+        Return: int, the number of cells that t newly covered.
+
+        e.g.
+        >>> grid = OccupancyGrid(10,10)
+        >>> grid.add(tower((0,0),4,4))
+        16
+        >>> grid.add(tower((2,2),4,4))
+        12
+
+        Assertions:
+            - t must be a tower object inside the region.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        x0,y0 = t.coord_ll
+        x1,y1 = t.coord_tr
+        assert (x1 <= self.width) and (y1 <= self.height), 'Warning! Tower must be inside the region!'
+
+        new = ~self.cells[y0:y1,x0:x1]
+        added = np.cumsum(np.cumsum(new,axis = 0,dtype = np.int64),axis = 1)
+        newly_covered = int(added[-1,-1])
+        if newly_covered == 0:
+            return 0
+
+        table = self.table
+        table[y0+1:y1+1,x0+1:x1+1] += added
+        table[y0+1:y1+1,x1+1:] += added[:,-1:]
+        table[y1+1:,x0+1:x1+1] += added[-1:,:]
+        table[y1+1:,x1+1:] += newly_covered
+
+        self.cells[y0:y1,x0:x1] = True
+        self.covered_area += newly_covered
+        return newly_covered
+
+    def covered_cells(self,t):
+        '''
+        Returns the number of covered cells under tower t.
+
+        Parameter: t
+        Type: tower object, must be inside the region.
+
+        Return: int
+        '''
+        x0,y0 = t.coord_ll
+        x1 = x0 + t.width
+        y1 = y0 + t.height
+        table = self.table
+        return int(table[y1,x1] - table[y0,x1] - table[y1,x0] + table[y0,x0])
+
+    def is_free(self,t):
+        '''
+        Returns True if none of the cells under tower t are covered.
+        '''
+        return self.covered_cells(t) == 0
+
+    def is_covered(self,t):
+        '''
+        Returns True if all of the cells under tower t are covered.
+        '''
+        return self.covered_cells(t) == t.width * t.height
+
+    def state(self,t):
+        '''
+        Returns how much of tower t's coverage area is already covered.
+
+        Parameter: t
+        Type: tower object, must be inside the region.
+
+        Return: 'free' if none of t's cells are covered, 'covered' if all of
+                them are, and 'partial' otherwise.
+        '''
+        covered = self.covered_cells(t)
+        if covered == 0:
+            return 'free'
+        if covered == t.width * t.height:
+            return 'covered'
+        return 'partial'
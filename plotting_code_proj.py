@@ -1,12 +1,101 @@
 #Author: Humberto Hernandez
 #Last Updated: 5/19/2018 7:33pm
 from tower_class import tower
+from tower_array import TowerArray
 import random
+import re
 
 color = lambda: random.randint(0,255)
 color_rect = '#%02X%02X%02X' % (color(),color(),color())
 
-def plot_towers(towers,width,height):
+acceptable_characters = ['0','1','2','3','4','5','6','7','8','9',
+                         'A','B','C','D','E','F','a','b','c','d','e','f','#']
+
+acceptable_hatch = ['/','\\','-', '+','x','o','O','.','*']
+
+#Exactly '#' followed by six hexadecimal digits.
+_hex_color = re.compile('#[0-9A-Fa-f]{6}\\Z')
+_hatches = frozenset(acceptable_hatch)
+
+def _check_color(color):
+    '''
+    Checks that color is None or an RGB-hexadecimal number, see plot_towers().
+    '''
+    if color != None:
+        assert isinstance(color,basestring),'plot_towers: color must be either None or RGB-hexadecimal number!'
+        if _hex_color.match(color) is None:
+            assert len(color) == 7,'plot_towers: Warning! Hexadecimal number must be in the #XXXXXX format' 
+            assert color[0] == '#', 'plot_towers: Warning! Not a Hexadecimal number! Format must be #XXXXXX.'
+            bad = [char for char in color[1:] if char not in acceptable_characters]
+            assert bad == [], 'plot_towers: Warning! Not a valid hexadecimal number!, %s' % bad[0]
+            #Every character is allowed somewhere, but a '#' is only allowed first.
+            assert False, 'plot_towers: Warning! Not a valid hexadecimal number!, %s' % color
+
+def _check_hatch(hatch):
+    '''
+    Checks that hatch is None or one of the hatch types, see plot_towers().
+    '''
+    if hatch != None:
+        assert isinstance(hatch,basestring) and (hatch in _hatches),'plot_towers: Hatch must be from acceptable list in documentation.'
+
+def _check_once(value,seen,check):
+    '''
+    Runs check on value unless a value equal to it is in the set seen, and
+    adds it to seen once it passes.
+    '''
+    try:
+        if value in seen:
+            return
+    except TypeError:
+        pass #Unhashable, check() will reject it.
+    check(value)
+    seen.add(value)
+
+def _check_tower_packet(t,color,hatch,fill):
+    '''
+    Checks one [tower,color,hatch,fill] entry of plot_towers(), see the
+    assertions there.
+    '''
+    assert isinstance(t,tower), 'plot_towers: Warning! First item in the list must be of class tower!'
+    assert isinstance(fill,bool), 'plot_towers: fill must be True or False.'
+    _check_color(color)
+    _check_hatch(hatch)
+
+def validate_towers(towers):
+    '''
+    Checks a list of towers in the format of plot_towers() once, so it can be
+    drawn any number of times with validate set to False.
+    
+    Parameter: towers
+    Type: list of [tower,color,hatch,fill] lists, see plot_towers().
+    
+    Every tower and fill is checked, but each distinct color and hatch type is
+    only checked the first time it comes up, using a regular expression and a
+    set instead of comparing characters one by one.
+    
+    e.g.
+    >>> plot_list = [[tower((1,1),2,3),'#0000FF',None,True]]
+    >>> validate_towers(plot_list)
+    >>> plot_towers(plot_list,10,10,validate = False)
+    
+    Assertions:
+        - Same as plot_towers().
+    '''
+    assert isinstance(towers,list),'plot_towers: Must submit tower list!'
+    assert len(towers) > 0, 'plot_towers: towers list must be greater than 0!'
+    
+    for tower_packet in towers:
+        assert len(tower_packet) == 4, 'plot_towers: Sub_lists can only be length of three.'
+    
+    colors = set()
+    hatches = set()
+    for t,color,hatch,fill in towers:
+        assert isinstance(t,tower), 'plot_towers: Warning! First item in the list must be of class tower!'
+        assert isinstance(fill,bool), 'plot_towers: fill must be True or False.'
+        _check_once(color,colors,_check_color)
+        _check_once(hatch,hatches,_check_hatch)
+
+def plot_towers(towers,width,height,validate = True):
     '''
     Takes in a list of towers describing there facecolor and hatch type and returns
     a single plot with them on it.
@@ -24,11 +113,15 @@ def plot_towers(towers,width,height):
             a-f.
         - fill determines whether a towers box has color or is transparent. Can be
             True or False. True for color, False for transparent.
+        - validate determines whether towers is checked. Callers that drew up
+            towers themselves, or checked it with validate_towers(), can pass
+            False to skip the checks.
         
     Type: 
         - towers: list
         - width:  int
         - height: int
+        - validate: bool
     
     Note: - Imports the matplotlib module as well as the patches module. Makes use
             of the Rectangle class to create the coverage area of each tower.
@@ -82,6 +175,7 @@ def plot_towers(towers,width,height):
         - Third item must be a hatch type from the hatch types in the function
             documentation.        
         - Fourth item is the fill, must be True or False.
+        - The checks on towers are only made when validate is True.
         
     '''
     import matplotlib.pyplot as plt
@@ -89,45 +183,10 @@ def plot_towers(towers,width,height):
     
     assert (isinstance(width,int)) and width > 0,'plot_towers: Width must be an integer greater than zero!'
     assert (isinstance(height,int)) and height > 0,'plot_towers: Height must be an integer greater than zero!'
-    assert isinstance(towers,list),'plot_towers: Must submit tower list!'
-    assert len(towers) > 0, 'plot_towers: towers list must be greater than 0!'
-    
-    for tower_packet in towers:
-        assert len(tower_packet) == 4, 'plot_towers: Sub_lists can only be length of three.'
- 
-    acceptable_characters = ['0','1','2','3','4','5','6','7','8','9',
-                             'A','B','C','D','E','F','a','b','c','d','e','f','#']
-    
-    acceptable_hatch = ['/','\\','-', '+','x','o','O','.','*']
     
     #Checking to make sure sublist is valid.
-    for t,color,hatch,fill in towers:
-        assert isinstance(t,tower), 'plot_towers: Warning! First item in the list must be of class tower!'
-        assert isinstance(fill,bool), 'plot_towers: fill must be True or False.'
-        
-        if color != None:
-            characters = list(color)
-            assert len(characters) == 7,'plot_towers: Warning! Hexadecimal number must be in the #XXXXXX format' 
-            assert characters[0] == '#', 'plot_towers: Warning! Not a Hexadecimal number! Format must be #XXXXXX.'
-            #Checking that the string is an actual hexadecimal number.
-            valid = 0
-            for char in characters:
-                for ac_char in acceptable_characters:
-                    if(ac_char == char):
-                        valid = 1
-                assert valid > 0, 'plot_towers: Warning! Not a valid hexadecimal number!, %s' % char
-                valid = 0
-        else:
-            assert color == None,'plot_towers: color must be either None or RGB-hexadecimal number!'
-        
-        if hatch != None:
-            valid = 0
-            for h in acceptable_hatch:
-                if h == hatch:
-                    valid = 1
-            assert valid == 1,'plot_towers: Hatch must be from acceptable list in documentation.'
-        else:
-            assert hatch == None, 'plot_towers: hatch must be either from acceptable list in documentation or None'
+    if validate:
+        validate_towers(towers)
 
     fig = plt.figure()
     ax = fig.add_subplot(111)
@@ -140,3 +199,310 @@ def plot_towers(towers,width,height):
         ax.add_patch(patches.Rectangle(t.coord_ll,t.width,t.height,facecolor = color, hatch = hatch, Fill = fill))
 
              
+
+#Number of towers above which plot_tower_collection() rasterizes by default.
+RASTERIZE_ABOVE = 1000
+
+def _per_tower(value,count,name):
+    '''
+    Returns value as a list with one entry per tower. A single value (not a
+    list) is used for every tower.
+    '''
+    if isinstance(value,(list,tuple)):
+        assert len(value) == count, 'plot_tower_collection: Need one %s per tower!' % name
+        return list(value)
+    return [value] * count
+
+def plot_tower_collection(towers,width,height,colors = None,hatches = None,fill = True,rasterized = None,ax = None,validate = True):
+    '''
+    Draws a large number of towers at once, for layouts with too many towers
+    for plot_towers().
+    
+    Parameters:
+        - towers is a TowerArray, a list of tower objects or a list in the
+            format of plot_towers(), [[tower,color,hatch,fill],...]. With the
+            plot_towers() format, the colors, hatches and fill of the list are
+            used and the arguments of the same names are ignored.
+        - width and height describe the bounds of the plotting area.
+        - colors is None, one rgb color for every tower or a list with one
+            rgb color (or None) per tower. None uses matplotlib's default
+            patch color.
+        - hatches is None, one hatch type for every tower or a list with one
+            hatch type (or None) per tower.
+        - fill is True, False or a list with one of those per tower.
+        - rasterized is True, False or None. None rasterizes when there are
+            more than RASTERIZE_ABOVE towers. A rasterized collection is
+            stored as a single image when saved to a vector format such as
+            PDF or SVG, instead of as one shape per tower.
+        - ax is the matplotlib axis to draw on, e.g. LivePlot.ax. If None, a
+            new figure is made the same way as plot_towers() does.
+        - validate determines whether the towers, colors, hatches and fill
+            are checked.
+        
+    Type: 
+        - towers: TowerArray or list
+        - width:  int
+        - height: int
+        - colors: str, list or None
+        - hatches: str, list or None
+        - fill: bool or list
+        - rasterized: bool or None
+        - validate: bool
+    
+    Return: list of the matplotlib collections added to the axis.
+    
+    The towers are turned into corner coordinates with NumPy and drawn as one
+    PolyCollection per hatch type, instead of one Rectangle patch each, so the
+    cost of drawing hardly grows with the number of towers. Colors and hatch
+    types are checked once per distinct value rather than once per tower. The
+    towers of one hatch type are drawn in order, but all of them are drawn
+    over the towers of hatch types that came up earlier in the list.
+    
+    e.g.
+    >>> array = TowerArray.from_towers(valid_towers)
+    >>> plot_tower_collection(array,100,100,colors = '#56C8D0')
+    [<matplotlib.collections.PolyCollection object at 0x7f...>]
+    
+    Assertions:
+        - width and height must be greater than zero.
+        - width and height must be integer type.
+        - towers must be a non-empty TowerArray or list.
+        - colors, hatches and fill must follow the rules of plot_towers().
+        - colors, hatches and fill lists must have one entry per tower.
+        - rasterized must be True, False or None.
+    '''
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from matplotlib import rcParams
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba
+    
+    assert (isinstance(width,int)) and width > 0,'plot_tower_collection: Width must be an integer greater than zero!'
+    assert (isinstance(height,int)) and height > 0,'plot_tower_collection: Height must be an integer greater than zero!'
+    assert rasterized in (True,False,None), 'plot_tower_collection: rasterized must be True, False or None!'
+    
+    if isinstance(towers,TowerArray):
+        array = towers
+    else:
+        assert isinstance(towers,list),'plot_tower_collection: Must submit a TowerArray or tower list!'
+        if (len(towers) > 0) and isinstance(towers[0],list):
+            if validate:
+                for tower_packet in towers:
+                    assert len(tower_packet) == 4, 'plot_tower_collection: Sub_lists must have a tower, color, hatch and fill.'
+            colors = [packet[1] for packet in towers]
+            hatches = [packet[2] for packet in towers]
+            fill = [packet[3] for packet in towers]
+            towers = [packet[0] for packet in towers]
+        if validate:
+            for t in towers:
+                assert isinstance(t,tower), 'plot_tower_collection: Warning! Towers must be of class tower!'
+        array = TowerArray.from_towers(towers)
+    count = len(array)
+    assert count > 0, 'plot_tower_collection: towers must not be empty!'
+    
+    colors = _per_tower(colors,count,'color')
+    hatches = _per_tower(hatches,count,'hatch')
+    fill = _per_tower(fill,count,'fill')
+    if validate:
+        seen = set()
+        for c in colors:
+            _check_once(c,seen,_check_color)
+        seen = set()
+        for h in hatches:
+            _check_once(h,seen,_check_hatch)
+        for f in set(fill):
+            assert isinstance(f,bool), 'plot_tower_collection: fill must be True or False.'
+    
+    #Same colors as a Rectangle patch: the default face color when no color is
+    #given, no face when not filled, and an edge only when not filled or hatched.
+    rgba = dict((c,to_rgba(rcParams['patch.facecolor'] if c is None else c)) for c in set(colors))
+    none = (0.0,0.0,0.0,0.0)
+    edge = to_rgba(rcParams['patch.edgecolor'])
+    facecolors = np.array([rgba[c] if f else none for c,f in zip(colors,fill)])
+    edgecolors = np.array([edge if ((not f) or (h is not None)) else none for h,f in zip(hatches,fill)])
+    
+    verts = np.empty((count,4,2))
+    verts[:,0,0] = array.x
+    verts[:,0,1] = array.y
+    verts[:,1,0] = array.x1
+    verts[:,1,1] = array.y
+    verts[:,2,0] = array.x1
+    verts[:,2,1] = array.y1
+    verts[:,3,0] = array.x
+    verts[:,3,1] = array.y1
+    
+    if rasterized is None:
+        rasterized = count > RASTERIZE_ABOVE
+    
+    if ax is None:
+        fig = plt.figure()
+        ax = fig.add_subplot(111)
+        ax.set_xlim(0,width)
+        ax.set_ylim(0,height)
+        ax.grid()
+    
+    order = []
+    groups = {}
+    for i,h in enumerate(hatches):
+        if h not in groups:
+            order.append(h)
+            groups[h] = []
+        groups[h].append(i)
+    
+    collections = []
+    for h in order:
+        index = np.array(groups[h])
+        collection = PolyCollection(verts[index],facecolors = facecolors[index],edgecolors = edgecolors[index],hatch = h)
+        collection.set_rasterized(rasterized)
+        ax.add_collection(collection)
+        collections.append(collection)
+    return collections
+
+class LivePlot(object):
+    '''
+    Keeps one figure open while a simulation runs and only adds or removes the
+    towers that change between frames, instead of building a new figure with
+    every tower for every frame like plot_towers() does.
+    
+    Attributes:
+        - self.width, self.height = Bounds of the plotting area.
+        - self.fig, self.ax = The matplotlib figure and axis drawn on.
+        - self.blit = Whether frames are drawn by blitting.
+        - self.frames = Number of frames drawn so far.
+    
+    Methods:
+        - add(): Adds a tower to the plot and returns its patch.
+        - remove(): Takes a patch returned by add() off the plot.
+        - draw(): Shows the changes since the last frame.
+        - close(): Closes the figure.
+    
+    With blit set to True, towers added with moving=True (such as the tower
+    being tried at each step) are drawn on top of a saved picture of
+    everything else. A frame where only those towers changed then costs the
+    same however many towers are on the plot. The saved picture is only drawn
+    again when a tower that is not moving is added or removed. Backends that
+    can not blit fall back to drawing the whole figure.
+    
+    e.g.
+    >>> live = LivePlot(10,10,blit = True)
+    >>> live.add(tower((1,1),2,3),'#0000FF',None,True)
+    >>> trying = live.add(tower((4,4),2,2),None,'/',False,moving = True)
+    >>> live.draw(0.5)
+    >>> live.remove(trying)
+    '''
+    
+    def __init__(self,width,height,blit = False):
+        '''
+        Opens the figure with an empty width x height plotting area.
+        
+        Parameter: width
+        Type: int
+        
+        Parameter: height
+        Type: int
+        
+        Parameter: blit
+        Type: bool
+        
+        Assertions:
+            - width and height must be integers greater than zero.
+            - blit must be True or False.
+        '''
+        import matplotlib.pyplot as plt
+        
+        assert (isinstance(width,int)) and width > 0,'LivePlot: Width must be an integer greater than zero!'
+        assert (isinstance(height,int)) and height > 0,'LivePlot: Height must be an integer greater than zero!'
+        assert isinstance(blit,bool), 'LivePlot: blit must be True or False!'
+        
+        self.width = width
+        self.height = height
+        self.fig = plt.figure()
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_xlim(0,width)
+        self.ax.set_ylim(0,height)
+        self.ax.grid()
+        self.blit = blit and getattr(self.fig.canvas,'supports_blit',False)
+        self.frames = 0
+        self._moving = []
+        self._background = None
+        plt.show(block = False)
+    
+    def add(self,t,color = None,hatch = None,fill = True,moving = False,validate = True):
+        '''
+        Adds a tower to the plot. It shows up at the next draw().
+        
+        Parameter: t
+        Type: tower object
+        
+        Parameter: color, hatch and fill
+        Type: same as for plot_towers().
+        
+        Parameter: moving
+        Type: bool, whether the tower is only on the plot for a frame or so.
+                With blitting, moving towers are not part of the saved picture.
+        
+        Parameter: validate
+        Type: bool, whether to check t, color, hatch and fill.
+        
+        Return: the matplotlib patch of the tower, to pass to remove().
+        '''
+        import matplotlib.patches as patches
+        
+        if validate:
+            _check_tower_packet(t,color,hatch,fill)
+        patch = patches.Rectangle(t.coord_ll,t.width,t.height,facecolor = color, hatch = hatch, fill = fill)
+        if moving and self.blit:
+            patch.set_animated(True)
+            self._moving.append(patch)
+        else:
+            self._background = None
+        self.ax.add_patch(patch)
+        return patch
+    
+    def remove(self,patch):
+        '''
+        Takes a patch returned by add() off the plot. It is gone at the next
+        draw().
+        '''
+        if patch in self._moving:
+            self._moving.remove(patch)
+        else:
+            self._background = None
+        patch.remove()
+    
+    def draw(self,pause = 0):
+        '''
+        Shows the changes made since the last frame.
+        
+        Parameter: pause
+        Type: int or float, the number of seconds to show the frame for. The
+                window keeps responding during the pause.
+        
+        Assertions:
+            - pause must not be negative.
+        '''
+        assert pause >= 0, 'LivePlot: pause must not be negative!'
+        canvas = self.fig.canvas
+        if self.blit:
+            if self._background is None:
+                canvas.draw()
+                self._background = canvas.copy_from_bbox(self.ax.bbox)
+            else:
+                canvas.restore_region(self._background)
+            for patch in self._moving:
+                self.ax.draw_artist(patch)
+            canvas.blit(self.ax.bbox)
+        else:
+            canvas.draw_idle()
+        self.frames += 1
+        if pause > 0:
+            canvas.start_event_loop(pause)
+        else:
+            canvas.flush_events()
+    
+    def close(self):
+        '''
+        Closes the figure.
+        '''
+        import matplotlib.pyplot as plt
+        plt.close(self.fig)
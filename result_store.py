@@ -0,0 +1,181 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import sqlite3
+from coverage_statistics import CoverageStatistics
+
+#Version of the simulation whose counts are stored. Raise it whenever a change
+#to tower_coverage makes a seeded run give different counts, so the counts of
+#the old code are not mixed with the new ones.
+SIMULATION_VERSION = 1
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    sampler TEXT NOT NULL,
+    batch_size INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    iterations INTEGER NOT NULL,
+    mean REAL,
+    variance REAL,
+    minimum INTEGER,
+    maximum INTEGER,
+    UNIQUE (width,height,sampler,batch_size,seed,version)
+);
+CREATE TABLE IF NOT EXISTS counts (
+    run INTEGER NOT NULL REFERENCES runs(id),
+    iteration INTEGER NOT NULL,
+    towers INTEGER NOT NULL,
+    PRIMARY KEY (run,iteration)
+);
+'''
+
+#Columns of a row of runs() in order.
+RUN_COLUMNS = ('width','height','sampler','batch_size','seed','version','iterations','mean','variance','minimum','maximum')
+
+class ResultStore(object):
+    '''
+    Keeps the tower counts of seeded runs of the simulation in an SQLite file,
+    so a run that was already done is read back instead of simulated again.
+
+    A run is known by its key: the width and height of the coverage area, the
+    sampler, the batch_size, the seed and SIMULATION_VERSION. Those are all the
+    options that change the counts of a seeded run. index and occupancy only
+    change how fast the towers are placed, so they are not part of the key.
+
+    Attributes:
+        - self.path = File the results are kept in, or ':memory:'.
+        - self.connection = The sqlite3 connection to it.
+
+    Methods:
+        - counts(): Returns the stored counts of a run, in order of iteration.
+        - append(): Adds the counts of the next iterations of a run.
+        - statistics(): Returns a CoverageStatistics of the stored counts of a run.
+        - runs(): Returns every stored run with its summary statistics.
+        - close(): Closes the file.
+
+    Iteration i of a seeded run always draws its towers from
+    tower_coverage.iteration_rng(seed,i), so the stored counts of a run are
+    always iterations 0 to n-1, and more can be added later with
+    iter_tower_counts(start = n). The summary statistics of a run are kept
+    next to its counts and updated with every append().
+
+    e.g.
+    >>> store = ResultStore('results.db')
+    >>> average_towers_for_coverage(1000,10,10,seed = 143,store = store)
+    >>> store.counts(10,10,143)[:5]
+    [31, 28, 30, 27, 33]
+    '''
+
+    def __init__(self,path):
+        '''
+        Opens the file, making it and its tables if they do not exist yet.
+
+        Parameter: path
+        Type: str, a file name or ':memory:'.
+        '''
+        assert isinstance(path,str), 'Warning! path must be a string!'
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def _run_id(self,key):
+        row = self.connection.execute('SELECT id FROM runs WHERE width = ? AND height = ? AND sampler = ? AND batch_size = ? AND seed = ? AND version = ?',key).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def counts(self,width,height,seed,sampler = 'uniform',batch_size = 1,version = SIMULATION_VERSION):
+        '''
+        Returns the stored tower counts of a run, in order of iteration, or an
+        empty list if nothing is stored for it.
+
+        Parameter: width
+        Type: int
+
+        Parameter: height
+        Type: int
+
+        Parameter: seed
+        Type: int
+
+        Parameter: sampler
+        Type: str
+
+        Parameter: batch_size
+        Type: int
+
+        Parameter: version
+        Type: int, SIMULATION_VERSION unless reading the counts of older code.
+
+        Return: list of int
+        '''
+        run = self._run_id((width,height,sampler,batch_size,seed,version))
+        if run is None:
+            return []
+        return [row[0] for row in self.connection.execute('SELECT towers FROM counts WHERE run = ? ORDER BY iteration',(run,))]
+
+    def append(self,width,height,seed,counts,start,sampler = 'uniform',batch_size = 1):
+        '''
+        Stores the counts of iterations start, start + 1, ... of a run of the
+        current SIMULATION_VERSION, and updates its summary statistics.
+
+        Parameter: counts
+        Type: list of int
+
+        Parameter: start
+        Type: int, the number of the first iteration in counts.
+
+        width, height, seed, sampler and batch_size are the key of the run,
+        the same as for counts().
+
+        Return: int, the number of counts stored for the run now.
+
+        Assertions:
+            - seed must be an integer, since only seeded runs can be repeated.
+            - start must be the number of counts already stored, so the
+                stored iterations have no gaps.
+        '''
+        assert isinstance(seed,(int,long)), 'Warning! Only runs with an integer seed can be stored!'
+        key = (width,height,sampler,batch_size,seed,SIMULATION_VERSION)
+        with self.connection:
+            run = self._run_id(key)
+            if run is None:
+                run = self.connection.execute('INSERT INTO runs (width,height,sampler,batch_size,seed,version,iterations) VALUES (?,?,?,?,?,?,0)',key).lastrowid
+            stored = self.connection.execute('SELECT iterations FROM runs WHERE id = ?',(run,)).fetchone()[0]
+            assert start == stored, 'Warning! start must be %d, the number of counts already stored!' % stored
+            self.connection.executemany('INSERT INTO counts (run,iteration,towers) VALUES (?,?,?)',
+                                        ((run,start + i,int(count)) for i,count in enumerate(counts)))
+            stats = self._statistics(run)
+            self.connection.execute('UPDATE runs SET iterations = ?, mean = ?, variance = ?, minimum = ?, maximum = ? WHERE id = ?',
+                                    (stats.count,stats.mean,stats.variance,stats.minimum,stats.maximum,run))
+        return stats.count
+
+    def _statistics(self,run):
+        stats = CoverageStatistics()
+        for row in self.connection.execute('SELECT towers FROM counts WHERE run = ? ORDER BY iteration',(run,)):
+            stats.add(row[0])
+        return stats
+
+    def statistics(self,width,height,seed,sampler = 'uniform',batch_size = 1,version = SIMULATION_VERSION):
+        '''
+        Returns a CoverageStatistics of the stored counts of a run, which is
+        empty if nothing is stored for it. Takes the same parameters as counts().
+        '''
+        run = self._run_id((width,height,sampler,batch_size,seed,version))
+        if run is None:
+            return CoverageStatistics()
+        return self._statistics(run)
+
+    def runs(self):
+        '''
+        Returns every stored run as a dictionary with the keys in RUN_COLUMNS,
+        sorted by width, height, sampler, batch_size, seed and version.
+        '''
+        rows = self.connection.execute('SELECT %s FROM runs ORDER BY width,height,sampler,batch_size,seed,version' % ','.join(RUN_COLUMNS))
+        return [dict(zip(RUN_COLUMNS,row)) for row in rows]
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,187 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import timeit
+
+#Clock used for the phase times, the most precise one on each platform.
+clock = timeit.default_timer
+
+#Phases of a simulation step that are timed. 'truncate' is part of 'place'.
+PHASES = ('sample','place','truncate','update')
+
+class SimulationMetrics(object):
+    '''
+    Collects counts and timings from the coverage simulations, for finding out
+    where the time of a run goes.
+
+    Attributes:
+        - self.runs = Number of simulations (iterations) recorded.
+        - self.attempts = Number of random towers drawn.
+        - self.statuses = Dictionary of how many drawn towers got each status
+            from the placement checks ('placed', 'truncated', 'outside',
+            'covered', 'inside_tower', 'contains_tower' or 'no_room').
+        - self.sampler = Dictionary of how many drawn towers the candidate
+            sampler threw out itself, by reason ('outside', 'covered' or
+            'thinned'). These never reach the placement checks.
+        - self.truncate_calls = Number of calls to tower.truncate().
+        - self.truncate_blockers = Total length of the lists of towers
+            truncated against.
+        - self.truncate_candidates = Total number of empty rectangles compared
+            by the largest empty rectangle search.
+        - self.subtowers_calls = Number of calls to tower.subtowers().
+        - self.subtowers_yielded = Number of subtowers those calls handed out.
+        - self.seconds = Dictionary of the seconds spent in each phase of
+            PHASES, plus 'total' for the whole of each run.
+
+    Methods:
+        - time(): Adds seconds to a phase.
+        - count_subtowers(): Counts the subtowers a generator hands out.
+        - merge(): Adds the counts and times of other metrics to these.
+        - report(): Returns the counts and times as a dictionary.
+        - format(): Returns the report as readable text.
+
+    Metrics are only collected when a SimulationMetrics object is passed in as
+    the metrics argument of coverage_up_to_n(), average_towers_for_coverage(),
+    iter_coverage(), tower.truncate() or tower.subtowers(). When it is left as
+    None, nothing is counted or timed.
+
+    e.g.
+    >>> metrics = SimulationMetrics()
+    >>> np.random.seed(0)
+    >>> average = average_towers_for_coverage(3,20,20,metrics = metrics)
+    >>> metrics.report()['rejected']
+    {'contains_tower': 100427, 'outside': 408873, 'no_room': 28602, 'inside_tower': 25650}
+    >>> print metrics.format()
+    Runs: 3
+    Attempts: 563772
+    Accepted: 220 (194 truncated)
+    ...
+    '''
+
+    def __init__(self):
+        self.runs = 0
+        self.attempts = 0
+        self.statuses = {}
+        self.sampler = {}
+        self.truncate_calls = 0
+        self.truncate_blockers = 0
+        self.truncate_candidates = 0
+        self.subtowers_calls = 0
+        self.subtowers_yielded = 0
+        self.seconds = dict((phase,0.0) for phase in PHASES + ('total',))
+
+    def time(self,phase,seconds):
+        '''
+        Adds seconds to the time spent in phase.
+        '''
+        self.seconds[phase] += seconds
+
+    def count_status(self,status):
+        '''
+        Counts a status from the placement checks.
+        '''
+        self.statuses[status] = self.statuses.get(status,0) + 1
+
+    def count_sampler(self,sampler):
+        '''
+        Adds the draws and throw outs of a candidate sampler that has finished
+        a run.
+        '''
+        self.attempts += sampler.drawn
+        for reason in ('outside','covered','thinned'):
+            self.sampler[reason] = self.sampler.get(reason,0) + getattr(sampler,reason)
+
+    def count_subtowers(self,subtowers):
+        '''
+        Returns a generator handing out the same subtowers as subtowers, that
+        counts them as they go.
+        '''
+        self.subtowers_calls += 1
+        for t in subtowers:
+            self.subtowers_yielded += 1
+            yield t
+
+    def merge(self,other):
+        '''
+        Adds the counts and times of other to these metrics, e.g. to combine
+        the metrics of iterations run in different processes.
+
+        Parameter: other
+        Type: SimulationMetrics
+
+        Assertions:
+            - other must be a SimulationMetrics object.
+        '''
+        assert isinstance(other,SimulationMetrics), 'Warning! Can only merge SimulationMetrics!'
+        self.runs += other.runs
+        self.attempts += other.attempts
+        for counts,others in ((self.statuses,other.statuses),(self.sampler,other.sampler)):
+            for key,value in others.items():
+                counts[key] = counts.get(key,0) + value
+        self.truncate_calls += other.truncate_calls
+        self.truncate_blockers += other.truncate_blockers
+        self.truncate_candidates += other.truncate_candidates
+        self.subtowers_calls += other.subtowers_calls
+        self.subtowers_yielded += other.subtowers_yielded
+        for phase,seconds in other.seconds.items():
+            self.seconds[phase] = self.seconds.get(phase,0.0) + seconds
+
+    def report(self):
+        '''
+        Returns the metrics as a dictionary.
+
+        Return: dict with the keys
+            - 'runs', 'attempts': see the attributes.
+            - 'accepted': towers added to the coverage area.
+            - 'accepted_truncated': how many of those were truncated first.
+            - 'rejected': dict of the drawn towers thrown out, by reason. The
+                sampler's and the placement checks' reasons are added together.
+            - 'truncate': dict with 'calls', 'blockers', 'candidates' and
+                'candidates_per_call'.
+            - 'subtowers': dict with 'calls' and 'yielded'.
+            - 'seconds': dict of seconds per phase. 'truncate' is part of
+                'place'. 'total' also holds any time a consumer of
+                iter_coverage() spent between events.
+        '''
+        accepted = self.statuses.get('placed',0) + self.statuses.get('truncated',0)
+        rejected = dict(self.sampler)
+        for status,count in self.statuses.items():
+            if status not in ('placed','truncated'):
+                rejected[status] = rejected.get(status,0) + count
+        for reason in list(rejected):
+            if rejected[reason] == 0:
+                del rejected[reason]
+        per_call = 0.0
+        if self.truncate_calls > 0:
+            per_call = self.truncate_candidates / float(self.truncate_calls)
+        return {'runs': self.runs,
+                'attempts': self.attempts,
+                'accepted': accepted,
+                'accepted_truncated': self.statuses.get('truncated',0),
+                'rejected': rejected,
+                'truncate': {'calls': self.truncate_calls, 'blockers': self.truncate_blockers,
+                             'candidates': self.truncate_candidates, 'candidates_per_call': per_call},
+                'subtowers': {'calls': self.subtowers_calls, 'yielded': self.subtowers_yielded},
+                'seconds': dict(self.seconds)}
+
+    def format(self):
+        '''
+        Returns the report as lines of text.
+        '''
+        report = self.report()
+        lines = ['Runs: %d' % report['runs'],
+                 'Attempts: %d' % report['attempts'],
+                 'Accepted: %d (%d truncated)' % (report['accepted'],report['accepted_truncated']),
+                 'Rejected:']
+        for reason,count in sorted(report['rejected'].items(),key = lambda item: -item[1]):
+            lines.append('    %-16s %d' % (reason,count))
+        truncate = report['truncate']
+        lines.append('truncate(): %d calls, %d blocking towers, %d rectangles compared (%.2f per call)'
+                     % (truncate['calls'],truncate['blockers'],truncate['candidates'],truncate['candidates_per_call']))
+        lines.append('subtowers(): %d calls, %d subtowers' % (report['subtowers']['calls'],report['subtowers']['yielded']))
+        lines.append('Seconds:')
+        for phase in PHASES + ('total',):
+            lines.append('    %-16s %.4f' % (phase,report['seconds'][phase]))
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'SimulationMetrics(%r)' % self.report()
@@ -0,0 +1,413 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import numpy as np
+from tower_class import tower
+from tower_array import TowerArray
+
+def _bounds(t):
+    '''
+    Returns the (x0,y0,x1,y1) bounds of a tower's coverage area.
+    '''
+    return (t.coord_ll[0],t.coord_ll[1],t.coord_tr[0],t.coord_tr[1])
+
+def _overlaps(a,b):
+    '''
+    Returns True if the interiors of the bounds a and b overlap.
+    '''
+    return (a[0] < b[2]) and (b[0] < a[2]) and (a[1] < b[3]) and (b[1] < a[3])
+
+class GridIndex(object):
+    '''
+    Stores placed towers in a uniform grid of square buckets.
+
+    Attributes:
+        - self.width = Width of the region the towers are placed in.
+        - self.height = Height of the region the towers are placed in.
+        - self.cell_size = Width and height of a bucket.
+        - self.towers = List of towers in the order they were inserted.
+
+    Methods:
+        - insert(): Adds a tower to the index.
+        - query(): Returns the towers whose coverage area overlaps a tower's.
+
+    Each tower is stored in every bucket its coverage area touches. A query
+    only looks at the buckets its tower touches, so the cost depends on how
+    many towers are nearby rather than how many have been placed.
+    '''
+
+    def __init__(self,width,height,cell_size = None):
+        '''
+        Creates an empty index over a width x height region.
+
+        Parameter: width
+        Type: int
+
+        Parameter: height
+        Type: int
+
+        Parameter: cell_size
+        Type: int or None. If None, the region is split into about 16 buckets
+                along its longest side.
+
+        Assertions:
+            - width and height must be positive integers.
+            - cell_size must be a positive integer or None.
+        '''
+        assert isinstance(width,int) and width > 0, 'Warning! Width must be a positive integer!'
+        assert isinstance(height,int) and height > 0, 'Warning! Height must be a positive integer!'
+        if cell_size is None:
+            cell_size = max(1,max(width,height) // 16)
+        assert isinstance(cell_size,int) and cell_size > 0, 'Warning! cell_size must be a positive integer!'
+
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.towers = []
+        self._buckets = {}
+
+    def __len__(self):
+        return len(self.towers)
+
+    def __iter__(self):
+        return iter(self.towers)
+
+    def _cells(self,bounds):
+        '''
+        Returns the (column,row) keys of the buckets touched by bounds.
+        '''
+        size = self.cell_size
+        columns = range(bounds[0] // size,(bounds[2] - 1) // size + 1)
+        rows = range(bounds[1] // size,(bounds[3] - 1) // size + 1)
+        return [(i,j) for i in columns for j in rows]
+
+    def insert(self,t):
+        '''
+        Adds a tower to the index.
+
+        Parameter: t
+        Type: tower object
+
+        Assertions:
+            - t must be a tower object.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        entry = (len(self.towers),_bounds(t),t)
+        self.towers.append(t)
+        for key in self._cells(entry[1]):
+            self._buckets.setdefault(key,[]).append(entry)
+
+    def query(self,t):
+        '''
+        Returns the towers in the index whose coverage area overlaps the coverage
+        area of t, in the order they were inserted. This includes towers that
+        contain t or are contained by t. Towers that only share a wall or a
+        corner with t are not returned.
+
+        Parameter: t
+        Type: tower object
+
+        Return: list of tower objects.
+
+        Assertions:
+            - t must be a tower object.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        bounds = _bounds(t)
+        found = {}
+        for key in self._cells(bounds):
+            for entry in self._buckets.get(key,()):
+                if (entry[0] not in found) and _overlaps(bounds,entry[1]):
+                    found[entry[0]] = entry[2]
+        return [found[i] for i in sorted(found)]
+
+class _RTreeNode(object):
+    '''
+    Node of an RTreeIndex. Entries are (bounds,child) pairs, where child is
+    another node for inner nodes and an (order,tower) pair for leaves.
+    '''
+    __slots__ = ('leaf','entries')
+
+    def __init__(self,leaf):
+        self.leaf = leaf
+        self.entries = []
+
+def _union(a,b):
+    '''
+    Returns the bounds enclosing both bounds a and b.
+    '''
+    return (min(a[0],b[0]),min(a[1],b[1]),max(a[2],b[2]),max(a[3],b[3]))
+
+def _node_bounds(node):
+    '''
+    Returns the bounds enclosing every entry of node.
+    '''
+    entries = node.entries
+    result = entries[0][0]
+    for bounds,child in entries[1:]:
+        result = _union(result,bounds)
+    return result
+
+def _area(bounds):
+    return (bounds[2] - bounds[0]) * (bounds[3] - bounds[1])
+
+class RTreeIndex(object):
+    '''
+    Stores placed towers in an R-tree.
+
+    Attributes:
+        - self.max_entries = Largest number of entries a node holds before it
+            is split.
+        - self.towers = List of towers in the order they were inserted.
+
+    Methods:
+        - insert(): Adds a tower to the index.
+        - query(): Returns the towers whose coverage area overlaps a tower's.
+
+    Towers are grouped into nodes by their bounding rectangles, and nodes into
+    parent nodes, so a query only descends into nodes whose bounding rectangle
+    overlaps the tower being queried. A new tower goes into the child that needs
+    the least enlargement to fit it. A node with too many entries is split in
+    half along the axis its entries are most spread out on.
+    '''
+
+    def __init__(self,width = None,height = None,max_entries = 8):
+        '''
+        Creates an empty R-tree.
+
+        Parameter: width
+        Type: int or None. Unused, accepted so all indexes are created the same way.
+
+        Parameter: height
+        Type: int or None. Unused, accepted so all indexes are created the same way.
+
+        Parameter: max_entries
+        Type: int
+
+        Assertions:
+            - max_entries must be an integer of at least 4.
+        '''
+        assert isinstance(max_entries,int) and max_entries >= 4, 'Warning! max_entries must be an integer of at least 4!'
+        self.max_entries = max_entries
+        self.towers = []
+        self._root = _RTreeNode(True)
+
+    def __len__(self):
+        return len(self.towers)
+
+    def __iter__(self):
+        return iter(self.towers)
+
+    def insert(self,t):
+        '''
+        Adds a tower to the index.
+
+        Parameter: t
+        Type: tower object
+
+        Assertions:
+            - t must be a tower object.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        bounds = _bounds(t)
+        split = self._insert(self._root,bounds,(len(self.towers),t))
+        self.towers.append(t)
+        if split is not None:
+            root = _RTreeNode(False)
+            root.entries = [(_node_bounds(self._root),self._root),(_node_bounds(split),split)]
+            self._root = root
+
+    def _insert(self,node,bounds,item):
+        '''
+        Inserts item into the subtree under node. Returns the new sibling node
+        if node had to be split, otherwise None.
+        '''
+        if node.leaf:
+            node.entries.append((bounds,item))
+        else:
+            best = None
+            best_key = None
+            for i,(child_bounds,child) in enumerate(node.entries):
+                area = _area(child_bounds)
+                key = (_area(_union(child_bounds,bounds)) - area,area)
+                if (best_key is None) or (key < best_key):
+                    best = i
+                    best_key = key
+            child_bounds,child = node.entries[best]
+            split = self._insert(child,bounds,item)
+            if split is None:
+                node.entries[best] = (_union(child_bounds,bounds),child)
+            else:
+                node.entries[best] = (_node_bounds(child),child)
+                node.entries.append((_node_bounds(split),split))
+
+        if len(node.entries) > self.max_entries:
+            return self._split(node)
+        return None
+
+    def _split(self,node):
+        '''
+        Moves half of node's entries into a new sibling node and returns it.
+        '''
+        entries = node.entries
+        spread_x = max(b[2] for b,c in entries) - min(b[0] for b,c in entries)
+        spread_y = max(b[3] for b,c in entries) - min(b[1] for b,c in entries)
+        if spread_x >= spread_y:
+            entries.sort(key = lambda entry: entry[0][0] + entry[0][2])
+        else:
+            entries.sort(key = lambda entry: entry[0][1] + entry[0][3])
+        half = len(entries) // 2
+        sibling = _RTreeNode(node.leaf)
+        sibling.entries = entries[half:]
+        node.entries = entries[:half]
+        return sibling
+
+    def query(self,t):
+        '''
+        Returns the towers in the index whose coverage area overlaps the coverage
+        area of t, in the order they were inserted. This includes towers that
+        contain t or are contained by t. Towers that only share a wall or a
+        corner with t are not returned.
+
+        Parameter: t
+        Type: tower object
+
+        Return: list of tower objects.
+
+        Assertions:
+            - t must be a tower object.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        bounds = _bounds(t)
+        found = []
+        stack = [self._root]
+        while len(stack) != 0:
+            node = stack.pop()
+            for child_bounds,child in node.entries:
+                if _overlaps(bounds,child_bounds):
+                    if node.leaf:
+                        found.append(child)
+                    else:
+                        stack.append(child)
+        found.sort()
+        return [t_i for order,t_i in found]
+
+class ArrayIndex(object):
+    '''
+    Stores placed towers in NumPy arrays and checks all of them at once.
+
+    Attributes:
+        - self.towers = List of towers in the order they were inserted.
+        - self.array = TowerArray of the towers in the order they were inserted.
+
+    Methods:
+        - insert(): Adds a tower to the index.
+        - query(): Returns the towers whose coverage area overlaps a tower's.
+
+    A query compares the tower against every placed tower with one call to
+    TowerArray.overlaps(), so there is no bucketing to keep up to date and
+    no Python loop over the placed towers. The arrays grow by doubling so
+    adding a tower is cheap on average.
+    '''
+
+    def __init__(self,width = None,height = None,capacity = 64):
+        '''
+        Creates an empty index.
+
+        Parameter: width
+        Type: int or None. Unused, accepted so all indexes are created the same way.
+
+        Parameter: height
+        Type: int or None. Unused, accepted so all indexes are created the same way.
+
+        Parameter: capacity
+        Type: int, the number of towers room is made for up front.
+
+        Assertions:
+            - capacity must be a positive integer.
+        '''
+        assert isinstance(capacity,int) and capacity > 0, 'Warning! capacity must be a positive integer!'
+        self.towers = []
+        self._columns = np.zeros((4,capacity),dtype = np.int64)
+        self._array = None
+
+    def __len__(self):
+        return len(self.towers)
+
+    def __iter__(self):
+        return iter(self.towers)
+
+    @property
+    def array(self):
+        if self._array is None:
+            x,y,width,height = self._columns[:,:len(self.towers)]
+            self._array = TowerArray(x,y,width,height)
+        return self._array
+
+    def insert(self,t):
+        '''
+        Adds a tower to the index.
+
+        Parameter: t
+        Type: tower object
+
+        Assertions:
+            - t must be a tower object.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        count = len(self.towers)
+        if count == self._columns.shape[1]:
+            columns = np.zeros((4,2 * count),dtype = np.int64)
+            columns[:,:count] = self._columns
+            self._columns = columns
+        self._columns[:,count] = (t.coord_ll[0],t.coord_ll[1],t.width,t.height)
+        self.towers.append(t)
+        self._array = None
+
+    def query(self,t):
+        '''
+        Returns the towers in the index whose coverage area overlaps the coverage
+        area of t, in the order they were inserted. This includes towers that
+        contain t or are contained by t. Towers that only share a wall or a
+        corner with t are not returned.
+
+        Parameter: t
+        Type: tower object
+
+        Return: list of tower objects.
+
+        Assertions:
+            - t must be a tower object.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        if len(self.towers) == 0:
+            return []
+        towers = self.towers
+        return [towers[i] for i in np.flatnonzero(self.array.overlaps(t)).tolist()]
+
+#Index types the simulators can be asked to use by name.
+INDEX_TYPES = {'grid': GridIndex, 'rtree': RTreeIndex, 'array': ArrayIndex}
+
+def make_index(kind,width,height):
+    '''
+    Returns a new, empty spatial index for a width x height region.
+
+    Parameter: kind
+    Type: str, a key of INDEX_TYPES ('grid', 'rtree' or 'array').
+
+    Parameter: width
+    Type: int
+
+    Parameter: height
+    Type: int
+
+    Return: an empty index object with insert() and query() methods.
+
+    Other index types can be used by adding a class to INDEX_TYPES whose
+    constructor takes (width,height) and which has the same insert() and query()
+    methods.
+
+    Assertions:
+        - kind must be a key of INDEX_TYPES.
+    '''
+    assert kind in INDEX_TYPES, 'Warning! Index must be one of %s!' % sorted(INDEX_TYPES)
+    return INDEX_TYPES[kind](width,height)
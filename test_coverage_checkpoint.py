@@ -0,0 +1,149 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from coverage_checkpoint import write_checkpoint, read_checkpoint, checkpoint_file
+from coverage_statistics import CoverageStatistics
+from result_store import SIMULATION_VERSION
+from tower_coverage import average_towers_for_coverage, resume_average_towers
+
+#Run in another process, which dies without cleaning up after 5 iterations.
+KILLED_RUN = '''
+import os
+from coverage_statistics import CoverageStatistics
+from tower_coverage import average_towers_for_coverage
+
+class Dying(CoverageStatistics):
+    def add(self,count):
+        if self.count == 5:
+            os._exit(1)
+        CoverageStatistics.add(self,count)
+
+average_towers_for_coverage(12,6,6,seed = 143,return_counts = True,checkpoint = %r,checkpoint_every = 2,stats = Dying())
+'''
+
+class Interrupted(CoverageStatistics):
+    '''
+    Statistics that stop the run with a KeyboardInterrupt after a number of counts.
+    '''
+    def __init__(self,stop):
+        CoverageStatistics.__init__(self)
+        self.stop = stop
+
+    def add(self,count):
+        if self.count == self.stop:
+            raise KeyboardInterrupt
+        CoverageStatistics.add(self,count)
+
+class TestCoverageCheckpoint(unittest.TestCase):
+    '''
+    Used to make sure that a run resumed from its checkpoint ends the same as
+    a run that was never stopped.
+    Please run as main file!
+
+    This code tests the following from the coverage_checkpoint module.
+    - write_checkpoint(), read_checkpoint() and checkpoint_file()
+    - average_towers_for_coverage() with a checkpoint
+    - resume_average_towers() after an interrupt and after the process dies
+
+    '''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder,'run.json')
+        self.expected = CoverageStatistics()
+        self.average, self.counts = average_towers_for_coverage(12,6,6,seed = 143,return_counts = True,stats = self.expected)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_write(self):
+        '''
+        Tests that a checkpoint reads back as written, with no file left over.
+        '''
+        write_checkpoint(self.path,{'parameters': {'sampler': 'free'}, 'statistics': self.expected.state()})
+        write_checkpoint(self.path,{'parameters': {'sampler': 'uniform'}, 'statistics': self.expected.state()})
+        self.assertEqual(os.listdir(self.folder),['run.json'])
+        checkpoint = read_checkpoint(self.path)
+        self.assertEqual(checkpoint['version'],SIMULATION_VERSION)
+        self.assertEqual(checkpoint['parameters'],{'sampler': 'uniform'})
+        self.assertTrue(isinstance(checkpoint['parameters']['sampler'],str))
+        stats = CoverageStatistics()
+        stats.load(checkpoint['statistics'])
+        self.assertEqual(stats.summary(),self.expected.summary())
+        self.assertEqual(stats.bins,self.expected.bins)
+
+        write_checkpoint(self.path,{'version': SIMULATION_VERSION + 1})
+        self.assertEqual(read_checkpoint(self.path)['version'],SIMULATION_VERSION)
+
+    def test_leftover(self):
+        '''
+        Tests that a checkpoint left only in the .tmp file, as a crash between
+        removing and renaming on Windows does, is read back and resumed, and
+        that a half written one is not.
+        '''
+        self.assertEqual(checkpoint_file(self.path),None)
+        self.assertRaises(AssertionError,read_checkpoint,self.path)
+        self.assertRaises(KeyboardInterrupt,average_towers_for_coverage,12,6,6,seed = 143,return_counts = True,checkpoint = self.path,stats = Interrupted(7))
+        os.rename(self.path,self.path + '.tmp')
+        self.assertEqual(checkpoint_file(self.path),self.path + '.tmp')
+        self.assertEqual(read_checkpoint(self.path)['counts'],self.counts[:7])
+        self.assertEqual(resume_average_towers(self.path),(self.average,self.counts))
+        self.assertEqual(sorted(os.listdir(self.folder)),['run.json'])
+
+        with open(self.path + '2.tmp','w') as f:
+            f.write('{"parameters": {"wid')
+        self.assertEqual(checkpoint_file(self.path + '2'),None)
+
+    def test_interrupt(self):
+        '''
+        Tests that an interrupted run saves what it did, and that resuming it,
+        with a different number of workers, gives the same statistics.
+        '''
+        self.assertRaises(KeyboardInterrupt,average_towers_for_coverage,12,6,6,seed = 143,return_counts = True,checkpoint = self.path,stats = Interrupted(7))
+        checkpoint = read_checkpoint(self.path)
+        self.assertEqual(checkpoint['counts'],self.counts[:7])
+        self.assertEqual(checkpoint['statistics']['count'],7)
+
+        stats = CoverageStatistics()
+        average, counts = resume_average_towers(self.path,workers = 2,stats = stats)
+        self.assertEqual((average,counts),(self.average,self.counts))
+        self.assertEqual(stats.summary(),self.expected.summary())
+        self.assertEqual(read_checkpoint(self.path)['statistics']['count'],12)
+        self.assertRaises(AssertionError,average_towers_for_coverage,12,6,6,seed = 144,checkpoint = self.path)
+
+    def test_killed(self):
+        '''
+        Tests that a process that dies keeps its last periodic checkpoint,
+        and that resuming without the counts still gives the same average.
+        '''
+        script = os.path.join(self.folder,'killed.py')
+        with open(script,'w') as f:
+            f.write(KILLED_RUN % self.path)
+        environment = dict(os.environ,PYTHONPATH = os.path.dirname(os.path.abspath(__file__)))
+        with open(os.devnull,'w') as null:
+            self.assertEqual(subprocess.call([sys.executable,script],stdout = null,env = environment),1)
+        self.assertEqual(read_checkpoint(self.path)['counts'],self.counts[:4])
+        self.assertEqual(resume_average_towers(self.path),(self.average,self.counts))
+
+        self.assertRaises(KeyboardInterrupt,average_towers_for_coverage,12,6,6,seed = 143,checkpoint = self.path + '2',stats = Interrupted(3))
+        stats = CoverageStatistics()
+        self.assertEqual(resume_average_towers(self.path + '2',stats = stats),self.average)
+        self.assertEqual(stats.summary(),self.expected.summary())
+
+    def test_early_stopping(self):
+        '''
+        Tests that resuming a run that stops early stops at the same iteration.
+        '''
+        options = dict(seed = 143,return_counts = True,relative_error = 0.1,min_iterations = 10)
+        expected = average_towers_for_coverage(500,6,6,**options)
+        self.assertRaises(KeyboardInterrupt,average_towers_for_coverage,500,6,6,checkpoint = self.path,stats = Interrupted(5),**options)
+        self.assertEqual(resume_average_towers(self.path),expected)
+        self.assertEqual(resume_average_towers(self.path),expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from matplotlib import animation
+from coverage_recorder import CoverageRecorder, record_coverage, MOVIE_WRITERS
+from tower_coverage import iter_coverage
+
+class TestCoverageRecorder(unittest.TestCase):
+    '''
+    Used to make sure that the recorder writes the frames it should, without
+    a display.
+    Please run as main file!
+
+    This code tests the following from the coverage_recorder module.
+    - CoverageRecorder with a PNG sequence
+    - frame skipping with every and max_frames
+    - record_coverage()
+    - movie files, when a writer is installed
+
+    '''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_png_sequence(self):
+        '''
+        Tests that a frame is written for every accepted tower, and none at
+        the end since the last event already got one.
+        '''
+        np.random.seed(143)
+        path = os.path.join(self.folder,'step_%03d.png')
+        recorder = CoverageRecorder(10,10,path)
+        for event in iter_coverage(10,10,5,kinds = ('rejected','accepted')):
+            recorder.record(event)
+        self.assertEqual(recorder.frames,5)
+        self.assertEqual(recorder.finish(),5)
+        self.assertEqual(sorted(os.listdir(self.folder)),['step_%03d.png' % i for i in range(5)])
+        with open(recorder.paths[0],'rb') as image:
+            self.assertEqual(image.read(8),'\x89PNG\r\n\x1a\n')
+
+    def test_frame_skipping(self):
+        '''
+        Tests that every and max_frames bound the number of frames, and that
+        the final picture always gets a frame.
+        '''
+        np.random.seed(143)
+        path = os.path.join(self.folder,'step_%03d.png')
+        recorder = record_coverage(10,10,path,n = 10,every = 3)
+        self.assertEqual(recorder.events,10)
+        self.assertEqual(recorder.frames,4)
+
+        recorder = record_coverage(10,10,path,kinds = ('drawn','accepted'),every = 2,max_frames = 4)
+        self.assertEqual(recorder.frames,5)
+        self.assertTrue(recorder.events > 8)
+
+    def test_movie(self):
+        '''
+        Tests that a GIF is written when a writer is installed, and that asking
+        for one without a writer is caught up front.
+        '''
+        path = os.path.join(self.folder,'run.gif')
+        if any(animation.writers.is_available(name) for name in MOVIE_WRITERS['.gif']):
+            recorder = record_coverage(10,10,path,n = 4)
+            self.assertEqual(recorder.frames,4)
+            self.assertTrue(os.path.getsize(path) > 0)
+        else:
+            self.assertRaises(AssertionError,CoverageRecorder,10,10,path)
+        self.assertRaises(AssertionError,CoverageRecorder,10,10,os.path.join(self.folder,'step.png'))
+
+if __name__ == '__main__':
+    unittest.main()
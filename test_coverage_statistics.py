@@ -0,0 +1,99 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import random
+import unittest
+import numpy as np
+from coverage_statistics import CoverageStatistics, z_score
+from tower_coverage import average_towers_for_coverage
+
+class TestCoverageStatistics(unittest.TestCase):
+    '''
+    Used to make sure that the running statistics match the ones worked out
+    from the whole list of counts, and that the simulator stops when they say so.
+    Please run as main file!
+
+    This code tests the following from the coverage_statistics module.
+    - CoverageStatistics mean, variance and percentiles
+    - the bounded histogram
+    - z_score() and converged()
+    - average_towers_for_coverage() with early stopping
+
+    '''
+
+    def setUp(self):
+        '''
+        Sets up 2000 random tower counts with a fixed seed.
+        '''
+        rng = random.Random(143)
+        self.counts = [int(rng.gauss(300,40)) for i in range(2000)]
+
+    def test_moments(self):
+        '''
+        Tests the mean, variance and standard error against NumPy.
+        '''
+        stats = CoverageStatistics()
+        for count in self.counts:
+            stats.add(count)
+        self.assertEqual(stats.count,len(self.counts))
+        self.assertEqual(stats.mean,sum(self.counts) / float(len(self.counts)))
+        self.assertAlmostEqual(stats.variance,np.var(self.counts,ddof = 1),places = 6)
+        self.assertAlmostEqual(stats.standard_error,np.std(self.counts,ddof = 1) / np.sqrt(len(self.counts)),places = 9)
+        self.assertEqual((stats.minimum,stats.maximum),(min(self.counts),max(self.counts)))
+        self.assertEqual(CoverageStatistics().mean,None)
+
+    def test_percentiles(self):
+        '''
+        Tests that percentiles are exact while the bins have width 1, and
+        close once the histogram has had to merge bins.
+        '''
+        exact = CoverageStatistics()
+        small = CoverageStatistics(max_bins = 16)
+        for count in self.counts:
+            exact.add(count)
+            small.add(count)
+        for q in (0,5,25,50,75,95,100):
+            self.assertAlmostEqual(exact.percentile(q),np.percentile(self.counts,q))
+            self.assertTrue(abs(small.percentile(q) - np.percentile(self.counts,q)) <= small.bin_width)
+        self.assertEqual(exact.bin_width,1)
+        self.assertTrue(len(small.bins) <= 16)
+        self.assertEqual(sum(row[2] for row in small.histogram()),len(self.counts))
+        self.assertEqual(small.percentile(0),min(self.counts))
+
+    def test_converged(self):
+        '''
+        Tests z_score() and that converged() waits for min_iterations and
+        for every target given.
+        '''
+        self.assertAlmostEqual(z_score(0.95),1.959964,places = 5)
+        self.assertAlmostEqual(z_score(0.99),2.575829,places = 5)
+        stats = CoverageStatistics()
+        for count in self.counts[:100]:
+            stats.add(count)
+        width = stats.half_width()
+        self.assertFalse(stats.converged())
+        self.assertTrue(stats.converged(half_width = width * 1.01))
+        self.assertFalse(stats.converged(half_width = width * 0.99))
+        self.assertFalse(stats.converged(half_width = width * 1.01,min_iterations = 101))
+        self.assertTrue(stats.converged(relative_error = width * 1.01 / stats.mean))
+        self.assertFalse(stats.converged(relative_error = 1.0,half_width = width * 0.99))
+
+    def test_early_stopping(self):
+        '''
+        Tests that average_towers_for_coverage stops once the target is met,
+        with the same counts a full seeded run starts with.
+        '''
+        stats = CoverageStatistics()
+        average, counts = average_towers_for_coverage(500,6,6,seed = 143,return_counts = True,relative_error = 0.1,min_iterations = 10,stats = stats)
+        self.assertTrue(10 <= len(counts) < 500)
+        self.assertEqual(stats.count,len(counts))
+        self.assertEqual(average,stats.mean)
+        self.assertTrue(stats.half_width() <= 0.1 * average)
+        full = average_towers_for_coverage(len(counts) + 5,6,6,seed = 143,return_counts = True)[1]
+        self.assertEqual(counts,full[:len(counts)])
+
+        average, counts = average_towers_for_coverage(40,6,6,seed = 143,return_counts = True,workers = 2,half_width = 1.0,min_iterations = 10)
+        self.assertTrue(10 <= len(counts) <= 40)
+        self.assertEqual(counts,average_towers_for_coverage(len(counts),6,6,seed = 143,return_counts = True)[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from coverage_sweep import shape_grid, plan_sweep, iter_sweep, sweep_average_towers, SWEEP_COLUMNS
+from result_store import ResultStore
+from tower_coverage import iter_tower_counts
+
+class TestCoverageSweep(unittest.TestCase):
+    '''
+    Used to make sure that a sweep simulates each shape once, largest first,
+    and gets the same averages as the simulation run on its own.
+    Please run as main file!
+
+    This code tests the following from the coverage_sweep module.
+    - shape_grid() and plan_sweep()
+    - iter_sweep() with one and more workers, and with a store
+    - sweep_average_towers() writing a CSV file
+
+    '''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_plan(self):
+        '''
+        Tests that transposed shapes are planned once with the larger budget,
+        and that the largest shapes come first.
+        '''
+        shapes = shape_grid([4,8],[4,6,8])
+        self.assertEqual(shapes,[(4,4),(4,6),(4,8),(8,4),(8,6),(8,8)])
+        budgets = dict((shape,10) for shape in shapes)
+        budgets[(8,4)] = 20
+        plan = plan_sweep(shapes + [(4,6)],budgets)
+        self.assertEqual(plan,[(8,8,10,[(8,8)]),(8,6,10,[(8,6)]),(4,8,20,[(4,8),(8,4)]),(4,6,10,[(4,6)]),(4,4,10,[(4,4)])])
+        self.assertRaises(AssertionError,plan_sweep,[(4,0)],10)
+        self.assertRaises(AssertionError,plan_sweep,[(4,4)],{(4,6): 10})
+
+    def test_sweep(self):
+        '''
+        Tests that the rows match the seeded simulation of each shape, for any
+        number of workers, and that transposed shapes share a row.
+        '''
+        shapes = [(4,6),(6,4),(5,5)]
+        rows = sorted(iter_sweep(shapes,6,seed = 143),key = lambda row: (row['width'],row['height']))
+        self.assertEqual([(row['width'],row['height'],row['transposed']) for row in rows],[(4,6,False),(5,5,False),(6,4,True)])
+        for row in rows[:2]:
+            counts = list(iter_tower_counts(6,row['width'],row['height'],seed = 143))
+            self.assertEqual(row['average'],sum(counts) / 6.0)
+            self.assertEqual((row['iterations'],row['minimum'],row['maximum']),(6,min(counts),max(counts)))
+        self.assertEqual(rows[0]['average'],rows[2]['average'])
+        parallel = sorted(iter_sweep(shapes,6,workers = 2,seed = 143),key = lambda row: (row['width'],row['height']))
+        for row in parallel + rows:
+            row.pop('seconds')
+        self.assertEqual(parallel,rows)
+
+    def test_store(self):
+        '''
+        Tests that a sweep with a store adds to it and reads back from it.
+        '''
+        store = ResultStore(':memory:')
+        first = list(iter_sweep([(5,4)],4,seed = 143,store = store))
+        self.assertEqual(store.counts(5,4,143),list(iter_tower_counts(4,5,4,seed = 143)))
+        second = list(iter_sweep([(4,5),(5,4)],8,seed = 143,store = store))
+        self.assertEqual(store.counts(5,4,143),list(iter_tower_counts(8,5,4,seed = 143)))
+        self.assertEqual(second[0]['iterations'],8)
+        self.assertRaises(AssertionError,list,iter_sweep([(5,4)],4,store = store))
+
+    def test_csv(self):
+        '''
+        Tests that sweep_average_towers writes a row per shape to the CSV file.
+        '''
+        path = os.path.join(self.folder,'sweep.csv')
+        rows = sweep_average_towers([(4,4),(3,5),(5,3)],3,csv_path = path,seed = 143)
+        self.assertEqual([(row['width'],row['height']) for row in rows],[(3,5),(4,4),(5,3)])
+        with open(path,'rb') as f:
+            written = list(csv.DictReader(f))
+        self.assertEqual(len(written),3)
+        self.assertEqual(tuple(csv.reader(open(path,'rb')).next()),SWEEP_COLUMNS)
+        self.assertEqual(sorted(float(row['average']) for row in written),sorted(row['average'] for row in rows))
+
+if __name__ == '__main__':
+    unittest.main()
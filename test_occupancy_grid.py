@@ -0,0 +1,58 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import random
+import unittest
+import numpy as np
+from tower_class import tower
+from occupancy_grid import OccupancyGrid
+
+class TestOccupancyGrid(unittest.TestCase):
+    '''
+    Used to make sure that the occupancy grid keeps its summed-area table
+    in step with the covered cells.
+    Please run as main file!
+
+    This code tests the following methods from the OccupancyGrid class.
+    - add()
+    - covered_cells()
+    - state()
+
+    '''
+
+    def test_add(self):
+        '''
+        Tests that adding overlapping towers only counts newly covered cells
+        and that the summed-area table matches one built from scratch.
+        '''
+        grid = OccupancyGrid(10,8)
+        self.assertEqual(grid.add(tower((0,0),4,4)),16)
+        self.assertEqual(grid.add(tower((2,2),4,4)),12)
+        self.assertEqual(grid.add(tower((3,3),1,1)),0)
+        self.assertEqual(grid.covered_area,28)
+
+        rng = random.Random(143)
+        for i in range(50):
+            x = rng.randint(0,9)
+            y = rng.randint(0,7)
+            grid.add(tower((x,y),rng.randint(1,10 - x),rng.randint(1,8 - y)))
+            table = np.zeros((9,11),dtype = np.int64)
+            table[1:,1:] = np.cumsum(np.cumsum(grid.cells,axis = 0),axis = 1)
+            self.assertTrue(np.array_equal(grid.table,table))
+            self.assertEqual(grid.covered_area,int(grid.cells.sum()))
+
+    def test_state(self):
+        '''
+        Tests that towers are reported as free, covered or partially covered.
+        '''
+        grid = OccupancyGrid(10,10)
+        grid.add(tower((2,2),4,4))
+
+        self.assertEqual(grid.state(tower((6,2),2,2)),'free')
+        self.assertEqual(grid.state(tower((3,3),2,3)),'covered')
+        self.assertEqual(grid.state(tower((1,1),2,2)),'partial')
+        self.assertEqual(grid.covered_cells(tower((1,1),2,2)),1)
+        self.assertTrue(grid.is_free(tower((0,0),2,2)))
+        self.assertTrue(grid.is_covered(tower((2,2),4,4)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import unittest
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from tower_class import tower
+from tower_array import TowerArray
+from plotting_code_proj import plot_towers, plot_tower_collection, validate_towers, LivePlot, RASTERIZE_ABOVE
+from tower_benchmarks import validate_by_characters, random_plot_list
+from tower_coverage import coverage_up_to_n
+
+class TestPlotting(unittest.TestCase):
+    '''
+    Used to make sure that the plotting functions draw the towers they are
+    given. Uses the Agg backend so no display is needed.
+    Please run as main file!
+
+    This code tests the following from plotting_code_proj.py.
+    - plot_towers()
+    - validate_towers()
+    - plot_tower_collection()
+    - LivePlot
+    - coverage_up_to_n() with plot set to True
+
+    '''
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_plot_towers(self):
+        '''
+        Tests that every tower gets a patch and that bad colors and hatches
+        are caught.
+        '''
+        towers = [[tower((1,1),2,3),'#0000ff',None,True],[tower((4,4),2,2),None,'/',False]]
+        plot_towers(towers,10,10)
+        self.assertEqual(len(plt.gca().patches),2)
+        self.assertRaises(AssertionError,plot_towers,[[tower((1,1),2,3),'#0000fg',None,True]],10,10)
+        self.assertRaises(AssertionError,plot_towers,[[tower((1,1),2,3),None,'#',True]],10,10)
+
+    def test_validate_towers(self):
+        '''
+        Tests that validate_towers accepts and rejects the same lists as the
+        character by character validation it replaced, apart from colors with
+        a '#' after the first character, which only validate_towers rejects,
+        and that plot_towers can skip it.
+        '''
+        t = tower((1,1),2,3)
+        good = random_plot_list(50) + [[t,'#abcdef','\\',True],[t,'#ABCDEF','*',False]]
+        validate_towers(good)
+        validate_by_characters(good)
+        for bad in ([t,'#0000fg',None,True],[t,'0000ff0',None,True],[t,'#0000f',None,True],
+                    [t,None,'#',True],[t,None,'//',True],[t,None,None,1],['tower',None,None,True]):
+            self.assertRaises(AssertionError,validate_towers,good + [bad])
+            self.assertRaises(AssertionError,validate_by_characters,good + [bad])
+        self.assertRaises(AssertionError,validate_towers,[[t,['#','0','0','0','0','0','0'],None,True]])
+        #'#' is one of the characters the old validation allows anywhere.
+        for color in ('#12345#','##12345'):
+            self.assertRaises(AssertionError,validate_towers,good + [[t,color,None,True]])
+            validate_by_characters(good + [[t,color,None,True]])
+        self.assertRaises(AssertionError,validate_towers,[[t,None,None]])
+        plot_towers(good,100,100,validate = False)
+        self.assertEqual(len(plt.gca().patches),len(good))
+
+    def test_tower_collection(self):
+        '''
+        Tests that plot_tower_collection draws every tower with its own color,
+        one collection per hatch type, from each kind of input.
+        '''
+        towers = [tower((1,1),2,3),tower((4,4),2,2),tower((0,6),5,1)]
+        packets = [[towers[0],'#0000FF',None,True],[towers[1],None,'/',False],[towers[2],'#FF0000',None,True]]
+        collections = plot_tower_collection(packets,10,10)
+        self.assertEqual(len(collections),2)
+        self.assertEqual(len(collections[0].get_paths()),2)
+        self.assertEqual(list(collections[0].get_facecolors()[1]),[1.0,0.0,0.0,1.0])
+        self.assertEqual(collections[1].get_hatch(),'/')
+        self.assertEqual(collections[1].get_facecolors()[0][3],0.0)
+        self.assertEqual(collections[1].get_paths()[0].vertices[:4].tolist(),[[4,4],[6,4],[6,6],[4,6]])
+        self.assertFalse(collections[0].get_rasterized())
+        
+        ax = plt.figure().add_subplot(111)
+        array = TowerArray.from_towers(towers * (RASTERIZE_ABOVE // 3 + 1))
+        collections = plot_tower_collection(array,10,10,colors = '#00FF00',ax = ax)
+        self.assertEqual(ax.collections,collections)
+        self.assertTrue(collections[0].get_rasterized())
+        self.assertEqual(len(plot_tower_collection(towers,10,10,hatches = ['x','x','+'])),2)
+        self.assertRaises(AssertionError,plot_tower_collection,towers,10,10,colors = ['#00FF00'])
+        self.assertRaises(AssertionError,plot_tower_collection,towers,10,10,colors = '#00FF0G')
+
+    def test_live_plot(self):
+        '''
+        Tests that towers added to a LivePlot stay on the same figure and that
+        moving towers are taken off again, with and without blitting.
+        '''
+        for blit in (False,True):
+            live = LivePlot(10,10,blit = blit)
+            self.assertEqual(live.blit,blit)
+            live.add(tower((1,1),2,3),'#0000FF',None,True)
+            for x in range(5):
+                trying = live.add(tower((x,5),2,2),None,'/',False,moving = True)
+                live.draw()
+                live.remove(trying)
+            live.draw()
+            self.assertEqual(len(live.ax.patches),1)
+            self.assertEqual(live.frames,6)
+            self.assertRaises(AssertionError,live.add,tower((1,1),1,1),'blue')
+            live.close()
+
+    def test_coverage_plot(self):
+        '''
+        Tests that plotting a simulation uses a single figure holding the
+        towers placed, and places the same towers as not plotting.
+        '''
+        np.random.seed(143)
+        expected = coverage_up_to_n(5,10,10,plot = False)[0]
+        np.random.seed(143)
+        valid_towers, areas, plot_list = coverage_up_to_n(5,10,10,plot = True,interval = 0.001,blit = True)
+        self.assertEqual(valid_towers,expected)
+        self.assertEqual(len(plot_list),5)
+        self.assertEqual(len(plt.get_fignums()),1)
+        self.assertEqual(len(plt.gcf().axes[0].patches),5)
+
+if __name__ == '__main__':
+    unittest.main()
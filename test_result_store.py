@@ -0,0 +1,114 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from result_store import ResultStore, SIMULATION_VERSION
+from tower_coverage import average_towers_for_coverage, iter_tower_counts
+
+class TestResultStore(unittest.TestCase):
+    '''
+    Used to make sure that stored runs are read back as they were written, and
+    that a simulation with a store gives the same result as one without.
+    Please run as main file!
+
+    This code tests the following from the result_store module.
+    - ResultStore counts(), append(), statistics() and runs()
+    - keeping runs with different keys apart
+    - average_towers_for_coverage() with a store
+    - average_towers_for_coverage() without a store keeping no counts
+
+    '''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder,'results.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_append(self):
+        '''
+        Tests that counts are kept in order across appends and reopening the
+        file, and that gaps are caught.
+        '''
+        store = ResultStore(self.path)
+        self.assertEqual(store.counts(8,8,143),[])
+        self.assertEqual(store.append(8,8,143,[20,22,21],0),3)
+        self.assertEqual(store.append(8,8,143,[25],3),4)
+        self.assertRaises(AssertionError,store.append,8,8,143,[30],5)
+        self.assertRaises(AssertionError,store.append,8,8,None,[30],0)
+        store.close()
+
+        store = ResultStore(self.path)
+        self.assertEqual(store.counts(8,8,143),[20,22,21,25])
+        self.assertEqual(store.statistics(8,8,143).mean,22.0)
+        run = store.runs()[0]
+        self.assertEqual((run['width'],run['height'],run['sampler'],run['seed'],run['version']),(8,8,'uniform',143,SIMULATION_VERSION))
+        self.assertEqual((run['iterations'],run['mean'],run['minimum'],run['maximum']),(4,22.0,20,25))
+        self.assertAlmostEqual(run['variance'],14 / 3.0)
+        self.assertEqual(store.counts(8,8,143,version = SIMULATION_VERSION + 1),[])
+        store.close()
+
+    def test_keys(self):
+        '''
+        Tests that runs differing in any part of the key are kept apart.
+        '''
+        store = ResultStore(':memory:')
+        store.append(8,8,143,[20],0)
+        store.append(8,6,143,[21],0)
+        store.append(8,8,144,[22],0)
+        store.append(8,8,143,[23],0,sampler = 'free')
+        store.append(8,8,143,[24],0,batch_size = 16)
+        self.assertEqual(store.counts(8,8,143),[20])
+        self.assertEqual(store.counts(8,6,143),[21])
+        self.assertEqual(store.counts(8,8,144),[22])
+        self.assertEqual(store.counts(8,8,143,'free'),[23])
+        self.assertEqual(store.counts(8,8,143,batch_size = 16),[24])
+        self.assertEqual(len(store.runs()),5)
+        self.assertEqual(store.statistics(6,6,143).count,0)
+
+    def test_average(self):
+        '''
+        Tests that a simulation with a store reads back the iterations it has,
+        simulates only the rest, and gets the same result as one without.
+        '''
+        store = ResultStore(self.path)
+        expected = list(iter_tower_counts(12,6,6,seed = 143))
+        average, counts = average_towers_for_coverage(5,6,6,seed = 143,return_counts = True,store = store)
+        self.assertEqual(counts,expected[:5])
+        self.assertEqual(store.counts(6,6,143),expected[:5])
+
+        average, counts = average_towers_for_coverage(12,6,6,seed = 143,return_counts = True,store = store,workers = 2)
+        self.assertEqual(counts,expected)
+        self.assertEqual(average,sum(expected) / 12.0)
+        self.assertEqual(store.counts(6,6,143),expected)
+
+        #Everything asked for is stored, so nothing is simulated or added.
+        average, counts = average_towers_for_coverage(3,6,6,seed = 143,return_counts = True,store = store,occupancy = True)
+        self.assertEqual(counts,expected[:3])
+        self.assertEqual(store.runs()[0]['iterations'],12)
+        self.assertRaises(AssertionError,average_towers_for_coverage,3,6,6,store = store)
+
+    def test_no_store(self):
+        '''
+        Tests that without a store the counts are not kept for one, so memory
+        does not grow with the number of iterations.
+        '''
+        kept = {}
+        def profile(frame,event,argument):
+            if (event == 'return') and (frame.f_code is average_towers_for_coverage.__code__):
+                kept.update(frame.f_locals)
+        sys.setprofile(profile)
+        try:
+            average_towers_for_coverage(20,6,6,seed = 143)
+        finally:
+            sys.setprofile(None)
+        self.assertEqual(kept['counter'],20)
+        self.assertEqual(kept['new_counts'],[])
+        self.assertEqual(kept['number_of_towers'],[])
+
+if __name__ == '__main__':
+    unittest.main()
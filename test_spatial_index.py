@@ -0,0 +1,99 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import random
+import unittest
+from tower_class import tower
+from spatial_index import GridIndex, RTreeIndex, ArrayIndex, make_index
+
+class TestSpatialIndex(unittest.TestCase):
+    '''
+    Used to make sure that the spatial indexes return the same towers as
+    checking every placed tower one by one.
+    Please run as main file!
+
+    This code tests the following from the spatial_index module.
+    - GridIndex
+    - RTreeIndex
+    - ArrayIndex
+    - make_index()
+
+    '''
+
+    def setUp(self):
+        '''
+        Sets up 300 randomly placed towers in a 60x40 region and 200 random
+        query towers, using a fixed seed.
+        '''
+        rng = random.Random(143)
+        self.width = 60
+        self.height = 40
+        self.placed = []
+        self.queries = []
+        for i in range(300):
+            self.placed.append(self.random_tower(rng))
+        for i in range(200):
+            self.queries.append(self.random_tower(rng))
+
+    def random_tower(self,rng):
+        '''
+        Returns a random tower inside the region.
+        '''
+        x = rng.randint(0,self.width - 1)
+        y = rng.randint(0,self.height - 1)
+        width = rng.randint(1,min(12,self.width - x))
+        height = rng.randint(1,min(12,self.height - y))
+        return tower((x,y),width,height)
+
+    def brute_force(self,t):
+        '''
+        Returns the placed towers that overlap t by checking all of them.
+        '''
+        return [t_i for t_i in self.placed if t_i.overlap(t) is not None]
+
+    def check_index(self,index):
+        '''
+        Inserts the placed towers into index and checks every query against
+        the brute force answer.
+        '''
+        for t in self.placed:
+            index.insert(t)
+        self.assertEqual(len(index),len(self.placed))
+        for t in self.queries:
+            self.assertEqual(index.query(t),self.brute_force(t))
+
+    def test_grid_index(self):
+        '''
+        Tests GridIndex with the default bucket size and with one bucket per cell.
+        '''
+        self.check_index(GridIndex(self.width,self.height))
+        self.check_index(GridIndex(self.width,self.height,cell_size = 1))
+
+    def test_rtree_index(self):
+        '''
+        Tests RTreeIndex with the default node size and the smallest node size.
+        '''
+        self.check_index(RTreeIndex())
+        self.check_index(RTreeIndex(max_entries = 4))
+
+    def test_array_index(self):
+        '''
+        Tests ArrayIndex, starting small enough that its arrays have to grow.
+        '''
+        self.check_index(ArrayIndex(capacity = 1))
+
+    def test_touching_towers(self):
+        '''
+        Tests that towers which only share a wall or a corner are not returned,
+        and that towers containing or contained by the query are.
+        '''
+        for kind in ('grid','rtree','array'):
+            index = make_index(kind,10,10)
+            grey_box = tower((2,2),4,4)
+            index.insert(grey_box)
+            self.assertEqual(index.query(tower((6,2),2,2)),[])
+            self.assertEqual(index.query(tower((6,6),2,2)),[])
+            self.assertEqual(index.query(tower((3,3),1,1)),[grey_box])
+            self.assertEqual(index.query(tower((0,0),10,10)),[grey_box])
+
+if __name__ == '__main__':
+    unittest.main()
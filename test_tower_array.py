@@ -0,0 +1,102 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import random
+import unittest
+from tower_class import tower
+from tower_array import TowerArray
+
+class TestTowerArray(unittest.TestCase):
+    '''
+    Used to make sure that the TowerArray methods give the same answers as
+    the tower methods they vectorize.
+    Please run as main file!
+
+    This code tests the following methods from the TowerArray class.
+    - from_towers() and to_towers()
+    - contained()
+    - corner()
+    - borders()
+    - equals()
+    - overlap()
+    - from_block() and clear_of()
+    - tower.truncate() with a TowerArray
+
+    '''
+
+    def setUp(self):
+        '''
+        Sets up 80 randomly placed towers using a fixed seed, which cover
+        every way two towers can touch or overlap.
+        '''
+        rng = random.Random(143)
+        self.towers = []
+        for i in range(80):
+            self.towers.append(tower((rng.randint(0,8),rng.randint(0,8)),rng.randint(1,5),rng.randint(1,5)))
+        self.array = TowerArray.from_towers(self.towers)
+
+    def test_round_trip(self):
+        '''
+        Tests that towers come back out of a TowerArray unchanged.
+        '''
+        self.assertEqual(self.array.to_towers(),self.towers)
+        self.assertEqual(self.array[5],self.towers[5])
+        self.assertEqual(self.array[2:7].to_towers(),self.towers[2:7])
+
+    def test_one_versus_many(self):
+        '''
+        Tests every tower in the array against single towers.
+        '''
+        for other in self.towers[:20]:
+            contained = self.array.contained(other)
+            corner = self.array.corner(other)
+            borders = self.array.borders(other)
+            equals = self.array.equals(other)
+            overlaps, mask = self.array.overlap(other)
+            self.assertEqual(overlaps.to_towers(),[t.overlap(other) for t in self.towers if t.overlap(other) is not None])
+            for i,t in enumerate(self.towers):
+                self.assertEqual(list(contained[i]),t.contained(other))
+                self.assertEqual(list(corner[i]),t.corner(other))
+                self.assertEqual(list(borders[i]),t.borders(other))
+                self.assertEqual(equals[i],t == other)
+                self.assertEqual(mask[i],t.overlap(other) is not None)
+
+    def test_many_versus_many(self):
+        '''
+        Tests every pair of towers in the array at once.
+        '''
+        contained = self.array.contained(self.array)
+        corner = self.array.corner(self.array)
+        borders = self.array.borders(self.array)
+        self.assertEqual(borders.shape,(80,80,4))
+        for i,t in enumerate(self.towers):
+            for j,other in enumerate(self.towers):
+                self.assertEqual(list(contained[i,j]),t.contained(other))
+                self.assertEqual(list(corner[i,j]),t.corner(other))
+                self.assertEqual(list(borders[i,j]),t.borders(other))
+
+    def test_clear_of(self):
+        '''
+        Tests that clear_of gives the same answer as checking corner() and
+        borders() against every blocking tower one by one.
+        '''
+        block = [[t.coord_ll[0],t.coord_ll[1],t.width,t.height] for t in self.towers]
+        array = TowerArray.from_block(block)
+        self.assertEqual(array.to_towers(),self.towers)
+        for start in range(0,40,5):
+            other = self.towers[start:start+3]
+            clear = array.clear_of(other)
+            for i,t in enumerate(self.towers):
+                expected = not any(any(t.corner(o)) or any(t.borders(o)) for o in other)
+                self.assertEqual(clear[i],expected)
+        self.assertTrue(array.clear_of([]).all())
+
+    def test_truncate(self):
+        '''
+        Tests that truncating against a TowerArray gives the same tower as
+        truncating against the list.
+        '''
+        for t in self.towers[:20]:
+            self.assertEqual(t.truncate(self.array),t.truncate(self.towers))
+
+if __name__ == '__main__':
+    unittest.main()
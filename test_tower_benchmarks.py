@@ -0,0 +1,86 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import os
+import tempfile
+import unittest
+from tower_benchmarks import benchmark_truncate, peak_memory, suite_cases, run_case, run_suite, save_baseline, load_baseline, compare_to_baseline
+
+class TestTowerBenchmarks(unittest.TestCase):
+    '''
+    Used to make sure that the benchmark suite runs and compares baselines
+    properly. It does not check how fast anything is.
+    Please run as main file!
+
+    This code tests the following from the tower_benchmarks module.
+    - suite_cases()
+    - run_case()
+    - run_suite()
+    - save_baseline() and load_baseline()
+    - compare_to_baseline()
+    - benchmark_truncate() with other seeds
+
+    '''
+
+    def test_run_case(self):
+        '''
+        Tests that every quick case runs and that a case's result holds its
+        time, throughput and peak memory, also when run without forking.
+        '''
+        cases = suite_cases(quick = True)
+        names = [case['name'] for case in cases]
+        self.assertEqual(len(set(names)),len(names))
+        for case in cases:
+            case['run']()
+
+        result = run_case(cases[0],repeat = 1,target = 0.001)
+        self.assertTrue(result['seconds'] > 0)
+        self.assertAlmostEqual(result['per_second'],cases[0]['work'] / result['seconds'])
+        if peak_memory() is None:
+            self.assertEqual(result['peak_rss_kb'],None)
+        else:
+            self.assertTrue(result['peak_rss_kb'] > 0)
+
+        #As on Windows, where the cases can not be sent to a spawned process.
+        result = run_case(cases[0],repeat = 1,target = 0.001,fork = False)
+        self.assertTrue(result['seconds'] > 0)
+        self.assertEqual(result['peak_rss_kb'],None)
+
+    def test_benchmark_truncate(self):
+        '''
+        Tests that the truncate benchmark checks its results against the
+        subtower search for seeds whose blocking towers sit inside t.
+        '''
+        for seed in (5,6,7,11,12):
+            results = benchmark_truncate((10,20),repeat = 1,seed = seed)
+            self.assertEqual([row['size'] for row in results],[10,20])
+            self.assertTrue(results[1]['subtowers'] > 0)
+
+    def test_baseline(self):
+        '''
+        Tests that a saved baseline loads back the same, and that cases are
+        marked slower, faster, the same or new when compared with it.
+        '''
+        run = run_suite(quick = True,repeat = 1,target = 0.001,select = 'overlap')
+        self.assertEqual(sorted(run['results']),['overlap size=10','overlap size=1000'])
+
+        handle,path = tempfile.mkstemp(suffix = '.json')
+        os.close(handle)
+        try:
+            save_baseline(run,path)
+            baseline = load_baseline(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(sorted(baseline['results']),sorted(run['results']))
+
+        baseline['results']['overlap size=10']['seconds'] = run['results']['overlap size=10']['seconds'] / 2
+        baseline['results']['overlap size=1000']['seconds'] = run['results']['overlap size=1000']['seconds']
+        run['results']['new case'] = {'seconds': 1.0}
+        rows = compare_to_baseline(run,baseline,tolerance = 0.2)
+        self.assertEqual([row['status'] for row in rows],['new','slower','same'])
+        self.assertAlmostEqual(rows[1]['ratio'],2.0)
+
+        baseline['results']['overlap size=10']['seconds'] = run['results']['overlap size=10']['seconds'] * 2
+        self.assertEqual(compare_to_baseline(run,baseline)[1]['status'],'faster')
+
+if __name__ == '__main__':
+    unittest.main()
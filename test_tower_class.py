@@ -1,7 +1,13 @@
 #Author: Humberto Hernandez
 #Last updated: 5/19/2018 7:44pm
+import pickle
+import random
+import subprocess
+import sys
 import unittest
-from tower_class import tower
+from tower_class import tower, _trusted
+from tower_reference import overlap_by_subtowers, truncate_by_subtowers, truncate_by_blocks
+from simulation_metrics import SimulationMetrics
 
 class TestTowerClass(unittest.TestCase):
     '''
@@ -15,12 +21,17 @@ class TestTowerClass(unittest.TestCase):
     
     This code tests the following methods from the tower class.
     - __eq__
+    - __hash__
     - contained()
     - corner()
     - borders()
     - overlap()
     - subtowers()
+    - subtower_shapes()
+    - subtower_blocks()
     - truncate()
+    - truncate() and subtowers() with metrics
+    - _trusted() and the unchecked method variants
     
     '''
     
@@ -47,6 +58,29 @@ class TestTowerClass(unittest.TestCase):
         result = t_test == self.t1
         self.assertEqual(result,True)
         
+    def test___hash__(self):
+        '''
+        Tests the __hash__ method from the tower class, along with the precomputed
+        corners and walls and the fact that towers can't be changed.
+        
+        Test is, do equivalent towers have the same hash so they can be used in
+        sets and as dictionary keys, and do they survive being pickled?
+        '''
+        t_test = tower((2,2),4,6)
+        self.assertEqual(hash(t_test),hash(self.t1))
+        self.assertEqual(len(set([t_test,self.t1,self.t2])),2)
+        self.assertEqual({self.t1: 'grey'}[t_test],'grey')
+        self.assertEqual(t_test != self.t1,False)
+        self.assertEqual(t_test != self.t2,True)
+        self.assertEqual(t_test != None,True)
+        
+        self.assertEqual((t_test.x0,t_test.y0,t_test.x1,t_test.y1),(2,2,6,8))
+        self.assertEqual((t_test.coord_lr,t_test.coord_tl,t_test.coord_tr),((6,2),(2,8),(6,8)))
+        self.assertEqual(t_test.area,24)
+        self.assertRaises(AttributeError,setattr,t_test,'width',5)
+        self.assertEqual(hasattr(t_test,'__dict__'),False)
+        self.assertEqual(pickle.loads(pickle.dumps(t_test,2)),t_test)
+        
     def test_contained(self):
         '''
         Tests the contained method from the tower class.
@@ -200,6 +234,21 @@ class TestTowerClass(unittest.TestCase):
         
         self.assertEqual(dash_box,None)
         
+    def test_overlap_matches_subtower_search(self):
+        '''
+        Tests that the closed-form overlap method gives the same tower as
+        searching the subtowers for the largest one contained in the other tower.
+        
+        Every placement of a 2x3 tower around a 3x3 tower is checked, including
+        towers that only share a wall or corner.
+        '''
+        grey_box = tower((2,2),3,3)
+        for x in range(7):
+            for y in range(7):
+                slash_box = tower((x,y),2,3)
+                self.assertEqual(slash_box.overlap(grey_box),overlap_by_subtowers(slash_box,grey_box))
+                self.assertEqual(grey_box.overlap(slash_box),overlap_by_subtowers(grey_box,slash_box))
+        
     def test_subtowers(self):
         '''
         Tests for the subtowers() method found in the tower class.
@@ -447,6 +496,25 @@ class TestTowerClass(unittest.TestCase):
             
         
         
+    def test_subtower_blocks(self):
+        '''
+        Tests that the shapes come largest first and that the blocks hold the
+        same subtowers as subtowers(), in the same order, for several block sizes.
+        '''
+        t = tower((3,1),5,4)
+        shapes = list(t.subtower_shapes())
+        self.assertEqual(sorted(shapes),[(w,h) for w in range(1,6) for h in range(1,5)])
+        areas = [w*h for w,h in shapes]
+        self.assertEqual(areas,sorted(areas,reverse = True))
+        
+        subtowers = list(t.subtowers())
+        for block_size in (1,7,len(subtowers),4096):
+            blocks = list(t.subtower_blocks(block_size))
+            for block in blocks[:-1]:
+                self.assertEqual(block.shape,(block_size,4))
+            rows = [row for block in blocks for row in block.tolist()]
+            self.assertEqual([tower((x,y),w,h) for x,y,w,h in rows],subtowers)
+        
     def test_truncate(self):
         '''
         Tests the truncate method from the tower class.
@@ -503,6 +571,87 @@ class TestTowerClass(unittest.TestCase):
         self.assertEqual(dash_box.width,2)
         self.assertEqual(dash_box.height,4)
         
+    def test_truncate_matches_subtower_search(self):
+        '''
+        Tests that the truncate method finds a truncated tower with the same
+        area as searching the subtowers with the corner and borders methods.
+        
+        Uses a fixed set of randomly placed blocking towers around a 6x6 tower.
+        Blocking towers with a corner strictly inside t are left out. Truncate
+        treats a blocking tower sitting strictly inside a subtower as overlapping
+        it, while the subtower search does not.
+        '''
+        rng = random.Random(143)
+        t = tower((2,2),6,6)
+        for trial in range(200):
+            other = []
+            for i in range(rng.randint(1,4)):
+                blocking = tower((rng.randint(0,9),rng.randint(0,9)),rng.randint(1,4),rng.randint(1,4))
+                if not any(blocking.corner(t)):
+                    other.append(blocking)
+            truncated = t.truncate(other)
+            reference = truncate_by_subtowers(t,other)
+            self.assertEqual(truncate_by_blocks(t,other,block_size = 7),reference)
+            if reference is None:
+                self.assertEqual(truncated,None)
+            else:
+                self.assertEqual(truncated.area,reference.area)
+                for blocking in other:
+                    self.assertEqual(truncated.overlap(blocking),None)
+    
+    def test_metrics(self):
+        '''
+        Tests that truncate and subtowers count their work when given metrics,
+        and give the same answers as without.
+        '''
+        metrics = SimulationMetrics()
+        t = tower((0,0),5,5)
+        other = [tower((1,1),2,2),tower((3,0),1,1)]
+        self.assertEqual(t.truncate(other,metrics),t.truncate(other))
+        self.assertEqual(t.truncate([],metrics),t)
+        self.assertEqual(metrics.truncate_calls,2)
+        self.assertEqual(metrics.truncate_blockers,2)
+        self.assertTrue(metrics.truncate_candidates > 0)
+        
+        self.assertEqual(list(self.t2.subtowers(metrics)),list(self.t2.subtowers()))
+        self.assertEqual(metrics.subtowers_calls,1)
+        self.assertEqual(metrics.subtowers_yielded,len(list(self.t2.subtowers())))
+    
+    def test_trusted(self):
+        '''
+        Tests that _trusted() and the unchecked variants give the same towers
+        and answers as the checked ones, and that the checks on user input are
+        still made when Python runs with -O.
+        '''
+        rng = random.Random(143)
+        for i in range(100):
+            x,y,w,h = rng.randint(0,8),rng.randint(0,8),rng.randint(1,5),rng.randint(1,5)
+            t = _trusted(x,y,w,h)
+            other = tower((rng.randint(0,8),rng.randint(0,8)),rng.randint(1,5),rng.randint(1,5))
+            checked = tower((x,y),w,h)
+            self.assertEqual(t,checked)
+            self.assertEqual(hash(t),hash(checked))
+            for name in tower.__slots__:
+                self.assertEqual(getattr(t,name),getattr(checked,name))
+            self.assertEqual(t._contained(other),t.contained(other))
+            self.assertEqual(t._corner(other),t.corner(other))
+            self.assertEqual(t._borders(other),t.borders(other))
+            self.assertEqual(t._truncate([other]),t.truncate([other]))
+        self.assertRaises(AttributeError,setattr,_trusted(0,0,1,1),'width',5)
+        
+        script = ('from tower_class import tower\n'
+                  'for args in [((0,0),0,1),((0,0),1.5,1),([0,0],1,1)]:\n'
+                  '    try:\n'
+                  '        tower(*args)\n'
+                  '    except AssertionError:\n'
+                  '        continue\n'
+                  '    raise SystemExit(1)\n'
+                  'try:\n'
+                  '    tower((0,0),1,1).truncate([None])\n'
+                  'except AssertionError:\n'
+                  '    raise SystemExit(0)\n'
+                  'raise SystemExit(1)\n')
+        self.assertEqual(subprocess.call([sys.executable,'-O','-c',script]),0)
 
 if __name__ == '__main__':
     unittest.main()
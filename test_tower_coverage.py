@@ -0,0 +1,233 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import unittest
+import numpy as np
+from tower_class import tower
+from tower_coverage import CoverageState, coverage_up_to_n, average_towers_for_coverage, iter_tower_counts
+from tower_coverage import iter_coverage
+from tower_sampling import CandidateSampler, FreeSpaceSampler
+from occupancy_grid import OccupancyGrid
+from simulation_metrics import SimulationMetrics
+
+class TestTowerCoverage(unittest.TestCase):
+    '''
+    Used to make sure that the coverage simulations are working properly.
+    Please run in the same directory containing the following files.
+    Please run as main file!
+
+    - plotting_code_proj.py
+    - tower_class.py
+    - tower_coverage.py
+
+    This code tests the following from the tower_coverage module.
+    - CoverageState
+    - coverage_up_to_n()
+    - average_towers_for_coverage()
+    - iter_tower_counts()
+    - iter_coverage()
+    - SimulationMetrics from the simulation_metrics module
+    - CandidateSampler and FreeSpaceSampler from the tower_sampling module
+
+    '''
+
+    def test_coverage_state(self):
+        '''
+        Tests that the coverage state adds up areas and towers as they are
+        accepted, and goes back to empty when reset.
+        '''
+        state = CoverageState(10,10)
+        state.add(tower((0,0),5,4))
+        state.add(tower((5,0),5,4))
+
+        self.assertEqual(state.covered_area,40)
+        self.assertEqual(state.free_area,60)
+        self.assertEqual(state.tower_count,2)
+        self.assertEqual(state.fraction,0.4)
+        self.assertEqual(state.is_full,False)
+
+        state.add(tower((0,4),10,6))
+        self.assertEqual(state.is_full,True)
+
+        state.reset()
+        self.assertEqual(state.covered_area,0)
+        self.assertEqual(state.tower_count,0)
+
+    def test_coverage_up_to_n(self):
+        '''
+        Tests that the towers placed do not overlap, that the area returned
+        matches them, and that the coverage state follows the run.
+        '''
+        np.random.seed(143)
+        state = CoverageState(20,20)
+        valid_towers, areas, plot_list = coverage_up_to_n(15,20,20,plot = False,state = state)
+
+        self.assertEqual(len(valid_towers),state.tower_count)
+        self.assertEqual(areas,(400,sum(t.area for t in valid_towers)))
+        self.assertEqual(areas[1],state.covered_area)
+        for i,t in enumerate(valid_towers):
+            for t_i in valid_towers[i+1:]:
+                self.assertEqual(t.overlap(t_i),None)
+
+    def test_average_towers_for_coverage(self):
+        '''
+        Tests that each iteration fills the coverage area and that the same
+        seed gives the same average with every index and with the occupancy grid.
+        '''
+        state = CoverageState(8,8)
+        averages = []
+        for index in ('grid','rtree'):
+            for occupancy in (False,True):
+                np.random.seed(143)
+                averages.append(average_towers_for_coverage(3,8,8,index = index,occupancy = occupancy,state = state))
+                self.assertEqual(state.is_full,True)
+
+        self.assertEqual(len(set(averages)),1)
+
+    def test_iter_coverage(self):
+        '''
+        Tests that the events follow the simulation, that they accept the same
+        towers as coverage_up_to_n(), and that a consumer can stop early.
+        '''
+        np.random.seed(143)
+        valid_towers, areas, plot_list = coverage_up_to_n(15,20,20,plot = False)
+
+        np.random.seed(143)
+        events = list(iter_coverage(20,20,15))
+        accepted = [event for event in events if event.kind == 'accepted']
+        self.assertEqual([event.tower for event in accepted],valid_towers)
+        self.assertEqual(accepted[-1].fraction,areas[1] / 400.0)
+        self.assertTrue(len([event for event in events if event.kind == 'drawn']) <= events[-1].attempts)
+        for i,event in enumerate(events):
+            if event.kind == 'drawn':
+                self.assertIn(events[i+1].kind,('rejected','truncated','accepted'))
+                self.assertEqual(events[i+1].candidate,event.candidate)
+            if event.kind == 'truncated':
+                self.assertEqual(events[i+1].kind,'accepted')
+                self.assertEqual(events[i+1].tower,event.tower)
+
+        simulation = iter_coverage(20,20,kinds = ('rejected',))
+        for event in simulation:
+            self.assertEqual(event.kind,'rejected')
+            if event.attempts > 50:
+                break
+        simulation.close()
+
+        events = list(iter_coverage(6,6,rng = np.random.RandomState(143),kinds = ('full',)))
+        self.assertEqual(len(events),1)
+        self.assertEqual(events[0].fraction,1.0)
+
+    def test_workers(self):
+        '''
+        Tests that a seeded run gives the same counts with one worker and with
+        a process pool, and that a run split up with start gives the same
+        counts as a single run.
+        '''
+        serial = average_towers_for_coverage(6,8,8,occupancy = True,seed = 143,return_counts = True)
+        pooled = average_towers_for_coverage(6,8,8,occupancy = True,seed = 143,return_counts = True,workers = 2)
+        self.assertEqual(serial,pooled)
+        self.assertEqual(len(serial[1]),6)
+        self.assertEqual(serial[0],sum(serial[1]) / 6.0)
+
+        pieces = list(iter_tower_counts(2,8,8,seed = 143,occupancy = True)) + \
+                 list(iter_tower_counts(4,8,8,seed = 143,workers = 2,start = 2,occupancy = True))
+        self.assertEqual(pieces,serial[1])
+
+    def test_candidate_sampler(self):
+        '''
+        Tests that drawing one candidate at a time gives the same towers as
+        drawing them by hand, and that batches only hand out candidates inside
+        the coverage area that are not already covered.
+        '''
+        np.random.seed(143)
+        by_hand = []
+        while len(by_hand) < 20:
+            x = np.random.randint(12,size = 1)[0]
+            y = np.random.randint(9,size = 1)[0]
+            w = np.random.randint(1,13,size = 1)[0]
+            h = np.random.randint(1,10,size = 1)[0]
+            if (x + w <= 12) and (y + h <= 9):
+                by_hand.append(tower((x,y),w,h))
+
+        np.random.seed(143)
+        sampler = CandidateSampler(12,9,batch_size = 1)
+        candidates = iter(sampler)
+        for t in by_hand:
+            self.assertEqual(next(candidates),t)
+
+        grid = OccupancyGrid(12,9)
+        grid.add(tower((0,0),6,9))
+        sampler = CandidateSampler(12,9,batch_size = 500,rng = np.random.RandomState(143),grid = grid)
+        candidates = iter(sampler)
+        for i in range(200):
+            t = next(candidates)
+            self.assertTrue(t.coord_tr[0] <= 12 and t.coord_tr[1] <= 9)
+            self.assertNotEqual(grid.state(t),'covered')
+        self.assertEqual(sampler.drawn - sampler.outside - sampler.covered,200)
+
+    def test_free_space_sampler(self):
+        '''
+        Tests that the free space sampler hands out every tower that is not
+        entirely covered equally often, like the uniform sampler does, and that
+        a simulation using it fills the coverage area.
+        '''
+        free_cells = [(0,0),(3,2),(1,3)]
+        grid = OccupancyGrid(4,4)
+        for x in range(4):
+            for y in range(4):
+                if (x,y) not in free_cells:
+                    grid.add(tower((x,y),1,1))
+
+        expected = set()
+        for x0 in range(4):
+            for x1 in range(x0+1,5):
+                for y0 in range(4):
+                    for y1 in range(y0+1,5):
+                        t = tower((x0,y0),x1-x0,y1-y0)
+                        if not grid.is_covered(t):
+                            expected.add(t)
+
+        sampler = FreeSpaceSampler(4,4,batch_size = 4096,rng = np.random.RandomState(143),grid = grid)
+        candidates = iter(sampler)
+        counts = {}
+        draws = 300 * len(expected)
+        for i in range(draws):
+            t = next(candidates)
+            counts[t] = counts.get(t,0) + 1
+        self.assertEqual(sampler.mode,'free')
+        self.assertEqual(set(counts),expected)
+        for t in expected:
+            self.assertAlmostEqual(counts[t] / 300.0,1.0,delta = 0.25)
+
+        state = CoverageState(12,12)
+        average = average_towers_for_coverage(2,12,12,state = state,batch_size = 64,seed = 143,sampler = 'free')
+        self.assertEqual(state.is_full,True)
+        self.assertTrue(average > 0)
+
+    def test_metrics(self):
+        '''
+        Tests that the metrics account for every tower drawn, that they come
+        out the same when the iterations run in a process pool, and that
+        coverage_up_to_n() collects them too.
+        '''
+        metrics = SimulationMetrics()
+        average, counts = average_towers_for_coverage(3,10,10,seed = 143,return_counts = True,metrics = metrics)
+        report = metrics.report()
+        self.assertEqual(report['runs'],3)
+        self.assertEqual(report['accepted'],sum(counts))
+        self.assertEqual(report['attempts'],report['accepted'] + sum(report['rejected'].values()))
+        self.assertEqual(report['truncate']['calls'],report['accepted_truncated'] + report['rejected'].get('no_room',0))
+        self.assertTrue(report['seconds']['total'] >= report['seconds']['place'] >= report['seconds']['truncate'])
+
+        pooled = SimulationMetrics()
+        average_towers_for_coverage(3,10,10,seed = 143,workers = 2,metrics = pooled)
+        pooled_report = pooled.report()
+        for key in ('runs','attempts','accepted','rejected','truncate'):
+            self.assertEqual(pooled_report[key],report[key])
+
+        metrics = SimulationMetrics()
+        np.random.seed(143)
+        valid_towers, areas, plot_list = coverage_up_to_n(15,20,20,plot = False,occupancy = True,batch_size = 64,metrics = metrics)
+        self.assertEqual(metrics.report()['accepted'],len(valid_towers))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#Author: Humberto Hernandez
+#Last updated: 10/18/2026
+import random
+import unittest
+from tower_class import tower
+from truncate_cache import TruncateCache
+from tower_coverage import average_towers_for_coverage
+
+class TestTruncateCache(unittest.TestCase):
+    '''
+    Used to make sure that truncating through a TruncateCache gives the same
+    towers as tower.truncate(), and that it keeps count and throws out old
+    results the way it should.
+    Please run as main file!
+
+    This code tests the following from the truncate_cache module.
+    - TruncateCache.truncate() and key()
+    - eviction with 'lru' and 'fifo'
+    - stats(), add_stats() and clear()
+    - average_towers_for_coverage() with a cache
+
+    '''
+
+    def setUp(self):
+        '''
+        Sets up 400 random truncations with a fixed seed. Every blocking list
+        is used at four positions, so the cache gets hits.
+        '''
+        rng = random.Random(143)
+        self.cases = []
+        for i in range(100):
+            t = tower((rng.randint(0,5),rng.randint(0,5)),rng.randint(1,6),rng.randint(1,6))
+            other = []
+            for j in range(rng.randint(1,4)):
+                other.append(tower((rng.randint(0,8),rng.randint(0,8)),rng.randint(1,4),rng.randint(1,4)))
+            for dx,dy in ((0,0),(3,0),(0,7),(11,5)):
+                moved = [tower((o.x0 + dx,o.y0 + dy),o.width,o.height) for o in other]
+                self.cases.append((tower((t.x0 + dx,t.y0 + dy),t.width,t.height),moved))
+
+    def test_same_as_truncate(self):
+        '''
+        Tests that the cache gives the same towers as tower.truncate(), whether
+        the result is worked out or looked up.
+        '''
+        cache = TruncateCache()
+        for t,other in self.cases + self.cases:
+            self.assertEqual(cache.truncate(t,other),t.truncate(other))
+        stats = cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'],2 * len(self.cases))
+        self.assertTrue(stats['hits'] >= 3 * len(self.cases) // 2)
+
+    def test_key(self):
+        '''
+        Tests that the order of the blocking towers, repeats and towers that
+        do not overlap the candidate do not change the key.
+        '''
+        cache = TruncateCache()
+        t = tower((2,2),4,4)
+        a = tower((0,0),3,3)
+        b = tower((5,1),4,2)
+        self.assertEqual(cache.key(t,[a,b]),cache.key(t,[b,a,a,tower((7,7),1,1)]))
+        self.assertEqual(cache.key(t,[a]),(4,4,((0,0,1,1),)))
+        self.assertNotEqual(cache.key(t,[a]),cache.key(tower((2,2),4,5),[a]))
+
+    def test_eviction(self):
+        '''
+        Tests that 'lru' keeps the result used last and 'fifo' the result
+        stored last when a full cache needs room.
+        '''
+        first = (tower((1,1),2,2),[tower((0,0),2,2)])
+        second = (tower((1,1),3,2),[tower((0,0),2,2)])
+        third = (tower((1,1),2,3),[tower((0,0),2,2)])
+        for eviction,kept in (('lru',first),('fifo',second)):
+            cache = TruncateCache(max_entries = 2,eviction = eviction)
+            for t,other in (first,second,first,third):
+                cache.truncate(t,other)
+            self.assertEqual(len(cache),2)
+            self.assertEqual(cache.evictions,1)
+            hits = cache.hits
+            cache.truncate(*kept)
+            self.assertEqual(cache.hits,hits + 1)
+        cache.clear()
+        self.assertEqual(cache.stats(),{'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'hit_rate': 0.0})
+
+    def test_coverage(self):
+        '''
+        Tests that the simulation gives the same counts with and without a
+        cache, and that the lookups of the workers are counted.
+        '''
+        plain = average_towers_for_coverage(6,8,8,seed = 143,return_counts = True)
+        cache = TruncateCache(max_entries = 100)
+        self.assertEqual(average_towers_for_coverage(6,8,8,seed = 143,return_counts = True,cache = cache),plain)
+        self.assertTrue(cache.hits > 0)
+        self.assertTrue(len(cache) <= 100)
+
+        shared = TruncateCache(max_entries = 100)
+        self.assertEqual(average_towers_for_coverage(6,8,8,seed = 143,return_counts = True,workers = 2,cache = shared),plain)
+        self.assertEqual(shared.hits + shared.misses,cache.hits + cache.misses)
+        self.assertEqual(len(shared),0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,288 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import numpy as np
+from tower_class import tower, _trusted
+
+def _edges(other):
+    '''
+    Returns the (x0,y0,x1,y1) walls of a tower or TowerArray.
+    '''
+    if isinstance(other,TowerArray):
+        return other.x, other.y, other.x1, other.y1
+    assert isinstance(other,tower), 'Warning! Argument must be a tower or TowerArray!'
+    x0,y0 = other.coord_ll
+    return x0, y0, x0 + other.width, y0 + other.height
+
+class TowerArray(object):
+    '''
+    Holds many towers as NumPy arrays of their lower left corners, widths and
+    heights.
+
+    Attributes:
+        - self.x = Integer array of the x-coordinates of the lower left corners.
+        - self.y = Integer array of the y-coordinates of the lower left corners.
+        - self.width = Integer array of the widths.
+        - self.height = Integer array of the heights.
+        - self.x1 = Integer array of the x-coordinates of the right walls.
+        - self.y1 = Integer array of the y-coordinates of the top walls.
+        - self.area = Integer array of the areas.
+
+    Methods:
+        - from_towers(): Builds a TowerArray from a list of towers.
+        - from_block(): Builds a TowerArray from an array of (x,y,width,height) rows.
+        - to_towers(): Returns the towers as a list of tower objects.
+        - contained(): Vectorized version of tower.contained().
+        - corner(): Vectorized version of tower.corner().
+        - borders(): Vectorized version of tower.borders().
+        - equals(): Vectorized version of tower.__eq__().
+        - overlaps(): Whether each tower's coverage area overlaps other's.
+        - overlap(): Vectorized version of tower.overlap().
+        - clear_of(): Whether each tower is clear of a list of towers, as
+            checked by the subtower search for a truncated tower.
+
+    The comparison methods take either a single tower or another TowerArray as
+    other. Against a single tower, they compare every tower in the array with
+    it and return an array with one row per tower. Against a TowerArray of m
+    towers, they compare every pair and return an array of shape (n,m,...).
+    The corners and walls come in the same order as the tower methods:
+
+        [LowerLeftCorner,TopLeftCorner,LowerRightCorner,TopRightCorner]
+        [Left Wall, Right Wall, Top Wall, Bottom Wall]
+
+    e.g.
+    >>> towers = TowerArray.from_towers([tower((0,0),2,2),tower((1,1),2,2)])
+    >>> towers.corner(tower((0,0),2,2))
+    array([[False, False, False, False],
+           [ True, False, False, False]])
+    >>> towers.overlaps(tower((2,0),2,2))
+    array([False,  True])
+    '''
+
+    def __init__(self,x,y,width,height):
+        '''
+        Creates a TowerArray from arrays of lower left corners, widths and heights.
+
+        Parameter: x, y, width, height
+        Type: sequences of integers of the same length.
+
+        Assertions:
+            - All four arrays must be one dimensional and the same length.
+            - width and height must be greater than zero.
+            - x and y must not be negative.
+        '''
+        self.x = np.asarray(x,dtype = np.int64)
+        self.y = np.asarray(y,dtype = np.int64)
+        self.width = np.asarray(width,dtype = np.int64)
+        self.height = np.asarray(height,dtype = np.int64)
+        assert self.x.ndim == 1, 'Warning! Arrays must be one dimensional!'
+        assert self.x.shape == self.y.shape == self.width.shape == self.height.shape, 'Warning! Arrays must be the same length!'
+        assert np.all(self.width > 0) and np.all(self.height > 0), 'Warning! tower width and height must be greater than zero!'
+        assert np.all(self.x >= 0) and np.all(self.y >= 0), 'Warning! Coordinates must be positive.'
+        self.x1 = self.x + self.width
+        self.y1 = self.y + self.height
+
+    @classmethod
+    def from_block(cls,block):
+        '''
+        Builds a TowerArray from an array of (x,y,width,height) rows, such as
+        a block from tower.subtower_blocks().
+
+        Parameter: block
+        Type: integer array of shape (n,4).
+
+        Return: TowerArray holding the towers in the same order.
+
+        Assertions:
+            - block must have four columns.
+        '''
+        block = np.asarray(block,dtype = np.int64)
+        assert (block.ndim == 2) and (block.shape[1] == 4), 'Warning! Block must have four columns!'
+        return cls(block[:,0],block[:,1],block[:,2],block[:,3])
+
+    @classmethod
+    def from_towers(cls,towers):
+        '''
+        Builds a TowerArray from a list of tower objects.
+
+        Parameter: towers
+        Type: list of tower objects.
+
+        Return: TowerArray holding the towers in the same order.
+        '''
+        for t in towers:
+            assert isinstance(t,tower), 'Warning! Items in list must be of class tower!'
+        return cls([t.coord_ll[0] for t in towers],[t.coord_ll[1] for t in towers],
+                   [t.width for t in towers],[t.height for t in towers])
+
+    def to_towers(self):
+        '''
+        Returns the towers in the array as a list of tower objects.
+        '''
+        return [_trusted(x,y,w,h) for x,y,w,h in zip(self.x.tolist(),self.y.tolist(),
+                                                      self.width.tolist(),self.height.tolist())]
+
+    @property
+    def area(self):
+        return self.width * self.height
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self,key):
+        '''
+        Returns a single tower object for an integer key, or a TowerArray for
+        a slice, index array or boolean mask.
+        '''
+        if isinstance(key,(int,np.integer)):
+            return _trusted(int(self.x[key]),int(self.y[key]),int(self.width[key]),int(self.height[key]))
+        return TowerArray(self.x[key],self.y[key],self.width[key],self.height[key])
+
+    def __repr__(self):
+        return 'TowerArray.from_towers(%r)' % self.to_towers()
+
+    def _pair(self,other):
+        '''
+        Returns the walls of self and other shaped to broadcast against each
+        other. Against a TowerArray the walls of self become columns.
+        '''
+        ox0,oy0,ox1,oy1 = _edges(other)
+        x0,y0,x1,y1 = self.x, self.y, self.x1, self.y1
+        if isinstance(other,TowerArray):
+            x0,y0,x1,y1 = x0[:,None], y0[:,None], x1[:,None], y1[:,None]
+        return (x0,y0,x1,y1), (ox0,oy0,ox1,oy1)
+
+    def contained(self,other):
+        '''
+        Checks which corners of each tower are contained in other's coverage
+        area, including other's bounds. Same as tower.contained().
+
+        Parameter: other
+        Type: tower object or TowerArray
+
+        Return: boolean array of shape (n,4) against a tower, or (n,m,4)
+                against a TowerArray of m towers.
+        '''
+        (x0,y0,x1,y1),(ox0,oy0,ox1,oy1) = self._pair(other)
+        left = x0 >= ox0
+        right = x1 <= ox1
+        bottom = y0 >= oy0
+        top = y1 <= oy1
+        return np.stack([left & bottom,left & top,right & bottom,right & top],axis = -1)
+
+    def corner(self,other):
+        '''
+        Checks which corners of each tower are inside other's coverage area,
+        excluding other's bounds. Same as tower.corner().
+
+        Parameter: other
+        Type: tower object or TowerArray
+
+        Return: boolean array of shape (n,4) against a tower, or (n,m,4)
+                against a TowerArray of m towers.
+        '''
+        (x0,y0,x1,y1),(ox0,oy0,ox1,oy1) = self._pair(other)
+        left = (x0 > ox0) & (x0 < ox1)
+        right = (x1 > ox0) & (x1 < ox1)
+        bottom = (y0 > oy0) & (y0 < oy1)
+        top = (y1 > oy0) & (y1 < oy1)
+        return np.stack([left & bottom,left & top,right & bottom,right & top],axis = -1)
+
+    def borders(self,other):
+        '''
+        Checks which walls of each tower are inside other's coverage area.
+        Same as tower.borders().
+
+        Parameter: other
+        Type: tower object or TowerArray
+
+        Return: boolean array of shape (n,4) against a tower, or (n,m,4)
+                against a TowerArray of m towers.
+        '''
+        (x0,y0,x1,y1),(ox0,oy0,ox1,oy1) = self._pair(other)
+        #Whether the wall's line falls inside other's span along that axis.
+        left_line = (x0 < ox1) & (x0 >= ox0)
+        right_line = (x1 > ox0) & (x1 <= ox1)
+        top_line = (y1 > oy0) & (y1 <= oy1)
+        bottom_line = (y0 < oy1) & (y0 >= oy0)
+        #Whether the wall's span along the other axis reaches into other.
+        vertical_span = bottom_line | ((y0 < oy0) & (y1 > oy0))
+        horizontal_span = left_line | ((x0 < ox0) & (x1 > ox0))
+        return np.stack([left_line & vertical_span,right_line & vertical_span,
+                         top_line & horizontal_span,bottom_line & horizontal_span],axis = -1)
+
+    def equals(self,other):
+        '''
+        Checks which towers are equal to other. Same as tower.__eq__().
+
+        Parameter: other
+        Type: tower object or TowerArray
+
+        Return: boolean array of shape (n,) against a tower, or (n,m) against
+                a TowerArray of m towers.
+        '''
+        (x0,y0,x1,y1),(ox0,oy0,ox1,oy1) = self._pair(other)
+        return (x0 == ox0) & (y0 == oy0) & (x1 == ox1) & (y1 == oy1)
+
+    def overlaps(self,other):
+        '''
+        Checks which towers' coverage areas overlap other's. Towers that only
+        share a wall or a corner with other do not overlap it.
+
+        Parameter: other
+        Type: tower object or TowerArray
+
+        Return: boolean array of shape (n,) against a tower, or (n,m) against
+                a TowerArray of m towers.
+        '''
+        (x0,y0,x1,y1),(ox0,oy0,ox1,oy1) = self._pair(other)
+        return (x0 < ox1) & (ox0 < x1) & (y0 < oy1) & (oy0 < y1)
+
+    def overlap(self,other):
+        '''
+        Returns the overlap of each tower with a single tower. Same as
+        tower.overlap().
+
+        Parameter: other
+        Type: tower object
+
+        Return: (overlaps,mask), where mask is a boolean array marking the
+                towers that overlap other and overlaps is a TowerArray of the
+                regions of overlap for those towers.
+        '''
+        assert isinstance(other,tower), 'Warning! Argument must be of class tower!'
+        ox0,oy0,ox1,oy1 = _edges(other)
+        x0 = np.maximum(self.x,ox0)
+        y0 = np.maximum(self.y,oy0)
+        x1 = np.minimum(self.x1,ox1)
+        y1 = np.minimum(self.y1,oy1)
+        mask = (x1 > x0) & (y1 > y0)
+        return TowerArray(x0[mask],y0[mask],(x1 - x0)[mask],(y1 - y0)[mask]), mask
+
+    def clear_of(self,other):
+        '''
+        Checks which towers have no corner inside and no wall inside any of the
+        towers in other. This is the test a subtower has to pass to be a valid
+        truncated tower in the subtower search: tower.corner() and
+        tower.borders() giving all Falses against every tower in other.
+
+        Parameter: other
+        Type: list of tower objects, or TowerArray
+
+        Return: boolean array of shape (n,).
+
+        e.g.
+        >>> block = next(tower((0,0),3,3).subtower_blocks())
+        >>> candidates = TowerArray.from_block(block)
+        >>> clear = candidates.clear_of([tower((2,2),1,1)])
+        >>> candidates[int(np.argmax(clear))]
+        tower((0, 0),2,3)
+
+        Every candidate is compared with every tower in other at once, so a
+        block of n candidates against m towers takes arrays of n*m*4 booleans.
+        '''
+        if not isinstance(other,TowerArray):
+            other = TowerArray.from_towers(other)
+        if len(other) == 0:
+            return np.ones(len(self),dtype = bool)
+        blocked = self.corner(other).any(axis = 2) | self.borders(other).any(axis = 2)
+        return ~blocked.any(axis = 1)
@@ -0,0 +1,742 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import timeit
+import numpy as np
+from tower_class import tower
+from tower_reference import overlap_by_subtowers, truncate_by_subtowers, truncate_by_blocks
+
+def best_time(function,repeat = 3,number = 1):
+    '''
+    Returns the best time in seconds taken by a single call to function.
+
+    Parameter: function
+    Type: callable taking no arguments.
+
+    Parameter: repeat
+    Type: int
+
+    Parameter: number
+    Type: int
+
+    Return: float, the smallest time out of repeat runs of number calls
+            divided by number.
+
+    Assertions:
+        - repeat and number must be positive integers.
+    '''
+    assert isinstance(repeat,int) and repeat > 0, 'Warning! repeat must be a positive integer!'
+    assert isinstance(number,int) and number > 0, 'Warning! number must be a positive integer!'
+
+    timer = timeit.Timer(function)
+    return min(timer.repeat(repeat = repeat,number = number)) / number
+
+def benchmark_overlap(sizes = (10,25,50,100,1000),reference_limit = 50,repeat = 3):
+    '''
+    Times tower.overlap() against the subtower search it replaced on square
+    towers of increasing size.
+
+    For a size s, the two towers are tower((0,0),s,s) and tower((s/2,s/2),s,s)
+    so the overlap is a quarter of either tower.
+
+    Parameter: sizes
+    Type: tuple of positive ints
+
+    Parameter: reference_limit
+    Type: int, the largest size the subtower search is run on. Larger sizes
+          allocate millions of towers and are skipped.
+
+    Parameter: repeat
+    Type: int
+
+    Return: list of dicts, one per size, with the keys 'size', 'closed_form'
+            and 'subtowers' giving seconds per call. 'subtowers' is None for
+            sizes above reference_limit.
+
+    e.g.
+    >>> for row in benchmark_overlap(sizes = (10,50)):
+    ...     print row
+    {'subtowers': 0.0208, 'closed_form': 5.3e-06, 'size': 10}
+    {'subtowers': 4.72, 'closed_form': 2.6e-06, 'size': 50}
+
+    Assertions:
+        - sizes must be positive integers.
+    '''
+    results = []
+    for size in sizes:
+        assert isinstance(size,int) and size > 0, 'Warning! Sizes must be positive integers!'
+        t = tower((0,0),size,size)
+        other = tower((size//2,size//2),size,size)
+
+        closed_form = best_time(lambda: t.overlap(other),repeat = repeat,number = 1000)
+        if size <= reference_limit:
+            assert overlap_by_subtowers(t,other) == t.overlap(other), 'Warning! Overlap results differ!'
+            subtowers = best_time(lambda: overlap_by_subtowers(t,other),repeat = repeat)
+        else:
+            subtowers = None
+
+        results.append({'size': size, 'closed_form': closed_form, 'subtowers': subtowers})
+
+    return results
+
+def benchmark_truncate(sizes = (10,20,40,100,1000),blocking = 8,reference_limit = 20,repeat = 3,seed = 0):
+    '''
+    Times tower.truncate() against the subtower search it replaced on square
+    towers of increasing size.
+
+    For a size s, the tower truncated is tower((0,0),s,s) and the blocking list
+    holds blocking randomly placed towers that overlap it. The same seed gives
+    the same blocking list.
+
+    Parameter: sizes
+    Type: tuple of positive ints
+
+    Parameter: blocking
+    Type: int, the number of blocking towers.
+
+    Parameter: reference_limit
+    Type: int, the largest size the subtower search is run on.
+
+    Parameter: repeat
+    Type: int
+
+    Parameter: seed
+    Type: int
+
+    Return: list of dicts, one per size, with the keys 'size', 'blocking',
+            'empty_rectangle', 'subtowers' and 'blocks' giving seconds per
+            call. 'subtowers' and 'blocks' are None for sizes above
+            reference_limit.
+
+    Assertions:
+        - sizes must be positive integers.
+        - blocking must be a positive integer.
+    '''
+    assert isinstance(blocking,int) and blocking > 0, 'Warning! blocking must be a positive integer!'
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        assert isinstance(size,int) and size > 0, 'Warning! Sizes must be positive integers!'
+        t = tower((0,0),size,size)
+        other = []
+        for i in range(blocking):
+            other.append(tower((rng.randint(0,size-1),rng.randint(0,size-1)),
+                               rng.randint(1,size//2+1),rng.randint(1,size//2+1)))
+
+        empty_rectangle = best_time(lambda: t.truncate(other),repeat = repeat,number = 100)
+        if size <= reference_limit:
+            #The subtower search does not see a blocking tower sitting strictly
+            #inside a subtower, which truncate does, so the results are only
+            #compared without the blocking towers with a corner inside t.
+            comparable = [blocker for blocker in other if not any(blocker.corner(t))]
+            reference = truncate_by_subtowers(t,comparable)
+            truncated = t.truncate(comparable)
+            assert (reference is None) == (truncated is None), 'Warning! Truncate results differ!'
+            assert (reference is None) or (reference.area == truncated.area), 'Warning! Truncate results differ!'
+            assert reference == truncate_by_blocks(t,comparable), 'Warning! Truncate results differ!'
+            subtowers = best_time(lambda: truncate_by_subtowers(t,other),repeat = repeat)
+            blocks = best_time(lambda: truncate_by_blocks(t,other),repeat = repeat)
+        else:
+            subtowers = None
+            blocks = None
+
+        results.append({'size': size, 'blocking': blocking, 'empty_rectangle': empty_rectangle,
+                        'subtowers': subtowers, 'blocks': blocks})
+
+    return results
+
+def validate_by_characters(towers):
+    '''
+    Checks a list of towers in the format of plot_towers() by comparing every
+    character of every color against the list of hexadecimal characters, and
+    every hatch against the list of hatch types, for every tower. This is the
+    original validation of plot_towers() and is kept as a reference for
+    benchmarking against plotting_code_proj.validate_towers(). Since '#' is in
+    its list of hexadecimal characters, it lets through colors such as
+    '#12345#' that validate_towers() rejects.
+
+    Parameter: towers
+    Type: list of [tower,color,hatch,fill] lists.
+
+    Assertions:
+        - Same as plot_towers().
+    '''
+    acceptable_characters = ['0','1','2','3','4','5','6','7','8','9',
+                             'A','B','C','D','E','F','a','b','c','d','e','f','#']
+    acceptable_hatch = ['/','\\','-', '+','x','o','O','.','*']
+
+    for t,color,hatch,fill in towers:
+        assert isinstance(t,tower), 'plot_towers: Warning! First item in the list must be of class tower!'
+        assert isinstance(fill,bool), 'plot_towers: fill must be True or False.'
+        if color != None:
+            characters = list(color)
+            assert len(characters) == 7,'plot_towers: Warning! Hexadecimal number must be in the #XXXXXX format'
+            assert characters[0] == '#', 'plot_towers: Warning! Not a Hexadecimal number! Format must be #XXXXXX.'
+            valid = 0
+            for char in characters:
+                for ac_char in acceptable_characters:
+                    if(ac_char == char):
+                        valid = 1
+                assert valid > 0, 'plot_towers: Warning! Not a valid hexadecimal number!, %s' % char
+                valid = 0
+        if hatch != None:
+            valid = 0
+            for h in acceptable_hatch:
+                if h == hatch:
+                    valid = 1
+            assert valid == 1,'plot_towers: Hatch must be from acceptable list in documentation.'
+
+def random_plot_list(count,seed = 0):
+    '''
+    Returns a list of count towers in the format of plot_towers(), the way
+    coverage_up_to_n() makes them: a random color each, and a hatched
+    unfilled tower every tenth tower.
+    '''
+    rng = random.Random(seed)
+    towers = []
+    for i in range(count):
+        t = tower((rng.randint(0,90),rng.randint(0,90)),rng.randint(1,10),rng.randint(1,10))
+        if i % 10 == 9:
+            towers.append([t,None,'/',False])
+        else:
+            towers.append([t,'#%02X%02X%02X' % (rng.randint(0,255),rng.randint(0,255),rng.randint(0,255)),None,True])
+    return towers
+
+def benchmark_validation(counts = (100,1000,10000),repeat = 3):
+    '''
+    Times plotting_code_proj.validate_towers() against the character by
+    character validation it replaced, on lists made by random_plot_list().
+
+    Parameter: counts
+    Type: tuple of positive ints, the numbers of towers.
+
+    Parameter: repeat
+    Type: int
+
+    Return: list of dicts, one per count, with the keys 'towers', 'set_regex'
+            and 'characters' giving seconds per call.
+    '''
+    from plotting_code_proj import validate_towers
+
+    results = []
+    for count in counts:
+        towers = random_plot_list(count)
+        set_regex = best_time(lambda: validate_towers(towers),repeat = repeat)
+        characters = best_time(lambda: validate_by_characters(towers),repeat = repeat)
+        results.append({'towers': count, 'set_regex': set_regex, 'characters': characters})
+    return results
+
+class _dict_tower(object):
+    '''
+    Stand-in for the tower class as it was before it used __slots__: the
+    lower left corner, width and height kept in the instance __dict__, the
+    other corners and the area worked out by properties on every access.
+    Only used to compare against in benchmark_tower_objects().
+    '''
+
+    def __init__(self,coord,width,height):
+        assert isinstance(coord,tuple), 'Warning! (x,y) must be a tuple.'
+        assert len(coord) == 2, 'Warning! Only a tuple of length two!'
+        assert width > 0, 'Warning! tower width must be greater than zero!'
+        assert height > 0, 'Warning! tower height must be greater than zero!'
+        assert (coord[0] >= 0) and (coord[1] >= 0), 'Warning! Coordinates must be positive.'
+        assert isinstance(coord[0],int) and isinstance(coord[1],int),'Coordinates must be integers.'
+        assert isinstance(width,int), 'Warning! Must be int!'
+        assert isinstance(height, int), 'Warning! Must be int!'
+        self.width = width
+        self.height = height
+        self.coord_ll = coord
+
+    @property
+    def coord_tr(self):
+        assert isinstance (self,_dict_tower), 'Warning! Requires an instance of tower class!'
+        return (self.coord_ll[0] + self.width, self.coord_ll[1] + self.height)
+
+    @property
+    def area(self):
+        assert isinstance (self,_dict_tower), 'Warning! Requires an instance of tower class!'
+        return self.width * self.height
+
+def instance_size(obj):
+    '''
+    Returns the number of bytes used by obj, its __dict__ if it has one, and
+    the tuples it holds in its attributes. Integers and the lower left corner
+    tuple passed in by the caller are not counted.
+
+    Parameter: obj
+    Type: tower object (or _dict_tower)
+
+    Return: int
+    '''
+    size = sys.getsizeof(obj)
+    if hasattr(obj,'__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    for name in getattr(type(obj),'__slots__',()):
+        value = getattr(obj,name)
+        if isinstance(value,tuple) and (name != 'coord_ll'):
+            size += sys.getsizeof(value)
+    return size
+
+def benchmark_tower_objects(number = 100000,repeat = 3):
+    '''
+    Reports the memory and construction cost of a tower object, and the cost
+    of reading its top right corner and area, next to the dictionary based
+    tower it replaced.
+
+    Parameter: number
+    Type: int, the number of towers created per timing.
+
+    Parameter: repeat
+    Type: int
+
+    Return: dict with a 'slots' and a 'dict' entry. Each is a dict with the
+            keys 'bytes' (per instance), 'construct' (seconds per tower
+            created) and 'access' (seconds per coord_tr plus area read).
+
+    Assertions:
+        - number must be a positive integer.
+    '''
+    assert isinstance(number,int) and number > 0, 'Warning! number must be a positive integer!'
+    results = {}
+    for name,cls in (('slots',tower),('dict',_dict_tower)):
+        t = cls((1,2),6,4)
+        construct = best_time(lambda: cls((1,2),6,4),repeat = repeat,number = number)
+        access = best_time(lambda: (t.coord_tr,t.area),repeat = repeat,number = number)
+        results[name] = {'bytes': instance_size(t), 'construct': construct, 'access': access}
+    return results
+
+#Bumped whenever the cases change, so old baselines are not compared by mistake.
+SUITE_VERSION = 1
+
+def calibrate(function,target = 0.1):
+    '''
+    Returns how many calls to function take about target seconds, so fast
+    functions are timed over enough calls to be measured and slow ones are
+    only called once.
+
+    Parameter: function
+    Type: callable taking no arguments.
+
+    Parameter: target
+    Type: float, seconds.
+
+    Return: int, at least 1.
+    '''
+    number = 1
+    while True:
+        seconds = timeit.Timer(function).timeit(number = number)
+        if (seconds >= target) or (number >= 10**6):
+            return number
+        if seconds <= 0:
+            number *= 10
+        else:
+            number = max(number + 1,min(10 * number,int(number * target / seconds)))
+
+class _quiet(object):
+    '''
+    Context manager that throws away everything printed inside it, so the
+    simulators' progress messages do not end up in the benchmark report.
+    '''
+
+    def __enter__(self):
+        self.stdout = sys.stdout
+        self.devnull = open(os.devnull,'w')
+        sys.stdout = self.devnull
+
+    def __exit__(self,*args):
+        sys.stdout = self.stdout
+        self.devnull.close()
+
+def _case(name,run,work,unit):
+    '''
+    Returns a benchmark case: run is called with no arguments and does work
+    units of unit each call.
+    '''
+    return {'name': name, 'run': run, 'work': work, 'unit': unit}
+
+def _seeded(seed,function,*args,**kwargs):
+    '''
+    Returns a callable that seeds np.random with seed and then quietly calls
+    function, so every call of a simulator places the same towers.
+    '''
+    def run():
+        np.random.seed(seed)
+        with _quiet():
+            function(*args,**kwargs)
+    return run
+
+def suite_cases(quick = False,seed = 0):
+    '''
+    Returns the benchmark cases of the suite.
+
+    Parameter: quick
+    Type: bool, whether to use a few small cases that run in a few seconds,
+          e.g. to check that the suite works.
+
+    Parameter: seed
+    Type: int, seeds the random towers and the simulators.
+
+    Return: list of cases. Each is a dict with the keys 'name', 'run' (a
+            callable taking no arguments), 'work' and 'unit' (how much work
+            one call of run does, used for the throughput).
+
+    The cases are
+        - subtowers: tower.subtowers() of square towers of several sizes.
+        - overlap: tower.overlap() of two square towers of several sizes.
+        - corner_borders: tower.corner() and tower.borders() of random pairs.
+        - truncate: tower.truncate() of square towers of several sizes against
+            blocking lists of several lengths.
+        - coverage_up_to_n: placing several numbers of towers in a region.
+        - average_towers_for_coverage: filling regions of several sizes, with
+            the default options and with the occupancy grid and batches.
+        - validate_towers: checking plot lists of several lengths before
+            plotting (see plotting_code_proj.validate_towers).
+    '''
+    from tower_coverage import coverage_up_to_n, average_towers_for_coverage
+    from plotting_code_proj import validate_towers
+
+    if quick:
+        subtower_sizes = (3,6)
+        overlap_sizes = (10,1000)
+        truncate_sizes = (20,)
+        blocking_lengths = (1,8)
+        tower_counts = (5,)
+        coverage_region = 10
+        default_regions = (6,)
+        fast_regions = (8,)
+        iterations = 1
+        plot_counts = (100,)
+    else:
+        subtower_sizes = (5,10,20)
+        overlap_sizes = (10,100,1000)
+        truncate_sizes = (20,100,1000)
+        blocking_lengths = (1,8,32,128)
+        tower_counts = (10,50,200)
+        coverage_region = 50
+        default_regions = (6,10,14)
+        fast_regions = (16,32,48)
+        iterations = 2
+        plot_counts = (100,1000,10000)
+
+    rng = random.Random(seed)
+    cases = []
+
+    for size in subtower_sizes:
+        t = tower((0,0),size,size)
+        count = len(list(t.subtowers()))
+        cases.append(_case('subtowers size=%d' % size,lambda t=t: list(t.subtowers()),count,'subtowers'))
+
+    for size in overlap_sizes:
+        t = tower((0,0),size,size)
+        other = tower((size//2,size//2),size,size)
+        cases.append(_case('overlap size=%d' % size,lambda t=t,other=other: t.overlap(other),1,'calls'))
+
+    pairs = []
+    for i in range(100):
+        pairs.append((tower((rng.randint(0,20),rng.randint(0,20)),rng.randint(1,10),rng.randint(1,10)),
+                      tower((rng.randint(0,20),rng.randint(0,20)),rng.randint(1,10),rng.randint(1,10))))
+    def corner_borders(pairs = pairs):
+        for t,other in pairs:
+            t.corner(other)
+            t.borders(other)
+    cases.append(_case('corner_borders pairs=100',corner_borders,len(pairs),'pairs'))
+
+    for size in truncate_sizes:
+        t = tower((0,0),size,size)
+        for length in blocking_lengths:
+            other = []
+            for i in range(length):
+                other.append(tower((rng.randint(0,size-1),rng.randint(0,size-1)),
+                                   rng.randint(1,size//2+1),rng.randint(1,size//2+1)))
+            cases.append(_case('truncate size=%d blocking=%d' % (size,length),
+                               lambda t=t,other=other: t.truncate(other),1,'calls'))
+
+    for n in tower_counts:
+        cases.append(_case('coverage_up_to_n n=%d region=%d' % (n,coverage_region),
+                           _seeded(seed,coverage_up_to_n,n,coverage_region,coverage_region,plot = False),n,'towers'))
+
+    for region in default_regions:
+        cases.append(_case('average_towers_for_coverage region=%d' % region,
+                           _seeded(seed,average_towers_for_coverage,iterations,region,region),iterations,'iterations'))
+    for region in fast_regions:
+        cases.append(_case('average_towers_for_coverage region=%d occupancy batch=1024' % region,
+                           _seeded(seed,average_towers_for_coverage,iterations,region,region,occupancy = True,batch_size = 1024),
+                           iterations,'iterations'))
+
+    for count in plot_counts:
+        plot_list = random_plot_list(count,seed)
+        cases.append(_case('validate_towers towers=%d' % count,lambda plot_list=plot_list: validate_towers(plot_list),count,'towers'))
+
+    return cases
+
+def peak_memory():
+    '''
+    Returns the peak resident memory of this process in kB, or None where the
+    resource module does not exist (Windows).
+    '''
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak //= 1024 #macOS reports bytes, Linux reports kilobytes.
+    return peak
+
+#Whether cases can run in a forked copy of this process. The cases are
+#closures, which the spawn method of Windows can not send to a new process.
+CAN_FORK = hasattr(os,'fork')
+
+def _measure(case,repeat,target,connection):
+    '''
+    Times a case and sends (seconds per call,peak resident memory in kB) down
+    connection. Run in a process of its own by run_case().
+    '''
+    number = calibrate(case['run'],target)
+    seconds = best_time(case['run'],repeat = repeat,number = number)
+    peak = peak_memory()
+    connection.send((seconds,peak))
+    connection.close()
+
+def run_case(case,repeat = 3,target = 0.1,fork = CAN_FORK):
+    '''
+    Times one benchmark case in a new process.
+
+    Parameter: case
+    Type: dict, one of the cases from suite_cases().
+
+    Parameter: repeat
+    Type: int, the number of timings the best is taken from.
+
+    Parameter: target
+    Type: float, roughly how many seconds each timing takes (see calibrate()).
+
+    Parameter: fork
+    Type: bool, whether to run the case in a forked process. Defaults to
+            CAN_FORK, which is False on Windows.
+
+    Return: dict with the keys
+        - 'seconds': best time for one call of the case.
+        - 'per_second': units of work done per second.
+        - 'unit': what the work is counted in.
+        - 'peak_rss_kb': peak resident memory of the process that ran it,
+            or None where it cannot be measured (see peak_memory()) or
+            when fork is False.
+
+    Every case runs in a fresh process, so the peak memory belongs to that
+    case instead of the biggest case run so far, and one case's garbage does
+    not slow down the next. The process starts as a copy of this one, so the
+    peak memory includes what this process was already using. Without fork,
+    the case is timed in this process instead, and its peak memory would be
+    the biggest case's so far, so it is reported as None.
+    '''
+    if not fork:
+        number = calibrate(case['run'],target)
+        seconds = best_time(case['run'],repeat = repeat,number = number)
+        return {'seconds': seconds, 'per_second': case['work'] / seconds,
+                'unit': case['unit'], 'peak_rss_kb': None}
+    receiver,sender = multiprocessing.Pipe(False)
+    process = multiprocessing.Process(target = _measure,args = (case,repeat,target,sender))
+    process.start()
+    seconds,peak = receiver.recv()
+    process.join()
+    return {'seconds': seconds, 'per_second': case['work'] / seconds,
+            'unit': case['unit'], 'peak_rss_kb': peak}
+
+def run_suite(quick = False,seed = 0,repeat = 3,target = 0.1,select = None,report = None):
+    '''
+    Runs every case of the suite.
+
+    Parameter: quick, seed
+    Type: see suite_cases().
+
+    Parameter: repeat, target
+    Type: see run_case().
+
+    Parameter: select
+    Type: str or None. If given, only the cases whose name contains it are run.
+
+    Parameter: report
+    Type: callable or None. If given, it is called with (name,result) as soon
+          as each case is done.
+
+    Return: dict with the keys 'version', 'seed', 'quick', 'python',
+            'platform' and 'results', where 'results' maps each case name to
+            the dict returned by run_case(). It can be saved as a baseline
+            with save_baseline().
+    '''
+    results = {}
+    for case in suite_cases(quick,seed):
+        if (select is not None) and (select not in case['name']):
+            continue
+        result = run_case(case,repeat,target)
+        results[case['name']] = result
+        if report is not None:
+            report(case['name'],result)
+    return {'version': SUITE_VERSION, 'seed': seed, 'quick': quick,
+            'python': platform.python_version(), 'platform': platform.platform(),
+            'results': results}
+
+def save_baseline(run,path):
+    '''
+    Writes the output of run_suite() to path as JSON.
+    '''
+    with open(path,'w') as f:
+        json.dump(run,f,indent = 2,sort_keys = True)
+
+def load_baseline(path):
+    '''
+    Reads a baseline written by save_baseline().
+
+    Assertions:
+        - The baseline must come from the same version of the suite.
+    '''
+    with open(path) as f:
+        baseline = json.load(f)
+    assert baseline.get('version') == SUITE_VERSION, 'Warning! Baseline is from a different version of the benchmark suite!'
+    return baseline
+
+def compare_to_baseline(run,baseline,tolerance = 0.2):
+    '''
+    Compares the times of a run with the times of a baseline.
+
+    Parameter: run
+    Type: dict returned by run_suite().
+
+    Parameter: baseline
+    Type: dict returned by run_suite() or load_baseline().
+
+    Parameter: tolerance
+    Type: float, how much slower or faster than the baseline, as a fraction,
+          a case has to be to count as changed.
+
+    Return: list of dicts, one per case in run in name order, with the keys
+            'name', 'baseline' and 'seconds' (seconds per call, 'baseline' is
+            None for new cases), 'ratio' (seconds / baseline) and 'status',
+            one of 'slower', 'faster', 'same' or 'new'.
+
+    e.g.
+    >>> compare_to_baseline(run,baseline)[0]
+    {'status': 'same', 'seconds': 5.9e-06, 'baseline': 5.7e-06, 'ratio': 1.03, 'name': 'overlap size=10'}
+
+    Assertions:
+        - tolerance must not be negative.
+    '''
+    assert tolerance >= 0, 'Warning! tolerance must not be negative!'
+    rows = []
+    for name in sorted(run['results']):
+        seconds = run['results'][name]['seconds']
+        old = baseline['results'].get(name)
+        if old is None:
+            rows.append({'name': name, 'baseline': None, 'seconds': seconds, 'ratio': None, 'status': 'new'})
+            continue
+        ratio = seconds / old['seconds']
+        if ratio > 1 + tolerance:
+            status = 'slower'
+        elif ratio < 1.0 / (1 + tolerance):
+            status = 'faster'
+        else:
+            status = 'same'
+        rows.append({'name': name, 'baseline': old['seconds'], 'seconds': seconds, 'ratio': ratio, 'status': status})
+    return rows
+
+def print_reference_tables():
+    '''
+    Prints the new overlap, truncate, tower object and plot validation
+    implementations next to the ones they replaced.
+    '''
+    print 'tower.overlap() versus subtower search (seconds per call)'
+    print '%6s %14s %14s' % ('size','closed form','subtowers')
+    for row in benchmark_overlap():
+        if row['subtowers'] is None:
+            print '%6d %14.3g %14s' % (row['size'],row['closed_form'],'skipped')
+        else:
+            print '%6d %14.3g %14.3g' % (row['size'],row['closed_form'],row['subtowers'])
+
+    print
+    print 'tower.truncate() versus subtower search (seconds per call)'
+    print '%6s %14s %14s %14s' % ('size','empty rect','subtowers','blocks')
+    for row in benchmark_truncate():
+        if row['subtowers'] is None:
+            print '%6d %14.3g %14s %14s' % (row['size'],row['empty_rectangle'],'skipped','skipped')
+        else:
+            print '%6d %14.3g %14.3g %14.3g' % (row['size'],row['empty_rectangle'],row['subtowers'],row['blocks'])
+
+    print
+    print 'tower objects: bytes per instance, seconds per construction and per coord_tr + area read'
+    print '%6s %8s %14s %14s' % ('kind','bytes','construct','access')
+    results = benchmark_tower_objects()
+    for name in ('slots','dict'):
+        row = results[name]
+        print '%6s %8d %14.3g %14.3g' % (name,row['bytes'],row['construct'],row['access'])
+
+    print
+    print 'plot_towers() validation: set and regex versus characters (seconds per call)'
+    print '%6s %14s %14s' % ('towers','set + regex','characters')
+    for row in benchmark_validation():
+        print '%6d %14.3g %14.3g' % (row['towers'],row['set_regex'],row['characters'])
+
+def main(arguments = None):
+    '''
+    Command line entry point. Run python tower_benchmarks.py --help for the options.
+
+    Return: int, the exit status. 1 if a baseline was compared against and
+            any case got slower, otherwise 0.
+    '''
+    parser = argparse.ArgumentParser(description = 'Times the tower geometry and the coverage simulations.')
+    parser.add_argument('--quick',action = 'store_true',help = 'run a few small cases only')
+    parser.add_argument('--seed',type = int,default = 0,help = 'seed for the random towers (default 0)')
+    parser.add_argument('--repeat',type = int,default = 3,help = 'timings to take the best of (default 3)')
+    parser.add_argument('--select',help = 'only run the cases whose name contains this')
+    parser.add_argument('--save',metavar = 'FILE',help = 'save the results as a JSON baseline')
+    parser.add_argument('--compare',metavar = 'FILE',help = 'compare the results with a JSON baseline')
+    parser.add_argument('--tolerance',type = float,default = 0.2,help = 'fraction a case may change by (default 0.2)')
+    parser.add_argument('--reference',action = 'store_true',help = 'print the old implementations next to the new ones instead')
+    options = parser.parse_args(arguments)
+
+    if options.reference:
+        print_reference_tables()
+        return 0
+
+    baseline = None
+    if options.compare is not None:
+        baseline = load_baseline(options.compare)
+
+    print '%-58s %12s %14s %12s' % ('case','seconds','per second','peak kB')
+    def report(name,result):
+        peak = result['peak_rss_kb']
+        if peak is None:
+            peak = 'n/a'
+        print '%-58s %12.3g %14.4g %12s  %s' % (name,result['seconds'],result['per_second'],
+                                                peak,result['unit'])
+        sys.stdout.flush()
+    run = run_suite(options.quick,options.seed,options.repeat,select = options.select,report = report)
+
+    if options.save is not None:
+        save_baseline(run,options.save)
+        print 'Saved baseline to', options.save
+
+    if baseline is None:
+        return 0
+    print
+    print 'Compared with', options.compare
+    print '%-58s %12s %12s %8s %8s' % ('case','baseline','seconds','ratio','status')
+    slower = False
+    for row in compare_to_baseline(run,baseline,options.tolerance):
+        if row['status'] == 'new':
+            print '%-58s %12s %12.3g %8s %8s' % (row['name'],'-',row['seconds'],'-','new')
+        else:
+            print '%-58s %12.3g %12.3g %8.2f %8s' % (row['name'],row['baseline'],row['seconds'],row['ratio'],row['status'])
+        slower = slower or (row['status'] == 'slower')
+    if slower:
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,9 @@
 #Author: Humberto Hernandez
 #Last Updated: 5/19/2018 5:46pm
-import itertools as it
+import heapq
+import numpy as np
+from empty_rectangle import largest_empty_rectangle
+from simulation_metrics import clock
 
 class tower(object):
     '''
@@ -16,6 +19,8 @@ class tower(object):
         - self.width = Width of coverage area.
         - self.height = Height of the coverage area.
         - self.area = Area of coverage area.
+        - self.x0, self.x1 = x-coordinates of the left and right walls.
+        - self.y0, self.y1 = y-coordinates of the bottom and top walls.
 
     Attribute Type:
         - self.coord_xx is a tuple of size two with integer arguments corresponding
@@ -24,30 +29,49 @@ class tower(object):
         - self.width is type int.
         - self.height is type int.
         - self.area is type int.
+        - self.x0, self.y0, self.x1 and self.y1 are type int.
         
     Methods:
-        - coord_lr(),coord_tl(),coord_tr() give corresponding (x,y) coordingates
-            for specified corner. These are methods that have property decorators
-            so they can be referenced by the user as attributes.
         - __eq__: Checks whether two towers are equivalent to each other.
+        - __ne__: Checks whether two towers are not equivalent to each other.
+        - __hash__: Hash of the tower, so towers can be used in sets and as
+                        dictionary keys.
         - __repr__:  Returns the string representation of tower object.
         - contained(): Checks which corners of a tower are contained in another
                         tower's coverage area.
         - corner(): Checks which corners of a tower are contained in another
             tower's coverage area.
-        - overlap(): Returns sub-tower with largest overlap with other.
+        - overlap(): Returns the region of overlap with other as a tower.
         - truncate(): Takes in a tower and a list of towers and truncates the
                         tower versus that list. 
         - borders(): Checks which walls of a tower overlap another tower's
                         coverage area.
         - subtowers(): Returns a list of a possible sub-towers for a given tower.
-        
+        - subtower_shapes(): Returns the (width,height) shapes of the sub-towers,
+                        largest area first.
+        - subtower_blocks(): Returns the sub-towers in blocks of NumPy arrays.
+    
+    e.g.
+    >>> t = tower((1, 2),6,4)
+    >>> t.coord_lr, t.coord_tl, t.coord_tr
+    ((7, 2), (1, 6), (7, 6))
+    >>> t.area
+    24
+    
+    All of the attributes are worked out once when the tower is created and
+    stored in __slots__, so a tower has no __dict__ and reading a corner or the
+    area is a plain attribute lookup. Towers can't be changed once they are
+    created (setting an attribute raises an AttributeError), which is what
+    makes them safe to hash.
     '''
     
+    __slots__ = ('coord_ll','width','height','area','x0','y0','x1','y1',
+                 'coord_lr','coord_tl','coord_tr')
+    
     def __init__(self,coord,width,height):
         '''
         Creates self.width, self.height, and coord_ll upon instance creation of
-        tower.
+        tower, along with the other corners, walls and area worked out from them.
         
         Parameter: self
         Type: Instance of tower class.
@@ -65,6 +89,12 @@ class tower(object):
             - self.width = width
             - self.height = height
             - self.coord_ll = coord
+            - self.coord_lr = (x + width, y)
+            - self.coord_tl = (x, y + height)
+            - self.coord_tr = (x + width, y + height)
+            - self.area = width * height
+            - self.x0, self.y0 = coord
+            - self.x1, self.y1 = x + width, y + height
             
         Assertions:
             - (x,y) coordinate must be a tuple.
@@ -73,131 +103,44 @@ class tower(object):
             - x and y coordinates must be integers.
             - width and height must be integers.
         
+        The checks raise an AssertionError even when Python is run with -O.
+        Code inside the package that already knows its arguments are valid,
+        such as a subtower of a valid tower, makes towers with _trusted()
+        instead, which skips them.
         '''
-        assert isinstance(coord,tuple), 'Warning! (x,y) must be a tuple.'
-        assert len(coord) == 2, 'Warning! Only a tuple of length two!'
-        assert width > 0, 'Warning! tower width must be greater than zero!'
-        assert height > 0, 'Warning! tower height must be greater than zero!'
-        assert (coord[0] >= 0) and (coord[1] >= 0), 'Warning! Coordinates must be positive.'
-        assert isinstance(coord[0],int) and isinstance(coord[1],int),'Coordinates must be integers.'
-        assert isinstance(width,int), 'Warning! Must be int!'
-        assert isinstance(height, int), 'Warning! Must be int!'
-
-        self.width = width
-        self.height = height
-        self.coord_ll = coord                           #Lower left corner
- 
-    #In the event that something gets updated, these will always
-    #update with the most recent values.    
-    @property
-    def coord_lr(self): #Lower Right Corner
-        '''
-        Returns lower right corner of tower's coverage area as an (x,y) tuple
-        
-        Parameter: The instance of the tower being used to call this method is
-                    referred to as self.
-        Type: Instance of class tower.
-        
-        Return: (x,y) tuple for the lower right corner of tower's coverage area.
-        
-        e.g. 
-        >>> t = tower((1, 2),6,4)
-        >>> t.coord_lr
-        (7,2)
-                    
-        Returns the lower right corner of a tower's coverage area by taking
-        the width and adding it to the x-value of the of the tower object's
-        lower left corner (self.coord_ll[0]) attribute's x-coordinate.
-        
-        Assertions:
-            - Can only be used on an instance of tower class.
-        '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        return (self.coord_ll[0] + self.width, self.coord_ll[1])
-        
-    @property #Top Left Corner
-    def coord_tl(self):
-        '''
-        Returns top left corner of tower's coverage area as an (x,y) tuple
-        
-        Parameter: The instance of the tower being used to call this method is
-                    referred to as self.
-                    
-        Type: Instance of class tower.
-        
-        Return: (x,y) tuple for the top left corner of tower's coverage area.
-        
-        e.g. 
-        >>> t = tower((1, 2),6,4)
-        >>>> t.coord_lr
-        (1,6)
-                    
-        Returns the top left corner of a tower's coverage area by taking
-        the height and adding it to the y-value of the of the tower object's
-        lower left corner (self.coord_ll[1]) attribute's y-coordinate.
-        
-        Assertions:
-            - Can only be used on an instance of tower class.
-        '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        return (self.coord_ll[0], self.coord_ll[1] + self.height)
+        _require(isinstance(coord,tuple), 'Warning! (x,y) must be a tuple.')
+        _require(len(coord) == 2, 'Warning! Only a tuple of length two!')
+        _require(width > 0, 'Warning! tower width must be greater than zero!')
+        _require(height > 0, 'Warning! tower height must be greater than zero!')
+        _require((coord[0] >= 0) and (coord[1] >= 0), 'Warning! Coordinates must be positive.')
+        _require(isinstance(coord[0],int) and isinstance(coord[1],int),'Coordinates must be integers.')
+        _require(isinstance(width,int), 'Warning! Must be int!')
+        _require(isinstance(height, int), 'Warning! Must be int!')
+        _fill(self,coord[0],coord[1],width,height)
+    
+    def __setattr__(self,name,value):
+        raise AttributeError('Warning! tower objects can not be changed!')
+    
+    def __delattr__(self,name):
+        raise AttributeError('Warning! tower objects can not be changed!')
     
-    @property
-    def coord_tr(self): #Top Right Corner
+    def __reduce__(self):
         '''
-        Returns top right corner of tower's coverage area as an (x,y) tuple
-        
-        Parameter: The instance of the tower being used to call this method is
-                    referred to as self.
-                    
-        Type: Instance of class tower.
-        
-        Return: (x,y) tuple for the top right corner of tower's coverage area.
-        
-        e.g. 
-        >>> t = tower((1, 2),6,4)
-        >>> t.coord_lr
-        (7,6)
-                    
-        Returns the top right corner of a tower's coverage area by taking
-        the height and adding it to the y-value of the of the tower object's
-        lower left corner (self.coord_ll[1]) attribute's y-coordinate as well as
-        taking the width and adding it to the tower object's lower left corner
-        (self.coord_ll[0]) attribute's x-coordinate.
-        
-        Assertions:
-            - Can only be used on an instance of tower class.
+        Lets towers be pickled (e.g. sent to other processes) by recreating
+        them from their lower left corner, width and height.
         '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        return (self.coord_ll[0] + self.width, self.coord_ll[1] + self.height)
-
-    @property
-    def area(self): #Coverage area of tower
+        return (tower,(self.coord_ll,self.width,self.height))
+    
+    def __hash__(self):
         '''
-        Returns the area of the tower's coverage area.
-        
-        Parameter: The instance of the tower being used to call this method is
-                    referred to as self.
-                    
-        Type: Instance of class tower.
-        
-        Return: Returns an integer value for the area.
-        
-        e.g. 
-        >>> t = tower((1, 2),6,4)
-        >>> t.area
-        24
-        
-        Returns the area for a given tower object by taking the tower's width 
-        (self.width) and a tower's height (self.height) and taking the product.
+        Returns a hash of the tower's lower left corner, width and height, so
+        that towers that are equivalent (see __eq__) have the same hash.
         
-        self.area = self.width * self.height
-        
-        Assertions: 
-            - Can only be used on an instance of tower class.
+        e.g.
+        >>> len(set([tower((0,0),2,2),tower((0,0),2,2),tower((1,1),2,2)]))
+        2
         '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        return self.width * self.height
+        return hash((self.x0,self.y0,self.width,self.height))
     
     def __repr__(self):
         '''
@@ -211,7 +154,6 @@ class tower(object):
         Assertions:
             - Can only be used on an instance of tower class.
         '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
         return 'tower(%s,%d,%d)' % (self.coord_ll,self.width,self.height)
             
     def contained(self,other):
@@ -259,8 +201,14 @@ class tower(object):
             - Method can only be used on instances of tower class.
             
         '''
-        assert isinstance(other,tower),'Warning! Argument is not of class tower!'
-        assert isinstance(self,tower), 'Warning! Argument is not of class tower!'
+        _require(isinstance(other,tower),'Warning! Argument is not of class tower!')
+        return self._contained(other)
+    
+    def _contained(self,other):
+        '''
+        contained() without the check on other, for callers that know it is
+        a tower.
+        '''
         checker = [False,False,False,False] #Corners = [lowerleft,TopLeft,lowerRight,TopRight]
         if (self.coord_ll[0] >= other.coord_ll[0]) and (self.coord_ll[1] >= other.coord_ll[1]):
             checker[0] = True
@@ -302,13 +250,26 @@ class tower(object):
             - Method can only be used on instances of tower class.
             
         '''
-        assert isinstance(self,tower)
-        assert isinstance(other,tower)
+        _require(isinstance(other,tower),'Warning! Argument must be of class tower!')
         if(self.coord_ll == other.coord_ll) and (self.width == other.width) and (self.height == other.height):
             return True
         else: 
             return False
     
+    def __ne__(self,other):
+        '''
+        Checks if one tower is not equivalent to another. Comparing a tower
+        with something that is not a tower (e.g. t != None) falls back to
+        Python's default comparison.
+        
+        e.g.
+        >>> tower((0,0),2,2) != tower((0,0),2,3)
+        True
+        '''
+        if not isinstance(other,tower):
+            return NotImplemented
+        return not self.__eq__(other)
+    
     def corner(self,other):
         '''
         Checks which corners of a tower are in another tower's coverage area.
@@ -354,8 +315,14 @@ class tower(object):
             - Method can only be used on instances of tower class.
                             
         '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        assert isinstance(other,tower), 'Warning! Argument must be of class tower!'
+        _require(isinstance(other,tower), 'Warning! Argument must be of class tower!')
+        return self._corner(other)
+    
+    def _corner(self,other):
+        '''
+        corner() without the check on other, for callers that know it is a
+        tower.
+        '''
         corners = [self.coord_ll,self.coord_tl,self.coord_lr,self.coord_tr]
         results = [] #The result of a corner.
         for corner in corners:
@@ -376,7 +343,7 @@ class tower(object):
                 
         return results
     
-    def subtowers(self):
+    def subtowers(self,metrics = None):
         '''
         Returns a generator object that produces all possible subtowers for a 
         given tower. Starts with subtowers with the largest area and goes down 
@@ -385,13 +352,18 @@ class tower(object):
         Parameter: self
         Type: tower object
         
+        Parameter: metrics
+        Type: SimulationMetrics or None. If given, the call and the number of
+                subtowers handed out are counted in it (see the
+                simulation_metrics module).
+        
         Return: generator object that produces a tower's sub-towers.
         
         e.g.
         >>> t = tower((0,0),2,2)
         >>> x = t.subtowers()
         >>> x
-        <generator object subtowers at 0x000000000D9B6870>
+        <generator object _subtowers at 0x000000000D9B6870>
         >>> for i in x:
         ...    print i
         ...
@@ -405,57 +377,126 @@ class tower(object):
         tower((0, 1),1,1)
         tower((1, 1),1,1)
         
-        It starts by taking the tower's width, height, and lower left corner value
-        and constructing lists of all possible widths,heights, x-coordinates,
-        and y-coordinates. Then it concatenates the widths and heights in order
-        to use the product function from the itertools module to produce all
-        possible width and height pairs into a list of tuples. It removes the 
-        duplicates in this list. We then sort the width and height pairs by
-        ordering them from the largest area to the smallest area that a pair
-        can produce by the use of the built-in sort function found in Python and
-        the use of a lambda function in it's argument. This helps avoid having
-        to compute a large list which can reach millions of subtowers long if the
-        desired coverage area is large enough.
+        The subtowers come in order of their shape, (width,height), from the
+        largest area to the smallest, as handed out by subtower_shapes(). For each
+        shape, every position that fits inside the tower is given, going along the
+        bottom row from left to right and then up one row at a time. Only one shape
+        is worked out at a time, so nothing is computed for the shapes after the
+        point where the caller stops.
         
         Assertions:
             - Can only be used on an instance of tower class.        
         '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        #Range of coordinate values possible within the current towers coverage area.
-        coord_x_list = range(self.width)
-        coord_y_list = range(self.height)
+        if metrics is None:
+            return self._subtowers()
+        return metrics.count_subtowers(self._subtowers())
+    
+    def _subtowers(self):
+        '''
+        Generator behind subtowers().
+        '''
+        x0,y0 = self.coord_ll
+        for width,height in self.subtower_shapes():
+            for y in range(y0,y0 + self.height - height + 1):
+                for x in range(x0,x0 + self.width - width + 1):
+                    yield _trusted(x,y,width,height)
+    
+    def subtower_shapes(self):
+        '''
+        Returns a generator of every (width,height) shape of subtower that fits in
+        the tower, from the largest area to the smallest.
         
-        #Possible x-values and y-values inside the tower's coverage area.
-        tower_xs = [i+self.coord_ll[0] for i in coord_x_list]
-        tower_ys = [i+self.coord_ll[1] for i in coord_y_list]
+        Parameter: self
+        Type: tower object
         
-        #Range of possible tower widths and heights possible within tower's coverage area.
-        w = range(self.width)
-        h = range(self.height)
-        tower_ws = [i+1 for i in w]
-        tower_hs = [i+1 for i in h]
+        Return: generator of (width,height) tuples of ints.
         
-        tower_width_height = tower_hs + tower_ws
+        e.g.
+        >>> list(tower((0,0),3,2).subtower_shapes())
+        [(3, 2), (2, 2), (3, 1), (1, 2), (2, 1), (1, 1)]
+        
+        Shapes with the same area come narrowest first. The shapes are kept in a
+        heap ordered by area. Every shape (w,h) other than the tower's own has a
+        single parent shape one size up: (w,h+1) if h is below the tower's height,
+        otherwise (w+1,h). A shape only goes into the heap when its parent comes
+        out, and a shape's area is never bigger than its parent's, so the shapes
+        come out of the heap largest first. The heap holds at most about width+1
+        shapes at a time, instead of all width*height of them being made and
+        sorted before the first one is handed out.
         
-        width_height_pairs = []
-        for product in it.product(tower_width_height,repeat = 2):
-            width_height_pairs.append(product)
-            
-        unique_pairs = list(set(width_height_pairs))
+        Assertions:
+            - Can only be used on an instance of tower class.
+        '''
+        top = self.height
+        heap = [(-self.width * top,self.width,top)]
+        while len(heap) != 0:
+            area,width,height = heapq.heappop(heap)
+            yield width,height
+            if height > 1:
+                heapq.heappush(heap,(-width * (height - 1),width,height - 1))
+            if (height == top) and (width > 1):
+                heapq.heappush(heap,(-(width - 1) * top,width - 1,top))
+    
+    def subtower_blocks(self,block_size = 4096):
+        '''
+        Returns a generator of the tower's subtowers in blocks, as NumPy arrays
+        instead of tower objects.
+        
+        Parameter: self
+        Type: tower object
         
-        #Ordering from largest area to smallest.
-        unique_pairs.sort(key = lambda (a,b): a*b, reverse = True)
+        Parameter: block_size
+        Type: int, the number of subtowers per block. The last block may be smaller.
         
-        for width,height in unique_pairs:
-            for y in tower_ys:
-                for x in tower_xs:
-                    t = tower((x,y),width,height)
-                    if all(t.contained(self)):
-                        yield t
-                    else:
-                        break
-                                     
+        Return: generator of integer arrays of shape (k,4). Each row is the
+                (x,y,width,height) of a subtower, where (x,y) is its lower left
+                corner. The rows come in the same order as subtowers(), so from
+                the largest area to the smallest.
         
+        e.g.
+        >>> blocks = tower((0,0),2,2).subtower_blocks(block_size = 4)
+        >>> next(blocks)
+        array([[0, 0, 2, 2],
+               [0, 0, 1, 2],
+               [1, 0, 1, 2],
+               [0, 0, 2, 1]])
+        
+        A whole block can be made into a TowerArray with TowerArray.from_block()
+        and checked against a list of towers at once (see the tower_array
+        module), so a search only makes a tower object for the subtower it ends
+        up keeping. Only the positions for the current block are worked out, so
+        stopping early costs nothing for the blocks that are not asked for.
+        
+        Assertions:
+            - Can only be used on an instance of tower class.
+            - block_size must be a positive integer.
+        '''
+        _require(isinstance(block_size,int) and block_size > 0, 'Warning! block_size must be a positive integer!')
+        x0,y0 = self.coord_ll
+        pieces = []
+        filled = 0
+        for width,height in self.subtower_shapes():
+            columns = self.width - width + 1
+            count = columns * (self.height - height + 1)
+            start = 0
+            while start < count:
+                take = min(count - start,block_size - filled)
+                rows,offsets = np.divmod(np.arange(start,start + take,dtype = np.int64),columns)
+                piece = np.empty((take,4),dtype = np.int64)
+                piece[:,0] = offsets + x0
+                piece[:,1] = rows + y0
+                piece[:,2] = width
+                piece[:,3] = height
+                pieces.append(piece)
+                filled += take
+                start += take
+                if filled == block_size:
+                    yield np.concatenate(pieces)
+                    pieces = []
+                    filled = 0
+        if filled > 0:
+            yield np.concatenate(pieces)
+    
     def overlap(self,other):
         '''
         Returns the overlap of one tower with another tower as a tower
@@ -476,27 +517,29 @@ class tower(object):
         >>> z.overlap(t)
         tower((1, 1),1,1)
         
-        Returns the region of overlap by looking for the largest subtower that
-        can represent the region of overlap. Due to the fact that when using 
-        the subtowers() method, it produces the subtowers with the largest area
-        first, that means that the first subtower that, when run through the
-        contained method, produces all true, then it would be equal to the region
-        of overlap. The use of the generator makes the computation quick. It can
-        find the overlap without having to generate all possible subtowers.
+        Returns the region of overlap by computing the intersection rectangle
+        directly. The left and bottom walls of the overlap are the larger of the
+        two towers' left and bottom walls, and the right and top walls are the
+        smaller of the two towers' right and top walls. If the resulting width
+        or height is not positive, the towers do not overlap (or only share a
+        wall) and None is returned.
+        
+        This gives the same tower as searching self.subtowers() for the largest
+        subtower that is contained in other, without building any subtowers.
 
        Assertions:
             - Method can only be used on instances of tower class. 
             
        '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        assert isinstance(other,tower), 'Warning! Argument must be of class tower!'               
+        _require(isinstance(other,tower), 'Warning! Argument must be of class tower!')
 
-        subtowers = self.subtowers()
-
-        for subtower in subtowers:
-            contained_check = subtower.contained(other)
-            if all(contained_check):
-                return subtower
+        x0 = max(self.coord_ll[0], other.coord_ll[0])
+        y0 = max(self.coord_ll[1], other.coord_ll[1])
+        x1 = min(self.coord_ll[0] + self.width, other.coord_ll[0] + other.width)
+        y1 = min(self.coord_ll[1] + self.height, other.coord_ll[1] + other.height)
+        
+        if (x1 > x0) and (y1 > y0):
+            return _trusted(x0,y0,x1 - x0,y1 - y0)
             
         return None
     
@@ -535,8 +578,14 @@ class tower(object):
             - Method can only be used on instances of tower class. 
             
         '''
-        assert isinstance (self,tower), 'Warning! Requires an instance of tower class!'
-        assert isinstance(other,tower), 'Warning! Argument must be of class tower!'
+        _require(isinstance(other,tower), 'Warning! Argument must be of class tower!')
+        return self._borders(other)
+    
+    def _borders(self,other):
+        '''
+        borders() without the check on other, for callers that know it is a
+        tower.
+        '''
         wall = [False, False, False, False] #[left wall, right wall, top wall, bottom wall]
         #Start with left wall.
         if (self.coord_ll[0] < other.coord_lr[0]) and (self.coord_ll[0] >= other.coord_ll[0]):
@@ -564,7 +613,7 @@ class tower(object):
                 wall[3] = True
         return wall
 
-    def truncate(self,other):
+    def truncate(self,other,metrics = None):
         '''
         Takes in a list of towers (other) to truncate against and returns a single tower
         object, optimizing new tower for maximum possible area.
@@ -573,7 +622,14 @@ class tower(object):
         Type: tower object
         
         Parameter: other
-        Type: list, items in this list must be type tower object.
+        Type: list, items in this list must be type tower object. Can also be
+                a TowerArray (see the tower_array module).
+        
+        Parameter: metrics
+        Type: SimulationMetrics or None. If given, the call, the number of
+                towers truncated against, the number of rectangles the search
+                compared and the time taken are added to it (see the
+                simulation_metrics module).
         
         Return: tower object representing truncated version of self maximized
                 for largest possible area. If no valid truncated version exists
@@ -586,35 +642,117 @@ class tower(object):
         >>> z.truncate([t])
         tower((2, 1),1,2)
         
-        It starts by calling the subtowers() method on self. It starts checking
-        subtowers (starting with the largest area) and checks them against all
-        towers found in the list (other). It only returns a the best truncated
-        version if it passes both the corner method and the border method with
-        values of all Falses (meaning not found inside the tower's we are
-        checking against) for all towers found in the list (other).
+        The search for the truncated tower is done by largest_empty_rectangle()
+        from the empty_rectangle module. It treats each tower in the list as an
+        obstacle and looks for the largest rectangle inside self that does not
+        overlap any of them, so the cost depends on how many towers are in the
+        list and not on the width and height of self. A subtower is valid if its
+        coverage area does not overlap any of the towers in the list, which is
+        the same as the corner method and the border method giving all Falses
+        against each of them. If two valid subtowers have the same area, the one
+        with the lowest bottom wall is returned, then the one with the lowest
+        left wall, then the widest one.
+        
+        Note: A tower from the list that sits strictly inside a subtower (not
+                touching any of its walls) blocks that subtower as well.
+        
+        When other is a TowerArray, the towers that overlap self are picked out
+        of it with a single vectorized call before the search, so a long list of
+        towers to truncate against does not have to be looped over in Python.
         
         Assertions:
             - Can only be used with tower objects.
-            - List argument must be a list.
-            - Arguments inside of list must be of class tower. Validated
-                within corner and borders method.
+            - List argument must be a list or TowerArray.
+            - Arguments inside of list must be of class tower.
         '''
-        assert isinstance(other,list), 'Warning! Argument must be type list!'
-            
-        subtowers = self.subtowers()
-        
-        default = None
-        
-        for subtower in subtowers:
-            valid = 1
-            for tower in other:
-                corner_check = subtower.corner(tower)
-                border_check = subtower.borders(tower)
-                if (any(corner_check)) or (any(border_check)):
-                    valid = 0
-                    break
-            if valid == 1:
-                #Only returns subtower if it's valid subtower for all towers it is checking against.
-                return subtower
-        
-        return default             
+        if isinstance(other,list):
+            for t in other:
+                _require(isinstance(t,tower), 'Warning! Items in list must be of class tower!')
+            return self._truncate(other,metrics)
+        
+        from tower_array import TowerArray
+        _require(isinstance(other,TowerArray), 'Warning! Argument must be type list or TowerArray!')
+        mask = other.overlaps(self)
+        obstacles = zip(other.x[mask].tolist(),other.y[mask].tolist(),
+                        other.x1[mask].tolist(),other.y1[mask].tolist())
+        return self._truncate_obstacles(obstacles,metrics)
+    
+    def _truncate(self,other,metrics = None):
+        '''
+        truncate() of a list, without the checks on the items of the list, for
+        callers that know they are towers.
+        '''
+        return self._truncate_obstacles([(t.x0,t.y0,t.x1,t.y1) for t in other],metrics)
+    
+    def _truncate_obstacles(self,obstacles,metrics):
+        '''
+        truncate() against a list of (x0,y0,x1,y1) bounds.
+        '''
+        bounds = (self.x0,self.y0,self.x1,self.y1)
+        if metrics is None:
+            empty = largest_empty_rectangle(bounds,obstacles)
+        else:
+            start = clock()
+            metrics.truncate_calls += 1
+            metrics.truncate_blockers += len(obstacles)
+            empty = largest_empty_rectangle(bounds,obstacles,metrics)
+            metrics.time('truncate',clock() - start)
+        
+        if empty is None:
+            return None
+        
+        x0,y0,x1,y1 = empty
+        return _trusted(x0,y0,x1 - x0,y1 - y0)
+
+#Setters for tower's slots. tower.__setattr__ refuses every change, so
+#_fill() fills in the slots through these instead.
+_set_coord_ll = tower.coord_ll.__set__
+_set_width = tower.width.__set__
+_set_height = tower.height.__set__
+_set_area = tower.area.__set__
+_set_x0 = tower.x0.__set__
+_set_y0 = tower.y0.__set__
+_set_x1 = tower.x1.__set__
+_set_y1 = tower.y1.__set__
+_set_coord_lr = tower.coord_lr.__set__
+_set_coord_tl = tower.coord_tl.__set__
+_set_coord_tr = tower.coord_tr.__set__
+
+_new_tower = object.__new__
+
+def _require(condition,message):
+    '''
+    Raises an AssertionError with message if condition is False. Used for the
+    checks on user input instead of assert, which python -O leaves out.
+    '''
+    if not condition:
+        raise AssertionError(message)
+
+def _fill(t,x0,y0,width,height):
+    '''
+    Fills in the slots of the tower t with lower left corner (x0,y0).
+    '''
+    x1 = x0 + width
+    y1 = y0 + height
+    _set_width(t,width)
+    _set_height(t,height)
+    _set_area(t,width * height)
+    _set_x0(t,x0)
+    _set_y0(t,y0)
+    _set_x1(t,x1)
+    _set_y1(t,y1)
+    _set_coord_ll(t,(x0,y0))                        #Lower left corner
+    _set_coord_lr(t,(x1,y0))                        #Lower right corner
+    _set_coord_tl(t,(x0,y1))                        #Top left corner
+    _set_coord_tr(t,(x1,y1))                        #Top right corner
+
+def _trusted(x0,y0,width,height):
+    '''
+    Returns the same tower as tower((x0,y0),width,height) without checking the
+    arguments. Only for code that already knows they are valid: x0 and y0 are
+    non-negative ints and width and height are positive ints, e.g. because
+    they describe a part of a tower that was checked when it was made.
+    '''
+    t = _new_tower(tower)
+    _fill(t,x0,y0,width,height)
+    return t
@@ -1,12 +1,346 @@
 #Author: Humberto Hernandez
 #Last updated:  5/19/2018 7:30pm
+import itertools
+import multiprocessing
+from collections import namedtuple
 import numpy as np
 from tower_class import tower
+from spatial_index import make_index
+from occupancy_grid import OccupancyGrid
+from tower_sampling import make_sampler
+from simulation_metrics import SimulationMetrics, clock
+from truncate_cache import TruncateCache
+from coverage_statistics import CoverageStatistics
+from result_store import ResultStore
+from coverage_checkpoint import write_checkpoint, read_checkpoint, checkpoint_file
 
-from plotting_code_proj import plot_towers
+from plotting_code_proj import LivePlot
 from plotting_code_proj import color
 
-def coverage_up_to_n(n,width,height,plot = True, interval = 3):
+class CoverageState(object):
+    '''
+    Keeps a running count of how much of the desired coverage area has been
+    covered during a simulation.
+    
+    Attributes:
+        - self.width = Width of the desired coverage area.
+        - self.height = Height of the desired coverage area.
+        - self.desired_area = Area of the whole desired coverage area.
+        - self.covered_area = Area covered by the towers accepted so far.
+        - self.tower_count = Number of towers accepted so far.
+        - self.attempts = Number of randomly generated towers tried so far.
+        - self.free_area = Area not yet covered.
+        - self.fraction = Fraction of the desired coverage area covered, from
+            0.0 to 1.0.
+        - self.is_full = Whether the desired coverage area is fully covered.
+    
+    Methods:
+        - add(): Records an accepted tower.
+        - reset(): Goes back to an empty coverage area.
+    
+    The accepted towers never overlap each other, so the covered area is just
+    the sum of their areas. It is updated once per accepted tower instead of
+    being summed over every placed tower after each attempt. An instance can be
+    passed to coverage_up_to_n or average_towers_for_coverage and read from
+    another thread (or a debugger) to follow a long run.
+    
+    e.g.
+    >>> state = CoverageState(10,10)
+    >>> state.add(tower((0,0),5,4))
+    >>> state.covered_area, state.free_area, state.fraction
+    (20, 80, 0.2)
+    '''
+    
+    def __init__(self,width,height):
+        '''
+        Creates an empty coverage state for a width x height coverage area.
+        
+        Parameter: width
+        Type: int
+        
+        Parameter: height
+        Type: int
+        
+        Assertions:
+            - width and height must be positive integers.
+        '''
+        assert isinstance(width,int) and width > 0, 'Warning! Width must be a positive integer!'
+        assert isinstance(height,int) and height > 0, 'Warning! Height must be a positive integer!'
+        self.width = width
+        self.height = height
+        self.desired_area = width * height
+        self.reset()
+    
+    def reset(self):
+        '''
+        Clears the covered area, tower count and attempts.
+        '''
+        self.covered_area = 0
+        self.tower_count = 0
+        self.attempts = 0
+    
+    def add(self,t):
+        '''
+        Records tower t as accepted into the coverage area.
+        
+        Parameter: t
+        Type: tower object that does not overlap any previously added tower.
+        '''
+        self.covered_area += t.area
+        self.tower_count += 1
+    
+    @property
+    def free_area(self):
+        return self.desired_area - self.covered_area
+    
+    @property
+    def fraction(self):
+        return float(self.covered_area) / self.desired_area
+    
+    @property
+    def is_full(self):
+        return self.covered_area == self.desired_area
+    
+def _try_place(t,coverage_area,placed,grid = None,metrics = None,cache = None):
+    '''
+    Tries to place a randomly generated tower among the towers already placed.
+    
+    Parameter: t
+    Type: tower object
+    
+    Parameter: coverage_area
+    Type: tower object covering the whole desired coverage area.
+    
+    Parameter: placed
+    Type: spatial index (see spatial_index.make_index) holding the towers
+            placed so far.
+    
+    Parameter: grid
+    Type: OccupancyGrid of the placed towers, or None.
+    
+    Parameter: metrics
+    Type: SimulationMetrics or None, passed on to tower.truncate().
+    
+    Parameter: cache
+    Type: TruncateCache or None. If given, t is truncated through the cache.
+    
+    Return: (status,new_tower), where new_tower is the tower to add to the
+            coverage area or None if t is rejected. status is one of
+            - 'outside': t is not inside the coverage area.
+            - 'covered': every cell of t is already covered. Only given when
+                grid is used.
+            - 'inside_tower': t is contained in an already placed tower.
+            - 'contains_tower': t contains an already placed tower.
+            - 'no_room': t has no valid truncated version.
+            - 'truncated': new_tower is the truncated version of t.
+            - 'placed': t does not overlap any placed tower and is new_tower.
+    
+    Only the placed towers that overlap t, as found by the spatial index, are
+    run through the contained, corner and borders methods. The placed towers
+    that t does not overlap can never contain t, be contained by t or have
+    to be truncated against.
+    
+    When an occupancy grid is given, it is checked first. A tower whose cells
+    are all covered would either be contained in a placed tower, contain one,
+    or have no valid truncated version, so it is rejected straight away. A tower
+    whose cells are all free overlaps no placed tower and is placed as is. Only
+    partially covered towers go on to the pairwise checks.
+    
+    t comes from the candidate sampler and the placed towers passed the same
+    checks, so they are all known to be towers. The pairwise checks use the
+    unchecked variants of the tower methods (_contained(), _corner(),
+    _borders() and _truncate()), which skip checking their argument.
+    '''
+    #Check if newly generated tower is contained in main coverage area.
+    if not all(t._contained(coverage_area)):
+        return 'outside', None
+    
+    if grid is not None:
+        covered = grid.covered_cells(t)
+        if covered == 0:
+            return 'placed', t
+        if covered == t.area:
+            return 'covered', None
+    
+    nearby = placed.query(t)
+    
+    #Checking to see if newly generated tower is inside any of the
+    #already established towers. With a grid this can not happen, since
+    #a tower inside a placed tower would be entirely covered.
+    if grid is None:
+        for t_i in nearby:
+            if all(t._contained(t_i)):
+                return 'inside_tower', None
+    #Checking to see if any of my established towers are inside of my
+    #newly generated tower.
+    for t_i in nearby:
+        if all(t_i._contained(t)):
+            return 'contains_tower', None
+    
+    truncate_list = []
+    for tow in nearby:
+        if any(t._corner(tow)) or any(t._borders(tow)):
+            truncate_list.append(tow)
+    
+    if len(truncate_list) == 0:
+        return 'placed', t
+    
+    if cache is None:
+        truncated = t._truncate(truncate_list,metrics)
+    else:
+        truncated = cache.truncate(t,truncate_list,metrics)
+    if truncated is None:
+        return 'no_room', None
+    return 'truncated', truncated
+
+#Kinds of events iter_coverage() can yield, in the order they happen to a tower.
+EVENT_KINDS = ('drawn','rejected','truncated','accepted','full')
+
+#One step of a simulation. See iter_coverage().
+CoverageEvent = namedtuple('CoverageEvent',['kind','candidate','tower','reason','tower_count','attempts','fraction'])
+
+def iter_coverage(width,height,n = None,index = 'grid',occupancy = False,state = None,batch_size = 1,rng = None,kinds = EVENT_KINDS,sampler = 'uniform',metrics = None,cache = None):
+    '''
+    Places random towers in a width x height coverage area and yields an event
+    for every step of the simulation as it happens.
+    
+    Parameter: width
+    Type: int
+    
+    Parameter: height
+    Type: int
+    
+    Parameter: n
+    Type: int or None, the number of towers to place. If None, towers are placed
+            until the coverage area is full.
+    
+    Parameter: rng
+    Type: np.random.RandomState or None. None draws from np.random.
+    
+    Parameter: kinds
+    Type: iterable of str, the kinds of events to yield (see EVENT_KINDS). The
+            other kinds are not made at all, so asking for fewer events makes
+            the simulation faster. With no kinds, nothing is yielded and the
+            simulation simply runs to the end.
+    
+    index, occupancy, state, batch_size, sampler, metrics and cache are the
+    same as for coverage_up_to_n().
+    
+    Return: generator of CoverageEvent, a namedtuple with the fields
+        - kind: one of
+            - 'drawn': a random tower was drawn. candidate is the tower.
+            - 'rejected': candidate was thrown out. reason is why, one of the
+                statuses of _try_place(): 'outside', 'covered', 'inside_tower',
+                'contains_tower' or 'no_room'.
+            - 'truncated': candidate was cut down to tower, which is accepted next.
+            - 'accepted': tower was added to the coverage area. reason is
+                'truncated' if tower is a truncated version of candidate,
+                otherwise 'placed'.
+            - 'full': the coverage area is full. This is always the last event.
+        - candidate: the randomly drawn tower, or None.
+        - tower: the tower added to the coverage area, or None.
+        - reason: see kind, or None.
+        - tower_count: number of towers accepted so far.
+        - attempts: number of random towers drawn so far.
+        - fraction: fraction of the coverage area covered so far.
+    e.g.
+    >>> for event in iter_coverage(10,10,kinds = ('accepted',)):
+    ...     print event.tower, event.fraction
+    tower((4, 0),2,7) 0.14
+    tower((1, 3),3,5) 0.29
+    ...
+    
+    Nothing is kept from one step to the next other than the placed towers, so
+    a consumer can log, plot or count the events, and stop the simulation
+    whenever it likes by breaking out of the loop. The random towers that the
+    candidate sampler throws out itself, because they stick out of the coverage
+    area or are already covered (see the tower_sampling module), are counted in
+    attempts but do not get events of their own.
+    
+    Assertions:
+        - width must be a positive integer greater than zero.
+        - height must be a positive integer greater than zero.
+        - n must be a positive integer or None.
+        - kinds must only hold kinds from EVENT_KINDS.
+    '''
+    assert width > 0, 'Warning! Width of coverage area must be greater than 0!'
+    assert isinstance(width,int), 'Warning! Width must be an integer!'
+    assert height > 0, 'Warning! Height of coverage area must be greater than 0!'
+    assert isinstance(height,int),'Warning! Height must be an integer!'
+    assert (n is None) or (isinstance(n,int) and n > 0), 'Warning! Number of towers must be a positive integer!'
+    assert isinstance(occupancy,bool), 'Warning! occupancy must be True or False!'
+    kinds = frozenset(kinds)
+    assert kinds <= frozenset(EVENT_KINDS), 'Warning! Event kinds must be from %s!' % (EVENT_KINDS,)
+    
+    if state is None:
+        state = CoverageState(width,height)
+    assert isinstance(state,CoverageState), 'Warning! state must be a CoverageState!'
+    assert (state.width,state.height) == (width,height), 'Warning! state must be for the same coverage area!'
+    state.reset()
+    coverage_area = tower((0,0),width,height) #Taking advantage of my tower class method.
+    
+    placed = make_index(index,width,height)
+    grid = None
+    if occupancy or (sampler == 'free'):
+        grid = OccupancyGrid(width,height)
+    candidates = make_sampler(sampler,width,height,batch_size,rng,grid)
+    generator = iter(candidates)
+    
+    drawn = 'drawn' in kinds
+    rejected = 'rejected' in kinds
+    truncated = 'truncated' in kinds
+    accepted = 'accepted' in kinds
+    
+    timed = metrics is not None
+    if timed:
+        metrics.runs += 1
+        began = clock()
+    
+    try:
+        while ((n is None) or (state.tower_count < n)) and not state.is_full:
+            if timed:
+                start = clock()
+            t = next(generator)
+            state.attempts = candidates.drawn
+            if timed:
+                metrics.time('sample',clock() - start)
+            if drawn:
+                yield CoverageEvent('drawn',t,None,None,state.tower_count,state.attempts,state.fraction)
+            
+            if timed:
+                start = clock()
+            status, new_tower = _try_place(t,coverage_area,placed,grid,metrics,cache)
+            if timed:
+                metrics.time('place',clock() - start)
+                metrics.count_status(status)
+            
+            if new_tower is None:
+                if rejected:
+                    yield CoverageEvent('rejected',t,None,status,state.tower_count,state.attempts,state.fraction)
+                continue
+            if truncated and (status == 'truncated'):
+                yield CoverageEvent('truncated',t,new_tower,status,state.tower_count,state.attempts,state.fraction)
+            
+            if timed:
+                start = clock()
+            placed.insert(new_tower)
+            if grid is not None:
+                grid.add(new_tower)
+            state.add(new_tower)
+            if timed:
+                metrics.time('update',clock() - start)
+            if accepted:
+                yield CoverageEvent('accepted',t,new_tower,status,state.tower_count,state.attempts,state.fraction)
+    finally:
+        #Also runs when the consumer stops early and the generator is closed.
+        if timed:
+            metrics.count_sampler(candidates)
+            metrics.time('total',clock() - began)
+    
+    if state.is_full and ('full' in kinds):
+        yield CoverageEvent('full',None,None,None,state.tower_count,state.attempts,state.fraction)
+
+def coverage_up_to_n(n,width,height,plot = True, interval = 3, index = 'grid', occupancy = False, state = None, batch_size = 1, sampler = 'uniform', metrics = None, cache = None, blit = False):
     '''
     Takes in an amount of towers and a desired coverage area described by a
     height and width and returns a list of randomly generated towers
@@ -25,12 +359,58 @@ def coverage_up_to_n(n,width,height,plot = True, interval = 3):
     Type: bool
     
     Parameter: interval
-    Type: int  
+    Type: int or float, the number of seconds each frame is shown for.
+    
+    Parameter: index
+    Type: str, the kind of spatial index used to find placed towers near a new
+            tower. One of 'grid', 'rtree' or 'array'.
+    
+    Parameter: occupancy
+    Type: bool, whether to keep an occupancy grid of the covered cells (see the
+            occupancy_grid module) to skip the pairwise checks for new towers
+            that are entirely free or entirely covered.
+    
+    Parameter: state
+    Type: CoverageState or None. If given, it is reset and kept up to date
+            during the run so the progress can be read while it is running.
+    
+    Parameter: batch_size
+    Type: int, the number of random towers drawn at a time (see the
+            tower_sampling module). The default of 1 draws the same towers as
+            always for a given np.random.seed(). Larger batches are faster,
+            especially with occupancy set to True, but draw different towers.
+    
+    Parameter: sampler
+    Type: str, how the random towers are drawn. 'uniform' draws them over the
+            whole coverage area. 'free' only draws towers that are not
+            entirely covered already, using an occupancy grid, which is much
+            faster once the coverage area is nearly full. Both place towers
+            with the same probabilities (see tower_sampling.FreeSpaceSampler),
+            but draw different towers for the same seed.
+    
+    Parameter: metrics
+    Type: SimulationMetrics or None. If given, the attempts, the reasons towers
+            were thrown out, the work done by truncate() and the time spent in
+            each phase are added to it (see the simulation_metrics module).
+            If None, nothing is counted or timed.
+    
+    Parameter: cache
+    Type: TruncateCache or None. If given, the results of truncate() are kept
+            in it and looked up again when a tower of the same size is cut by
+            the same towers (see the truncate_cache module). The towers placed
+            are the same either way. The same cache can be passed to many runs.
+    
+    Parameter: blit
+    Type: bool, whether the plot is drawn by blitting (see
+            plotting_code_proj.LivePlot), so a frame costs the same however
+            many towers have been placed. Only used when plot is True.
     
     Return:
         - list of towers that populate the coverage area.
-        - list of towers that populate the coverage area in a format compatible
-            with the function plot_towers().
+        - list of [tower,color,hatch,fill] lists of the towers that populate
+            the coverage area, as drawn on the LivePlot when plot is True.
+            The same list can be drawn again with
+            plotting_code_proj.plot_towers() or plot_tower_collection().
         - Returns a tuple containing the desired coverage versus the resulting
             coverage given n towers. (desired_area,actual_area)
     e.g.
@@ -68,7 +448,7 @@ def coverage_up_to_n(n,width,height,plot = True, interval = 3):
         - height must be an integer.   
         - plot must be a boolean, True or False
         - interval must be a positive number
-        - interval must be an integer.          
+        - interval must be an int or float.          
         
     Takes an amount of towers and desired coverage region and randomly generates
     those towers to populate that region. You can opt to watch the attempts take
@@ -93,7 +473,15 @@ def coverage_up_to_n(n,width,height,plot = True, interval = 3):
     
     To speed up processing, we only truncate the new tower against towers that it
     overlaps with, which we check with the contained and borders method. If it doesn't
-    overlap with any, then we can just add it to the valid tower list.
+    overlap with any, then we can just add it to the valid tower list. The towers
+    that could overlap the new tower are looked up in a spatial index (see the
+    spatial_index module), so the checks above are only run against nearby towers
+    instead of every tower placed so far. With occupancy set to True, a new tower
+    whose cells are all covered is thrown out, and one whose cells are all free is
+    added, without looking at the placed towers at all. The random towers are drawn
+    batch_size at a time, and the ones that stick out of the coverage area (or are
+    already covered, when using the occupancy grid) are thrown out for the whole
+    batch at once.
     
     If there is no valid truncated version of the tower than we toss it out and try
     again. If there is one, we can add it to the valid tower list.
@@ -104,14 +492,20 @@ def coverage_up_to_n(n,width,height,plot = True, interval = 3):
     Once we have found all the towers we are finished.
     
     In the plotting mode, it will show the attempted new tower as a slash-box.
-    Then it will get replaced with a colored truncated version.
+    Then it will get replaced with a colored truncated version. The plot is a
+    single LivePlot figure that the towers are added to and taken off as they
+    change, so it does not get slower to draw as the towers add up.
+    
+    The simulation itself is run by iter_coverage(), which yields each step as
+    it happens. Use it directly to watch or stop a simulation without waiting
+    for it to finish.
     
     Assertions:
         - n must be a positive integer greater than zero.
         - width must be a positive integer greater than zero.
         - height must be a positive integer greater than zero.
         - plot must be a boolean, True or False
-        - interval must be a positive integer greater than zero.
+        - interval must be a positive number greater than zero.
     '''
     assert n > 0, 'Warning! Number of towers must be greater than zero!'
     assert isinstance(n,int), 'Warning! Number of towers must be an integer!'
@@ -121,117 +515,208 @@ def coverage_up_to_n(n,width,height,plot = True, interval = 3):
     assert isinstance(height,int),'Warning! Height must be an integer!'
     assert isinstance(plot,bool), 'Warning! plot must be True or False!'
     assert interval > 0, 'Warning! Interval must be greater than zero!'
-    assert isinstance(interval,int), 'Warning! Interval must be an integer!'
+    assert isinstance(interval,(int,float)), 'Warning! Interval must be a number!'
+    assert isinstance(blit,bool), 'Warning! blit must be True or False!'
+    assert isinstance(occupancy,bool), 'Warning! occupancy must be True or False!'
     
     print 'Computing...'
-    confirmed_towers = 0
-    coverage_area = tower((0,0),width,height) #Taking advantage of my tower class method.
+    if plot:
+        live = LivePlot(width,height,blit)
+    if state is None:
+        state = CoverageState(width,height)
     
     valid_towers = []
     plot_list = []
     
-    desired_area = width * height
+    kinds = ('accepted','full')
+    if plot:
+        kinds = ('rejected','accepted','full')
     
-    while confirmed_towers < n:
-        
-        x_rand = np.random.randint(width, size = 1)
-        y_rand = np.random.randint(height, size = 1)
-        x = x_rand[0]
-        y = y_rand[0]
+    for event in iter_coverage(width,height,n,index,occupancy,state,batch_size,kinds = kinds,sampler = sampler,metrics = metrics,cache = cache):
         
-        width_rand = np.random.randint(1,width+1, size = 1) #Have to be careful about half-open interval
-        height_rand = np.random.randint(1,height+1, size = 1)
-        tower_width = width_rand[0]
-        tower_height = height_rand[0]
-        ###
-        t = tower((x,y),tower_width,tower_height)
-        
-        #Check if newly generated tower is contained in main coverage area.
-        test = t.contained(coverage_area)
-        valid = 1
-        if all(test) != True:
-            valid = 0
-                
-        
-        if len(valid_towers) != 0:
-            #Checking to see if newly generated tower is inside any of the
-            #already established towers.
-            for t_i in valid_towers:
-                checks = t.contained(t_i)
-                if all(checks) == True:
-                    valid = 0
-            #Checking to see if any of my established towers are inside of mu
-            #newly generated tower.
-            for t_i in valid_towers:
-                checks = t_i.contained(t)
-                if all(checks) == True:
-                    valid = 0
-                    
-        #Now that we have validated the new tower, we can proceed.
-        if valid == 1:
-            #Plotting newly generated tower.
-            if plot:
-                plot_t = [t,None,'/',False]
-                plot_list.append(plot_t)
-                plot_towers(plot_list,width,height)
-                plt.pause(interval)
-                plt.close()
-            #If the tower generated is equal to the coverage area, then we are done.
-            if (len(valid_towers) == 0) and (t == coverage_area):
-                valid_towers.append(t)
-                return list_of_towers, plot_list
-            elif len(valid_towers) == 0:
-                valid_towers.append(t)
-                if plot:
-                    plot_list.pop()
-                    color_rect = '#%02X%02X%02X' % (color(),color(),color())
-                    plot_list.append([t,color_rect,None,True])
-                confirmed_towers += 1
-            else:
-                truncate_list = []
-                for tow in valid_towers:
-                    if any(t.corner(tow)) or any(t.borders(tow)):
-                        truncate_list.append(tow)
-                        
-                if len(truncate_list) != 0:        
-                    truncated = t.truncate(truncate_list) #Was valid towers
-                    if truncated != None:   
-                        if plot:
-                            plot_list.pop()
-                            color_rect = '#%02X%02X%02X' % (color(),color(),color())
-                            plot_list.append([truncated,color_rect,None,True])
-                        confirmed_towers += 1
-                        valid_towers.append(truncated)
-                    else:
-                        if plot:
-                            plot_list.pop()
-                        
-                else:
-                    if plot:
-                        plot_list.pop()
-                        color_rect = '#%02X%02X%02X' % (color(),color(),color())
-                        plot_list.append([t,color_rect,None,True])
-                    confirmed_towers += 1
-                    valid_towers.append(t)
-                if plot: 
-                    if confirmed_towers == n:
-                        plot_towers(plot_list,width,height)    
-                        
-        actual_area = 0
-        for coverage in valid_towers:
-            actual_area = actual_area + coverage.area
-        
-        if (actual_area == desired_area):
+        if event.kind == 'full':
             print "Coverage area has been filled!"
             break
         
+        #Plotting newly generated tower once it has passed the containment checks.
+        if plot and (event.reason in ('no_room','truncated','placed')):
+            trying = live.add(event.candidate,None,'/',False,moving = True,validate = False)
+            live.draw(interval)
+            live.remove(trying)
+        
+        if event.kind == 'accepted':
+            valid_towers.append(event.tower)
+            if plot:
+                color_rect = '#%02X%02X%02X' % (color(),color(),color())
+                plot_list.append([event.tower,color_rect,None,True])
+                live.add(event.tower,color_rect,None,True,validate = False)
+    
+    if plot:
+        live.draw()
+    desired_area = state.desired_area
+    actual_area = state.covered_area
     print 'Desired area: ', desired_area
     print 'Actual area: ', actual_area
 
 
     return valid_towers, (desired_area,actual_area), plot_list 
 
-def average_towers_for_coverage(iterations,width,height):
+def _fill_coverage_area(width,height,rng = None,index = 'grid',occupancy = False,state = None,batch_size = 1,sampler = 'uniform',metrics = None,cache = None):
+    '''
+    Places random towers until a width x height coverage area is full and
+    returns the number of towers it took. This is one iteration of
+    average_towers_for_coverage().
+    
+    Parameter: rng
+    Type: np.random.RandomState or None. None draws from np.random.
+    
+    The other parameters are the same as for average_towers_for_coverage().
+    '''
+    if state is None:
+        state = CoverageState(width,height)
+    for event in iter_coverage(width,height,None,index,occupancy,state,batch_size,rng,(),sampler,metrics,cache):
+        pass
+    
+    return state.tower_count
+
+def iteration_rng(seed,iteration):
+    '''
+    Returns the random number generator used for one iteration of a seeded run.
+    
+    Every iteration gets its own stream, seeded from the master seed and the
+    iteration number together, so the towers drawn in an iteration do not
+    depend on which process runs it or on what ran before it.
+    
+    Parameter: seed
+    Type: int, the master seed.
+    
+    Parameter: iteration
+    Type: int, counting from zero.
+    
+    Return: np.random.RandomState
+    '''
+    return np.random.RandomState([seed,iteration])
+
+#Truncate caches of a worker process, by (max_entries,eviction), kept from one
+#iteration to the next.
+_worker_caches = {}
+
+def _count_towers(job):
+    '''
+    Runs one seeded iteration in a worker process. job is the tuple
+    (width,height,seed,iteration,index,occupancy,batch_size,sampler,collect,cache),
+    where cache is the (max_entries,eviction) of the TruncateCache to use, or
+    None. It is a single tuple, and this is a module level function, so that
+    Pool.imap() can send it to the workers. Returns (towers,metrics,cache_stats),
+    where metrics is None unless collect is True and cache_stats holds the
+    cache lookups of this iteration, or is None without a cache.
+    '''
+    width,height,seed,iteration,index,occupancy,batch_size,sampler,collect,cache_config = job
+    metrics = None
+    if collect:
+        metrics = SimulationMetrics()
+    cache = None
+    if cache_config is not None:
+        if cache_config not in _worker_caches:
+            _worker_caches[cache_config] = TruncateCache(*cache_config)
+        cache = _worker_caches[cache_config]
+        before = cache.stats()
+    count = _fill_coverage_area(width,height,iteration_rng(seed,iteration),index,occupancy,None,batch_size,sampler,metrics,cache)
+    cache_stats = None
+    if cache is not None:
+        after = cache.stats()
+        cache_stats = dict((key,after[key] - before[key]) for key in ('hits','misses','evictions'))
+    return count, metrics, cache_stats
+
+def iter_tower_counts(iterations,width,height,seed = None,workers = 1,start = 0,index = 'grid',occupancy = False,state = None,batch_size = 1,sampler = 'uniform',metrics = None,cache = None):
+    '''
+    Yields the number of towers needed to fill a width x height coverage area,
+    one count per iteration, in order of iteration.
+    
+    Parameter: iterations
+    Type: int, the number of counts to yield.
+    
+    Parameter: seed
+    Type: int or None. If given, iteration i draws its towers from
+            iteration_rng(seed,i), so the counts are the same for any number
+            of workers. If None and workers is 1, the towers are drawn from
+            np.random as always. If None and workers is more than 1, a master
+            seed is drawn from np.random, so np.random.seed() still makes the
+            run repeatable.
+    
+    Parameter: workers
+    Type: int, the number of processes the iterations are spread over. With 1,
+            everything runs in this process.
+    
+    Parameter: start
+    Type: int, the number of the first iteration. A seeded run split into
+            pieces with start gives the same counts as a single run.
+    
+    Parameter: state
+    Type: CoverageState or None. Only kept up to date when workers is 1, since
+            the other iterations run in other processes.
+    
+    Parameter: metrics
+    Type: SimulationMetrics or None. With more than 1 worker, every worker
+            collects metrics of its own, which are merged into these as the
+            counts come back.
+    
+    Parameter: cache
+    Type: TruncateCache or None. With more than 1 worker, every worker keeps a
+            cache of its own with the same max_entries and eviction, and their
+            hits, misses and evictions are added to this cache's counts as
+            the counts come back.
+    
+    index, occupancy, batch_size and sampler are the same as for
+    average_towers_for_coverage().
+    
+    Return: generator of int.
+    
+    The pool is shut down once the last count is yielded, or as soon as the
+    generator is closed, so a caller can stop early without waiting for the
+    remaining iterations.
+    
+    Assertions:
+        - workers must be a positive integer.
+        - start must not be negative.
+        - state can only be given when workers is 1.
+    '''
+    assert isinstance(workers,int) and workers > 0, 'Warning! workers must be a positive integer!'
+    assert isinstance(start,int) and start >= 0, 'Warning! start must not be negative!'
+    assert (state is None) or (workers == 1), 'Warning! state can only be used with one worker!'
+    
+    if iterations == 0:
+        return
+    if workers == 1:
+        for i in xrange(start,start + iterations):
+            rng = None
+            if seed is not None:
+                rng = iteration_rng(seed,i)
+            yield _fill_coverage_area(width,height,rng,index,occupancy,state,batch_size,sampler,metrics,cache)
+        return
+    
+    if seed is None:
+        seed = np.random.randint(2**31 - 1)
+    collect = metrics is not None
+    cache_config = None
+    if cache is not None:
+        cache_config = (cache.max_entries,cache.eviction)
+    jobs = ((width,height,seed,i,index,occupancy,batch_size,sampler,collect,cache_config) for i in xrange(start,start + iterations))
+    chunksize = max(1,iterations // (4 * workers))
+    pool = multiprocessing.Pool(workers)
+    try:
+        for count, worker_metrics, cache_stats in pool.imap(_count_towers,jobs,chunksize):
+            if collect:
+                metrics.merge(worker_metrics)
+            if cache_stats is not None:
+                cache.add_stats(cache_stats)
+            yield count
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+def average_towers_for_coverage(iterations,width,height,index = 'grid',occupancy = False,state = None,batch_size = 1,workers = 1,seed = None,return_counts = False,sampler = 'uniform',metrics = None,cache = None,relative_error = None,half_width = None,confidence = 0.95,min_iterations = 30,stats = None,store = None,checkpoint = None,checkpoint_every = 100):
     '''
     Takes in an amount of iterations and a desired coverage area described by a
     height and width and returns the average amount of towers needed to fully
@@ -246,8 +731,103 @@ def average_towers_for_coverage(iterations,width,height):
     Parameter: height
     Type: int    
     
+    Parameter: index
+    Type: str, the kind of spatial index used to find placed towers near a new
+            tower. One of 'grid', 'rtree' or 'array'.
+    
+    Parameter: occupancy
+    Type: bool, whether to keep an occupancy grid of the covered cells (see the
+            occupancy_grid module) to skip the pairwise checks for new towers
+            that are entirely free or entirely covered.
+    
+    Parameter: state
+    Type: CoverageState or None. If given, it is reset at the start of every
+            iteration and kept up to date during the run so the progress of
+            the current iteration can be read while it is running.
+    
+    Parameter: batch_size
+    Type: int, the number of random towers drawn at a time (see the
+            tower_sampling module). The default of 1 draws the same towers as
+            always for a given np.random.seed(). Larger batches are faster,
+            especially with occupancy set to True, but draw different towers.
+    
+    Parameter: sampler
+    Type: str, how the random towers are drawn. 'uniform' draws them over the
+            whole coverage area. 'free' only draws towers that are not
+            entirely covered already, using an occupancy grid, which is much
+            faster once the coverage area is nearly full. Both place towers
+            with the same probabilities (see tower_sampling.FreeSpaceSampler),
+            but draw different towers for the same seed.
+    
+    Parameter: metrics
+    Type: SimulationMetrics or None. If given, the attempts, the reasons towers
+            were thrown out, the work done by truncate() and the time spent in
+            each phase are added to it (see the simulation_metrics module).
+            If None, nothing is counted or timed.
+    
+    Parameter: cache
+    Type: TruncateCache or None. If given, the results of truncate() are kept
+            in it and looked up again when a tower of the same size is cut by
+            the same towers (see the truncate_cache module), which happens
+            often over many iterations on a small coverage area. The averages
+            are the same either way. See iter_tower_counts() for more than 1
+            worker.
+    
+    Parameter: workers
+    Type: int, the number of processes the iterations are spread over. The
+            iterations do not depend on each other, so they can run at the
+            same time on different cores. state can only be given with 1.
+    
+    Parameter: seed
+    Type: int or None. If given, every iteration draws from its own random
+            stream made from seed and the iteration number, so the result is
+            the same for any number of workers. See iter_tower_counts().
+    
+    Parameter: return_counts
+    Type: bool, whether to also return the number of towers of every iteration.
+            Otherwise the counts are not kept, so memory does not grow with
+            the number of iterations.
+    
+    Parameter: relative_error
+    Type: float or None. If given, the run stops early once the half width of
+            the confidence interval of the average is at most this fraction
+            of the average, e.g. 0.01 for 1%. iterations is then the most
+            iterations run.
+    
+    Parameter: half_width
+    Type: float or None. If given, the run stops early once the half width of
+            the confidence interval of the average is at most this many
+            towers. With relative_error as well, both have to be met.
+    
+    Parameter: confidence
+    Type: float, the confidence level of the interval, between 0 and 1.
+    
+    Parameter: min_iterations
+    Type: int, the fewest iterations run before stopping early.
+    
+    Parameter: stats
+    Type: CoverageStatistics or None. If given, every count is added to it
+            (see the coverage_statistics module), which gives the variance,
+            confidence interval, histogram and percentiles of the counts.
+    
+    Parameter: store
+    Type: ResultStore or None. If given, seed must be given too, and the
+            counts already stored for the run are used instead of simulated
+            again (see below).
+    
+    Parameter: checkpoint
+    Type: str or None, a json file the progress of the run is saved to. If it
+            already holds a run of the same coverage area, sampler, batch_size
+            and seed, the run carries on from there (see below and
+            resume_average_towers()).
+    
+    Parameter: checkpoint_every
+    Type: int, the number of iterations between checkpoints.
+    
     Return:
         - Returns the average for the number of iterations asked for by the user.
+        - If return_counts is True, returns (average,counts) where counts is
+          the list of tower counts, one per iteration.
     e.g.
     
     Assertions:
@@ -280,7 +860,15 @@ def average_towers_for_coverage(iterations,width,height):
     
     To speed up processing, we only truncate the new tower against towers that it
     overlaps with, which we check with the contained and borders method. If it doesn't
-    overlap with any, then we can just add it to the valid tower list.
+    overlap with any, then we can just add it to the valid tower list. The towers
+    that could overlap the new tower are looked up in a spatial index (see the
+    spatial_index module), so the checks above are only run against nearby towers
+    instead of every tower placed so far. With occupancy set to True, a new tower
+    whose cells are all covered is thrown out, and one whose cells are all free is
+    added, without looking at the placed towers at all. The random towers are drawn
+    batch_size at a time, and the ones that stick out of the coverage area (or are
+    already covered, when using the occupancy grid) are thrown out for the whole
+    batch at once.
     
     If there is no valid truncated version of the tower than we toss it out and try
     again. If there is one, we can add it to the valid tower list.
@@ -289,14 +877,38 @@ def average_towers_for_coverage(iterations,width,height):
     the amount of towers asked by the user.
     
     Once we have found all the towers we are finished and we go to the next iteration.
-    It does this until all the iterations are done.
+    It does this until all the iterations are done, or, with relative_error or
+    half_width given, until the average is known to that precision. The running
+    mean and variance are updated as each count comes in, so stopping is checked
+    after every iteration, and the remaining iterations are never started.
     
+    With a store (see result_store.ResultStore) and a seed, the counts of the
+    iterations already stored for this coverage area, sampler, batch_size and
+    seed are read back instead of simulated, and only the rest are run, starting
+    at the next iteration number. The new counts are added to the store, even
+    when the run is stopped early or interrupted, so the next call with the same
+    key only simulates iterations that no call has done before. The result is
+    the same as running all the iterations without a store.
     
+    With a checkpoint, the statistics of the iterations done so far (and the
+    counts themselves, if return_counts is True) are written to the checkpoint
+    file every checkpoint_every iterations and once more when the run ends,
+    however it ends. Since iteration i of a seeded run always draws from
+    iteration_rng(seed,i), the seed and the number of the next iteration are
+    all the random state there is, so a run started again from its checkpoint
+    goes on with exactly the towers it would have drawn, and ends with the same
+    average and statistics as if it had never stopped. Without a seed, one is
+    drawn from np.random so the run can be resumed.
     
+
     Assertions:
         - iterations must be a positive integer greater than zero.
         - width must be a positive integer greater than zero.
         - height must be a positive integer greater than zero.
+        - store can only be given with an integer seed.
+        - checkpoint_every must be a positive integer.
+        - A checkpoint that already exists must be of the same run, and must
+            hold the counts if return_counts is True.
 
     '''
     assert iterations > 0, 'Warning! Number of iterations must be greater than zero!'
@@ -305,94 +917,136 @@ def average_towers_for_coverage(iterations,width,height):
     assert isinstance(width,int), 'Warning! Width must be an integer!'
     assert height > 0, 'Warning! Height of coverage area must be greater than 0!'
     assert isinstance(height,int),'Warning! Height must be an integer!'
+    assert isinstance(occupancy,bool), 'Warning! occupancy must be True or False!'
+    
+    assert isinstance(return_counts,bool), 'Warning! return_counts must be True or False!'
+    assert (relative_error is None) or (relative_error > 0), 'Warning! relative_error must be greater than zero!'
+    assert (half_width is None) or (half_width > 0), 'Warning! half_width must be greater than zero!'
+    assert 0 < confidence < 1, 'Warning! confidence must be between 0 and 1!'
+    assert isinstance(min_iterations,int) and min_iterations >= 2, 'Warning! min_iterations must be an integer of at least 2!'
+    if stats is None:
+        stats = CoverageStatistics()
+    assert isinstance(stats,CoverageStatistics), 'Warning! stats must be a CoverageStatistics!'
+    assert (store is None) or isinstance(store,ResultStore), 'Warning! store must be a ResultStore!'
+    assert (store is None) or isinstance(seed,(int,long)), 'Warning! A store can only be used with an integer seed!'
+    assert isinstance(checkpoint_every,int) and checkpoint_every > 0, 'Warning! checkpoint_every must be a positive integer!'
     
     print 'Computing...'
-    confirmed_towers = 0
-    coverage_area = tower((0,0),width,height) #Taking advantage of my tower class method.
+    if (state is None) and (workers == 1):
+        state = CoverageState(width,height)
+    if state is not None:
+        assert isinstance(state,CoverageState), 'Warning! state must be a CoverageState!'
+        assert (state.width,state.height) == (width,height), 'Warning! state must be for the same coverage area!'
     
-    desired_area = width * height
     counter = 0
     number_of_towers = []
+    summation = 0
+    stopping = (relative_error is not None) or (half_width is not None)
     
-    while counter < iterations:
-        actual_area = 0
-        valid_towers = []
-        while actual_area != desired_area:
-            x_rand = np.random.randint(width, size = 1)
-            y_rand = np.random.randint(height, size = 1)
-            x = x_rand[0]
-            y = y_rand[0]
-            
-            width_rand = np.random.randint(1,width+1, size = 1) #Have to be careful about half-open interval
-            height_rand = np.random.randint(1,height+1, size = 1)
-            tower_width = width_rand[0]
-            tower_height = height_rand[0]
-            ###
-            t = tower((x,y),tower_width,tower_height)
-            
-            #Check if newly generated tower is contained in main coverage area.
-            test = t.contained(coverage_area)
-            valid = 1
-            if all(test) != True:
-                valid = 0
-                    
-            
-            if len(valid_towers) != 0:
-                #Checking to see if newly generated tower is inside any of the
-                #already established towers.
-                for t_i in valid_towers:
-                    checks = t.contained(t_i)
-                    if all(checks) == True:
-                        valid = 0
-                #Checking to see if any of my established towers are inside of mu
-                #newly generated tower.
-                for t_i in valid_towers:
-                    checks = t_i.contained(t)
-                    if all(checks) == True:
-                        valid = 0
-                        
-            #Now that we have validated the new tower, we can proceed.
-            if valid == 1:
-                #If the tower generated is equal to the coverage area, then we are done.
-                if (len(valid_towers) == 0) and (t == coverage_area):
-                    valid_towers.append(t)
-                    return list_of_towers, plot_list
-                elif len(valid_towers) == 0:
-                    valid_towers.append(t)
-                    confirmed_towers += 1
-                else:
-                    truncate_list = []
-                    for tow in valid_towers:
-                        if any(t.corner(tow)) or any(t.borders(tow)):
-                            truncate_list.append(tow)
-                            
-                    if len(truncate_list) != 0:        
-                        truncated = t.truncate(truncate_list) #Was valid towers
-                        if truncated != None:   
-                            confirmed_towers += 1
-                            valid_towers.append(truncated)                        
-                    else:
-                        confirmed_towers += 1
-                        valid_towers.append(t)  
-                            
-            actual_area = 0
-            for coverage in valid_towers:
-                actual_area = actual_area + coverage.area
-            
-            if (actual_area == desired_area):
-                print 'Iteration: %d. Desired coverage area has been filled!' % (counter+1)
+    if checkpoint is not None:
+        saved = None
+        if checkpoint_file(checkpoint) is not None:
+            saved = read_checkpoint(checkpoint)
+            if seed is None:
+                seed = saved['parameters']['seed']
+        elif seed is None:
+            seed = int(np.random.randint(2**31 - 1))
+        parameters = {'iterations': iterations, 'width': width, 'height': height, 'index': index,
+                      'occupancy': occupancy, 'batch_size': batch_size, 'seed': seed,
+                      'return_counts': return_counts, 'sampler': sampler, 'relative_error': relative_error,
+                      'half_width': half_width, 'confidence': confidence, 'min_iterations': min_iterations,
+                      'checkpoint_every': checkpoint_every}
+        if saved is not None:
+            for key in ('width','height','sampler','batch_size','seed'):
+                assert saved['parameters'][key] == parameters[key], 'Warning! The checkpoint is of a run with a different %s!' % key
+            assert (not return_counts) or (saved['counts'] is not None), 'Warning! The checkpoint does not hold the counts, so return_counts must be False!'
+            assert stats.count == 0, 'Warning! stats must be empty when resuming from a checkpoint!'
+            stats.load(saved['statistics'])
+            counter = stats.count
+            summation = stats.total
+            if return_counts:
+                number_of_towers = saved['counts']
+            print 'Resuming from iteration %d.' % (counter+1)
+    
+    def save_checkpoint():
+        write_checkpoint(checkpoint,{'parameters': parameters, 'statistics': stats.state(),
+                                     'counts': number_of_towers if return_counts else None})
+    
+    first = counter
+    if stopping and stats.converged(relative_error,half_width,confidence,min_iterations):
+        #The checkpoint is of a run that already stopped early.
+        first = iterations
+    stored_all = []
+    if store is not None:
+        stored_all = store.counts(width,height,seed,sampler,batch_size)
+        print 'Found %d stored iterations.' % len(stored_all)
+    stored = stored_all[first:iterations]
+    new_counts = []
+    
+    counts = iter_tower_counts(max(0,iterations - first - len(stored)),width,height,seed,workers,first + len(stored),index,occupancy,state,batch_size,sampler,metrics,cache)
+    try:
+        for count in itertools.chain(stored,counts):
+            print 'Iteration: %d. Desired coverage area has been filled!' % (counter+1)
+            stats.add(count)
+            if return_counts:
+                number_of_towers.append(count)
+            summation += count
+            counter += 1
+            #Only counts that follow straight on from the stored ones are stored.
+            if (store is not None) and (first <= len(stored_all)) and (counter > len(stored_all)):
+                new_counts.append(count)
+            if (checkpoint is not None) and (counter % checkpoint_every == 0):
+                save_checkpoint()
+            if stopping and stats.converged(relative_error,half_width,confidence,min_iterations):
+                print 'Confidence interval target met, stopping early.'
                 break
-            
-        number_of_towers.append(len(valid_towers))
-        counter += 1
+    finally:
+        #Shuts down the workers of any iterations not needed.
+        counts.close()
+        if (store is not None) and new_counts:
+            store.append(width,height,seed,new_counts,len(stored_all),sampler,batch_size)
+        if checkpoint is not None:
+            save_checkpoint()
     
-    summation = float(sum(number_of_towers))
-    average = summation / len(number_of_towers)
+    average = float(summation) / counter
     
-    print "Number of iterations: ", iterations
+    print "Number of iterations: ", counter
     print "Average: ", average    
+    if stopping:
+        print "%g%% confidence interval: +/- %s" % (100 * confidence,stats.half_width(confidence))
     
+    if return_counts:
+        return average, number_of_towers
     return average
+
+def resume_average_towers(checkpoint,workers = 1,metrics = None,cache = None,stats = None,store = None):
+    '''
+    Carries on with a run of average_towers_for_coverage() from its checkpoint
+    file, with the same options it was started with, and returns what that
+    run would have returned.
+    
+    Parameter: checkpoint
+    Type: str, the checkpoint file given to average_towers_for_coverage().
+    
+    Parameter: workers
+    Type: int. Any number of workers gives the same result, since the run
+            is seeded.
+    
+    metrics, cache, stats and store are the same as for
+    average_towers_for_coverage(). They are not kept in the checkpoint, so
+    metrics and cache only cover the iterations run after resuming.
+    
+    Return: the average, or (average,counts) if the run was started with
+            return_counts set to True.
+    e.g.
+    >>> average_towers_for_coverage(10000,10,10,seed = 143,checkpoint = 'run.json')
+    (the process is killed after 6150 iterations)
+    >>> resume_average_towers('run.json')
+    Resuming from iteration 6101.
+    ...
+    '''
+    parameters = read_checkpoint(checkpoint)['parameters']
+    return average_towers_for_coverage(workers = workers,metrics = metrics,cache = cache,stats = stats,store = store,checkpoint = checkpoint,**parameters)
        
         
         
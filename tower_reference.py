@@ -0,0 +1,107 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import numpy as np
+from tower_class import tower
+from tower_array import TowerArray
+
+#The original subtower searches of tower.overlap() and tower.truncate(). They
+#are kept to check the faster methods against, by the tests and by
+#tower_benchmarks, so this module only depends on the tower modules.
+
+def overlap_by_subtowers(t,other):
+    '''
+    Returns the overlap of t with other by searching t's subtowers, starting
+    with the largest area, for the first one contained in other. This is the
+    original implementation of tower.overlap() and is kept as a reference for
+    benchmarking against the closed-form version.
+
+    Parameter: t
+    Type: tower object
+
+    Parameter: other
+    Type: tower object
+
+    Return: tower object representing the region of overlap. If no overlap is
+            found, returns None.
+
+    Assertions:
+        - t and other must be tower objects.
+    '''
+    assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+    assert isinstance(other,tower), 'Warning! Argument must be of class tower!'
+
+    for subtower in t.subtowers():
+        if all(subtower.contained(other)):
+            return subtower
+
+    return None
+
+def truncate_by_subtowers(t,other):
+    '''
+    Returns the truncated version of t against the list of towers other by
+    searching t's subtowers, starting with the largest area, for the first one
+    that passes both the corner method and the borders method with all Falses
+    against every tower in other. This is the original implementation of
+    tower.truncate() and is kept as a reference for benchmarking against the
+    largest empty rectangle search.
+
+    Parameter: t
+    Type: tower object
+
+    Parameter: other
+    Type: list of tower objects
+
+    Return: tower object for the truncated version of t, or None if there is
+            no valid truncated version.
+
+    Assertions:
+        - t must be a tower object.
+        - other must be a list.
+    '''
+    assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+    assert isinstance(other,list), 'Warning! Argument must be type list!'
+
+    for subtower in t.subtowers():
+        valid = True
+        for blocking in other:
+            if any(subtower.corner(blocking)) or any(subtower.borders(blocking)):
+                valid = False
+                break
+        if valid:
+            return subtower
+
+    return None
+
+def truncate_by_blocks(t,other,block_size = 4096):
+    '''
+    Same search as truncate_by_subtowers(), but checks t's subtowers a block at
+    a time with TowerArray.clear_of() instead of one tower object at a time.
+
+    Parameter: t
+    Type: tower object
+
+    Parameter: other
+    Type: list of tower objects
+
+    Parameter: block_size
+    Type: int, see tower.subtower_blocks().
+
+    Return: tower object for the truncated version of t, or None if there is
+            no valid truncated version. Always the same tower as
+            truncate_by_subtowers().
+
+    Assertions:
+        - t must be a tower object.
+        - other must be a list.
+    '''
+    assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+    assert isinstance(other,list), 'Warning! Argument must be type list!'
+
+    blocking = TowerArray.from_towers(other)
+    for block in t.subtower_blocks(block_size):
+        candidates = TowerArray.from_block(block)
+        clear = np.flatnonzero(candidates.clear_of(blocking))
+        if len(clear) != 0:
+            return candidates[int(clear[0])]
+
+    return None
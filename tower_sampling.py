@@ -0,0 +1,301 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+import numpy as np
+from tower_class import _trusted
+
+#Why a drawn candidate was or was not handed out.
+KEEP = 0
+OUTSIDE = 1
+COVERED = 2
+THINNED = 3
+
+class CandidateSampler(object):
+    '''
+    Draws random candidate towers for a width x height coverage area in batches.
+
+    Attributes:
+        - self.width = Width of the coverage area.
+        - self.height = Height of the coverage area.
+        - self.batch_size = Number of candidates drawn per NumPy call.
+        - self.drawn = Number of candidates drawn up to and including the last
+            one handed out.
+        - self.outside = Number of those that were thrown out for not being
+            inside the coverage area.
+        - self.covered = Number of those that were thrown out for being entirely
+            covered already.
+        - self.thinned = Number of those that were thrown out to keep the
+            candidates evenly spread (only by FreeSpaceSampler).
+
+    Methods:
+        - __iter__(): Returns a generator of candidate towers.
+
+    Each candidate is drawn the same way the simulators always have: a lower
+    left corner (x,y) with x from 0 to width-1 and y from 0 to height-1, and a
+    width and height from 1 up to the width and height of the coverage area. A
+    batch of x's, y's, widths and heights is drawn with one NumPy call each, in
+    that order, so a batch_size of 1 draws exactly the same towers as drawing
+    one candidate at a time.
+
+    Candidates that stick out of the coverage area are thrown out for the whole
+    batch at once with array comparisons. When an occupancy grid is given,
+    candidates whose cells are all covered are thrown out too, by looking them
+    up in the grid's summed-area table as arrays. Coverage only ever grows, so
+    a candidate that was covered when its batch was drawn is still covered when
+    it would have been tried, and throwing it out early does not change which
+    towers get placed. Candidates that were covered by towers placed after
+    their batch was drawn are thrown out too, just before they would be handed
+    out. Only the candidates that are left are made into tower objects.
+
+    e.g.
+    >>> np.random.seed(2)
+    >>> sampler = CandidateSampler(10,10,batch_size = 256)
+    >>> candidates = iter(sampler)
+    >>> next(candidates)
+    tower((6, 2),4,7)
+    >>> sampler.drawn, sampler.outside
+    (3, 2)
+    '''
+
+    def __init__(self,width,height,batch_size = 1024,rng = None,grid = None):
+        '''
+        Creates a sampler for a width x height coverage area.
+
+        Parameter: width
+        Type: int
+
+        Parameter: height
+        Type: int
+
+        Parameter: batch_size
+        Type: int
+
+        Parameter: rng
+        Type: numpy.random.RandomState or None. If None, numpy's global random
+                state (np.random) is used, so np.random.seed() applies.
+
+        Parameter: grid
+        Type: OccupancyGrid of the placed towers, or None.
+
+        Assertions:
+            - width, height and batch_size must be positive integers.
+        '''
+        assert isinstance(width,int) and width > 0, 'Warning! Width must be a positive integer!'
+        assert isinstance(height,int) and height > 0, 'Warning! Height must be a positive integer!'
+        assert isinstance(batch_size,int) and batch_size > 0, 'Warning! batch_size must be a positive integer!'
+        if rng is None:
+            rng = np.random
+        self.width = width
+        self.height = height
+        self.batch_size = batch_size
+        self.rng = rng
+        self.grid = grid
+        self.drawn = 0
+        self.outside = 0
+        self.covered = 0
+        self.thinned = 0
+
+    def _covered(self,xs,ys,x1s,y1s):
+        '''
+        Returns the number of covered cells under each candidate, looked up in
+        the grid's summed-area table. The candidates must be inside the area.
+        '''
+        table = self.grid.table
+        return table[y1s,x1s] - table[ys,x1s] - table[y1s,xs] + table[ys,xs]
+
+    def _draw(self,size):
+        '''
+        Draws a batch of size candidates.
+
+        Return: (xs,ys,ws,hs,reasons), where reasons is an array holding KEEP
+                for the candidates to hand out and the reason the others are
+                thrown out (OUTSIDE or COVERED).
+        '''
+        width = self.width
+        height = self.height
+        rng = self.rng
+        xs = rng.randint(width,size = size)
+        ys = rng.randint(height,size = size)
+        ws = rng.randint(1,width+1,size = size) #Have to be careful about half-open interval
+        hs = rng.randint(1,height+1,size = size)
+
+        x1s = xs + ws
+        y1s = ys + hs
+        inside = (x1s <= width) & (y1s <= height)
+        reasons = np.where(inside,KEEP,OUTSIDE).astype(np.int8)
+        if self.grid is not None:
+            covered = self._covered(xs,ys,np.minimum(x1s,width),np.minimum(y1s,height))
+            reasons[inside & (covered == ws * hs)] = COVERED
+        return xs, ys, ws, hs, reasons
+
+    def __iter__(self):
+        '''
+        Returns a generator that hands out candidate towers forever.
+        '''
+        grid = self.grid
+        while True:
+            xs,ys,ws,hs,reasons = self._draw(self.batch_size)
+            drawn_at = None
+            if grid is not None:
+                drawn_at = grid.covered_area
+                table = grid.table
+
+            start = self.drawn
+            before = (self.outside,self.covered,self.thinned)
+            stale = 0
+            counts = [np.cumsum(reasons == reason) for reason in (OUTSIDE,COVERED,THINNED)]
+            positions = np.flatnonzero(reasons == KEEP)
+            rows = zip(positions.tolist(),xs[positions].tolist(),ys[positions].tolist(),
+                       ws[positions].tolist(),hs[positions].tolist(),
+                       *[count[positions].tolist() for count in counts])
+            for position,x,y,w,h,outside,covered,thinned in rows:
+                #Towers placed since the batch was drawn may have covered it.
+                if (drawn_at is not None) and (grid.covered_area != drawn_at):
+                    if table[y+h,x+w] - table[y,x+w] - table[y+h,x] + table[y,x] == w * h:
+                        stale += 1
+                        continue
+                self.drawn = start + position + 1
+                self.outside = before[0] + outside
+                self.covered = before[1] + covered + stale
+                self.thinned = before[2] + thinned
+                yield _trusted(x,y,w,h)
+
+            self.drawn = start + len(reasons)
+            self.outside = before[0] + int(counts[0][-1])
+            self.covered = before[1] + int(counts[1][-1]) + stale
+            self.thinned = before[2] + int(counts[2][-1])
+
+class FreeSpaceSampler(CandidateSampler):
+    '''
+    Draws random candidate towers that touch at least one uncovered cell.
+
+    Attributes: same as CandidateSampler, plus
+        - self.mode = 'uniform' or 'free', how the last batch was drawn.
+
+    Methods:
+        - __iter__(): Returns a generator of candidate towers.
+
+    Near full coverage, almost every candidate CandidateSampler draws is
+    already covered and gets thrown out. This sampler instead starts from the
+    uncovered cells of the occupancy grid, so it keeps finding useful
+    candidates no matter how little room is left.
+
+    The candidates it hands out are spread exactly like CandidateSampler's:
+    every rectangle inside the coverage area that is not entirely covered is
+    equally likely. So the number of towers a simulation needs has the same
+    distribution with either sampler and averages can be compared directly.
+    Only the number of candidates drawn (and so the attempts) differ. This is
+    how it works:
+
+        1. An uncovered cell c is picked, with a weight equal to the number of
+           rectangles in the coverage area that contain c. For a cell at
+           (cx,cy) that is (cx+1)*(width-cx)*(cy+1)*(height-cy).
+        2. One of the rectangles containing c is picked evenly, by picking its
+           left wall from 0 to cx, its right wall from cx+1 to width, and the
+           same for the bottom and top walls.
+        3. The rectangle is kept with probability 1/k, where k is the number
+           of uncovered cells in it.
+
+    A rectangle R with k uncovered cells can be reached through any of them, and
+    through each with probability weight(c) * 1/weight(c), so it comes out of
+    step 2 with probability proportional to k. Step 3 evens that out, so every
+    rectangle with at least one uncovered cell is kept equally often.
+
+    While most of the area is still uncovered, the rectangles are big, k is
+    big, and most of them are thrown out in step 3. So each batch is drawn
+    the way that needs fewer draws per candidate kept: like CandidateSampler
+    while the sum of the weights of the uncovered cells is at least the
+    number of ways to draw a candidate (width*height*width*height), and as
+    above once it falls below that. Both ways keep the same rectangles equally
+    often, so switching between them does not change anything either.
+
+    e.g.
+    >>> grid = OccupancyGrid(10,10)
+    >>> grid.add(tower((0,0),10,9))
+    90
+    >>> sampler = FreeSpaceSampler(10,10,rng = np.random.RandomState(0),grid = grid)
+    >>> t = next(iter(sampler))
+    >>> grid.is_covered(t), sampler.mode
+    (False, 'free')
+    '''
+
+    def __init__(self,width,height,batch_size = 1024,rng = None,grid = None):
+        '''
+        Creates a sampler for a width x height coverage area.
+
+        Parameters: same as CandidateSampler.
+
+        Assertions:
+            - grid must be an OccupancyGrid of a width x height region.
+        '''
+        CandidateSampler.__init__(self,width,height,batch_size,rng,grid)
+        assert grid is not None, 'Warning! FreeSpaceSampler needs an occupancy grid!'
+        assert (grid.width,grid.height) == (width,height), 'Warning! grid must be for the same coverage area!'
+        self.mode = 'uniform'
+        columns = np.arange(width,dtype = np.float64)
+        rows = np.arange(height,dtype = np.float64)
+        self._weights = np.outer((rows + 1) * (height - rows),(columns + 1) * (width - columns)).ravel()
+        self._uniform_draws = float(width * height) ** 2
+        self._free_for = None
+
+    def _update_free_cells(self):
+        '''
+        Refreshes the uncovered cells and their running weights, if the grid
+        has changed since they were last worked out.
+        '''
+        if self._free_for == self.grid.covered_area:
+            return
+        self._free_for = self.grid.covered_area
+        self._free = np.flatnonzero(~self.grid.cells.ravel())
+        self._cumulative = np.cumsum(self._weights[self._free])
+
+    def _draw(self,size):
+        '''
+        Draws a batch of size candidates. See CandidateSampler._draw().
+        '''
+        self._update_free_cells()
+        if (len(self._free) == 0) or (self._cumulative[-1] >= self._uniform_draws):
+            self.mode = 'uniform'
+            return CandidateSampler._draw(self,size)
+        self.mode = 'free'
+
+        width = self.width
+        height = self.height
+        rng = self.rng
+        cumulative = self._cumulative
+        picks = np.searchsorted(cumulative,rng.random_sample(size) * cumulative[-1],side = 'right')
+        cells = self._free[np.minimum(picks,len(cumulative) - 1)]
+        cx = cells % width
+        cy = cells // width
+        #randint() only takes a single range, so the walls are picked by
+        #scaling uniform numbers in [0,1) to each cell's range.
+        xs = (rng.random_sample(size) * (cx + 1)).astype(np.int64)
+        x1s = cx + 1 + (rng.random_sample(size) * (width - cx)).astype(np.int64)
+        ys = (rng.random_sample(size) * (cy + 1)).astype(np.int64)
+        y1s = cy + 1 + (rng.random_sample(size) * (height - cy)).astype(np.int64)
+        ws = x1s - xs
+        hs = y1s - ys
+
+        free = ws * hs - self._covered(xs,ys,x1s,y1s)
+        kept = rng.random_sample(size) * free < 1
+        reasons = np.where(kept,KEEP,THINNED).astype(np.int8)
+        return xs, ys, ws, hs, reasons
+
+#Samplers the simulators can be asked to use by name.
+SAMPLER_TYPES = {'uniform': CandidateSampler, 'free': FreeSpaceSampler}
+
+def make_sampler(kind,width,height,batch_size = 1024,rng = None,grid = None):
+    '''
+    Returns a new candidate sampler for a width x height coverage area.
+
+    Parameter: kind
+    Type: str, a key of SAMPLER_TYPES ('uniform' or 'free').
+
+    The other parameters are the same as for CandidateSampler.
+
+    Return: a sampler object whose iterator hands out candidate towers.
+
+    Assertions:
+        - kind must be a key of SAMPLER_TYPES.
+    '''
+    assert kind in SAMPLER_TYPES, 'Warning! Sampler must be one of %s!' % sorted(SAMPLER_TYPES)
+    return SAMPLER_TYPES[kind](width,height,batch_size,rng,grid)
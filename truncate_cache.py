@@ -0,0 +1,179 @@
+#Author: Humberto Hernandez
+#Last Updated: 10/18/2026
+from collections import OrderedDict
+from tower_class import tower, _trusted
+
+#Ways of picking which entry to throw out when the cache is full.
+EVICTION_POLICIES = ('lru','fifo')
+
+class TruncateCache(object):
+    '''
+    Remembers the results of tower.truncate(), so a tower truncated against the
+    same towers again gets the answer straight away.
+
+    Attributes:
+        - self.max_entries = Largest number of results kept.
+        - self.eviction = 'lru' to throw out the result used longest ago when
+            the cache is full, or 'fifo' to throw out the one stored longest ago.
+        - self.hits = Number of truncations answered from the cache.
+        - self.misses = Number of truncations that had to be worked out.
+        - self.evictions = Number of results thrown out to make room.
+
+    Methods:
+        - truncate(): Same as tower.truncate(), using the cache.
+        - key(): Returns the cache key of a truncation.
+        - stats(): Returns the hit, miss and eviction counts.
+        - clear(): Empties the cache and zeroes the counts.
+
+    The result of truncating t only depends on t's width and height and on
+    where the blocking towers cut into t. So the key is t's width and height
+    together with the blocking towers clipped to t, measured from t's lower
+    left corner, sorted and without repeats. Blocking towers that do not
+    overlap t, the order of the list and where t sits in the coverage area
+    make no difference, and a result worked out for one position is used for
+    every other position with the same blocking towers around it. Results are
+    stored the same way, relative to t's lower left corner.
+
+    e.g.
+    >>> cache = TruncateCache(max_entries = 1000)
+    >>> cache.truncate(tower((1,1),2,2),[tower((0,0),2,2)])
+    tower((2, 1),1,2)
+    >>> cache.truncate(tower((5,5),2,2),[tower((4,4),2,2),tower((9,9),1,1)])
+    tower((6, 5),1,2)
+    >>> cache.stats()
+    {'hits': 1, 'evictions': 0, 'hit_rate': 0.5, 'misses': 1, 'entries': 1}
+    '''
+
+    def __init__(self,max_entries = 4096,eviction = 'lru'):
+        '''
+        Creates an empty cache.
+
+        Parameter: max_entries
+        Type: int
+
+        Parameter: eviction
+        Type: str, one of EVICTION_POLICIES.
+
+        Assertions:
+            - max_entries must be a positive integer.
+            - eviction must be one of EVICTION_POLICIES.
+        '''
+        assert isinstance(max_entries,int) and max_entries > 0, 'Warning! max_entries must be a positive integer!'
+        assert eviction in EVICTION_POLICIES, 'Warning! eviction must be one of %s!' % (EVICTION_POLICIES,)
+        self.max_entries = max_entries
+        self.eviction = eviction
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self,t,other):
+        '''
+        Returns the cache key for truncating t against the list of towers other.
+
+        Parameter: t
+        Type: tower object
+
+        Parameter: other
+        Type: list of tower objects
+
+        Return: tuple (width,height,blocking), where blocking is a sorted tuple
+                of the (x0,y0,x1,y1) bounds of the towers in other clipped to t
+                and measured from t's lower left corner.
+        '''
+        x0 = t.x0
+        y0 = t.y0
+        width = t.width
+        height = t.height
+        clipped = set()
+        for o in other:
+            bx0 = max(o.x0 - x0,0)
+            by0 = max(o.y0 - y0,0)
+            bx1 = min(o.x1 - x0,width)
+            by1 = min(o.y1 - y0,height)
+            if (bx1 > bx0) and (by1 > by0):
+                clipped.add((bx0,by0,bx1,by1))
+        return (width,height,tuple(sorted(clipped)))
+
+    def truncate(self,t,other,metrics = None):
+        '''
+        Returns the same tower as t.truncate(other), from the cache if it can.
+
+        Parameter: t
+        Type: tower object
+
+        Parameter: other
+        Type: list of tower objects
+
+        Parameter: metrics
+        Type: SimulationMetrics or None, passed on to tower.truncate() when the
+                result has to be worked out.
+
+        Return: tower object or None, see tower.truncate().
+
+        Assertions:
+            - t must be a tower object.
+            - other must be a list.
+        '''
+        assert isinstance(t,tower), 'Warning! Requires an instance of tower class!'
+        assert isinstance(other,list), 'Warning! Argument must be type list!'
+        key = self.key(t,other)
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            result = entries[key]
+            if self.eviction == 'lru':
+                #OrderedDict has no move_to_end() in Python 2, so reinsert it.
+                del entries[key]
+                entries[key] = result
+        else:
+            self.misses += 1
+            truncated = t.truncate(other,metrics)
+            result = None
+            if truncated is not None:
+                result = (truncated.x0 - t.x0,truncated.y0 - t.y0,truncated.width,truncated.height)
+            if len(entries) >= self.max_entries:
+                entries.popitem(last = False)
+                self.evictions += 1
+            entries[key] = result
+
+        if result is None:
+            return None
+        if (result[2],result[3]) == (t.width,t.height):
+            return t
+        return _trusted(t.x0 + result[0],t.y0 + result[1],result[2],result[3])
+
+    def stats(self):
+        '''
+        Returns a dict with the 'hits', 'misses' and 'evictions' counts, the
+        number of 'entries' stored and the 'hit_rate', the fraction of
+        truncations answered from the cache.
+        '''
+        lookups = self.hits + self.misses
+        hit_rate = 0.0
+        if lookups > 0:
+            hit_rate = self.hits / float(lookups)
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'hit_rate': hit_rate}
+
+    def add_stats(self,stats):
+        '''
+        Adds the hit, miss and eviction counts of stats, a dict returned by
+        stats(), to this cache's counts. Used to count the lookups of copies of
+        the cache in worker processes.
+        '''
+        self.hits += stats['hits']
+        self.misses += stats['misses']
+        self.evictions += stats['evictions']
+
+    def clear(self):
+        '''
+        Empties the cache and sets the counts back to zero.
+        '''
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0